@@ -130,10 +130,14 @@ def main():
         files_section=files_section,
         timestamp=timestamp
     )
-    payload = msg.to_message().to_dict()
+    payload = msg.to_message().to_bytes()
 
 
-    response = requests.post('https://slack.com/api/chat.postMessage', headers=headers, json=payload)
+    response = requests.post(
+        'https://slack.com/api/chat.postMessage',
+        headers={**headers, 'Content-Type': 'application/json; charset=utf-8'},
+        data=payload,
+    )
 
     if response.status_code == 200 and response.json().get('ok'):
         print('✅ Summary message posted successfully')
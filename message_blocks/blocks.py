@@ -1,7 +1,10 @@
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional, Union, Dict, Any
 from pydantic import BaseModel
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ### START: TextType ###
 """
@@ -393,6 +396,50 @@ class Attachment(BaseModel):
     attachment_type: Optional[str] = None
 ### END: Attachment ###
 
+### START: SlackTransport ###
+"""
+Slack Transport
+===============
+Purpose: Shared HTTP plumbing for posting messages to the Slack Web API
+Features:
+- One keep-alive session, so repeated posts reuse the TLS connection
+- Retries with exponential backoff on rate limits and connection failures only, since
+  chat.postMessage is not idempotent and a retried 5xx could post the message twice
+Usage: Used by Message.send
+"""
+SLACK_POST_MESSAGE_URL = "https://slack.com/api/chat.postMessage"
+
+
+class _RateLimitRetry(Retry):
+    """Retry policy that retries status codes from status_forcelist only.
+
+    Plain Retry also retries 413 and 503 responses that carry Retry-After.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        return status_code in self.status_forcelist and super().is_retry(method, status_code, has_retry_after)
+
+
+_SLACK_RETRY = _RateLimitRetry(
+    total=3,
+    backoff_factor=0.5,
+    read=0,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+@lru_cache(maxsize=1)
+def _slack_session() -> requests.Session:
+    """Process-wide Slack session, created on first use."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=_SLACK_RETRY))
+    return session
+
+### END: SlackTransport ###
+
 ### START: Message ###
 """
 Message Class
@@ -421,6 +468,7 @@ Attributes:
 Methods:
 - to_dict(): Convert to dictionary for JSON
 - to_json(): Convert to formatted JSON string
+- to_bytes(): Compact UTF-8 JSON request body
 - send(token): Post message to Slack API
 """
 class Message(BaseModel):
@@ -447,14 +495,17 @@ class Message(BaseModel):
         """Convert to JSON"""
         return self.model_dump_json(exclude_none=True, indent=2)
 
+    def to_bytes(self) -> bytes:
+        """Compact JSON body, encoded by pydantic-core without an intermediate dict or str."""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
     def send(self, token: str) -> int:
 
         """Send the message to the appropriate channel."""
-        msg = self.model_dump(exclude_none=True)
         headers = {
-            "Content-Type": "application/json",
+            "Content-Type": "application/json; charset=utf-8",
             "Authorization": f"Bearer {token}",
         }
-        response = requests.post('https://slack.com/api/chat.postMessage', headers=headers, json=msg)
+        response = _slack_session().post(SLACK_POST_MESSAGE_URL, headers=headers, data=self.to_bytes())
         return response.status_code
-### END: Message ###
\ No newline at end of file
+### END: Message ###
@@ -1,7 +1,7 @@
 import abc
 from abc import abstractmethod
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from message_blocks.blocks import (
     Message,
@@ -21,6 +21,8 @@ from message_blocks.blocks import (
 # ============================================================================
 
 class MessageModel(BaseModel, abc.ABC):
+    # Build each subclass's validator on first instantiation rather than at import
+    model_config = ConfigDict(defer_build=True)
 
     @abstractmethod
     def to_message(self) -> Message:
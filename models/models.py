@@ -1,15 +1,107 @@
 import abc
-
-from pydantic import BaseModel
-from typing import Union, List, Dict
-
-from models.messages import Message
+import binascii
+import csv
+import functools
+import io
+import json
+import os
+import re
+import string
+from collections import ChainMap
+from itertools import chain, repeat
+from types import MappingProxyType
+
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Union, List, Dict, Optional, Callable, ClassVar, FrozenSet, Iterator, Literal, Mapping, Sequence, Tuple
+
+from models.messages import (
+    Message,
+    HeaderBlock,
+    SectionBlock,
+    MarkdownTextObject,
+    PlainTextObject,
+    ActionsBlock,
+    ButtonElement,
+    ButtonStyle,
+    PostIncidentAlertMessage,
+    InvestigationProgressMessage,
+)
 
 
 # ============================================================================
 # BASE MODEL CLASSES
 # ============================================================================
 
+### START: CachedRenderModel ###
+"""
+Cached Render Base Class
+========================
+Purpose: Shared base that lets render methods memoize their output per instance
+Features:
+- cached_render decorator for zero-argument render methods (get_command, ...)
+- shared_render variant that also shares output between equal instances
+- Results stored in the instance __dict__, like functools.cached_property,
+  so they are ignored by ==, repr and model_dump
+- Cached output is dropped on model_copy so updated copies re-render
+Use Case: Models whose commands are rendered more than once (logging, dry-run, execution)
+"""
+_RENDER_CACHE = "__rendered__"
+
+
+def cached_render(method: Callable) -> Callable:
+    """Memoize the no-argument call of a render method; use on frozen models.
+
+    Calls that pass arguments (e.g. get_message overrides) bypass the cache.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if args or kwargs:
+            return method(self, *args, **kwargs)
+        cache = self.__dict__.setdefault(_RENDER_CACHE, {})
+        if name not in cache:
+            cache[name] = method(self)
+        return cache[name]
+    return wrapper
+
+
+def shared_render(method: Callable) -> Callable:
+    """cached_render backed by a module-level LRU keyed on (model class, field values).
+
+    Equal short-lived instances then render once between them. Every field of
+    the model must be hashable (use tuples rather than lists).
+    """
+    name = method.__name__
+
+    @functools.lru_cache(maxsize=256)
+    def render(cls: type, fields: tuple) -> str:
+        return method(cls.model_construct(**dict(fields)))
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if args or kwargs:
+            return method(self, *args, **kwargs)
+        cache = self.__dict__.setdefault(_RENDER_CACHE, {})
+        if name not in cache:
+            cache[name] = render(type(self), tuple(self))
+        return cache[name]
+    return wrapper
+
+
+class CachedRenderModel(BaseModel):
+    """Base model that keeps cached_render output consistent across copies."""
+    # Build each subclass's validator on first instantiation rather than at import
+    model_config = ConfigDict(defer_build=True)
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop(_RENDER_CACHE, None)
+        return copied
+### END: CachedRenderModel ###
+
+
+
 ### START: CommandModel ###
 """
 Command Model Base Class
@@ -22,17 +114,67 @@ Features:
 - Type-safe command generation using Pydantic
 Use Case: Base class for all models that generate shell commands
 """
-class CommandModel(BaseModel, abc.ABC):
+class CommandModel(CachedRenderModel, abc.ABC):
     """Base model for command generation."""
 
+    @classmethod
+    def from_trusted(cls, **kwargs):
+        """Build without validation for values that were already validated upstream."""
+        return cls.model_construct(**kwargs)
+
     @abc.abstractmethod
     def get_command(self) -> str:
         """Generate the command string."""
         pass
+
+    def get_command_bytes(self) -> bytes:
+        """UTF-8 encoded command, for callers that write the script to a pipe or file."""
+        return self.get_command().encode("utf-8")
+
+    def merge(self, other: "CommandModel") -> "MergedCommand":
+        """Run this command and then other in one shell; other only runs if this one succeeds."""
+        return CommandModel.batch([self, other])
+
+    @staticmethod
+    def batch(models: Sequence["CommandModel"]) -> "MergedCommand":
+        """Merge consecutive step commands into one script, so they run under a single bash invocation."""
+        scripts: List[str] = []
+        for model in models:
+            if isinstance(model, MergedCommand):
+                scripts.extend(model.scripts)
+            else:
+                scripts.append(model.get_command())
+        return MergedCommand(scripts=tuple(scripts))
 ### END: CommandModel ###
 
 
 
+### START: MergedCommand ###
+"""
+Merged Command Model
+====================
+Purpose: Run several rendered step scripts in one shell invocation
+Features:
+- Built with CommandModel.merge / CommandModel.batch
+- Each script runs in its own ( ) subshell, chained with &&
+- exit, set -e, traps, cd and variables stay local to the script that set them,
+  as they would in separate steps
+- A failing script stops the ones after it
+Use Case: Adjacent workflow steps that would otherwise each start their own bash
+"""
+class MergedCommand(CommandModel):
+    """Command model chaining already-rendered scripts."""
+    model_config = ConfigDict(frozen=True)
+
+    scripts: Tuple[str, ...]
+
+    @cached_render
+    def get_command(self) -> str:
+        return "(\n" + "\n) && (\n".join(self.scripts) + "\n)"
+### END: MergedCommand ###
+
+
+
 ### START: MessageModel ###
 """
 Message Model Base Class
@@ -47,6 +189,7 @@ Use Case: Base class for all models that generate Slack messages
 """
 class MessageModel(BaseModel, abc.ABC):
     """Base model for command generation."""
+    model_config = ConfigDict(defer_build=True)
 
     @abc.abstractmethod
     def get_message(self, **kwargs) -> Message:
@@ -70,6 +213,7 @@ Use Case: Base class for all models that generate AI prompts
 """
 class PromptModel(BaseModel, abc.ABC):
     """Base model for prompt generation."""
+    model_config = ConfigDict(defer_build=True)
 
     @abc.abstractmethod
     def get_prompt(self) -> None:
@@ -91,7 +235,7 @@ Features:
 - Type-safe file generation using Pydantic
 Use Case: Base class for all models that generate files
 """
-class FileModel(BaseModel, abc.ABC):
+class FileModel(CachedRenderModel, abc.ABC):
     """Base model for prompt generation."""
 
     @abc.abstractmethod
@@ -560,8 +704,6 @@ class PostIncidentAlert(CommandModel, MessageModel):
 
 
     def get_message(self, **kwargs) -> Message:
-        from models.messages import PostIncidentAlertMessage
-
         return PostIncidentAlertMessage(
             incident_title=self.incident_title,
             incident_id=self.incident_id,
@@ -618,7 +760,6 @@ class InvestigationProgress(CommandModel, MessageModel):
             echo "✅ Investigation progress notification posted to Slack"'''
 
     def get_message(self) -> Message:
-        from models.messages import InvestigationProgressMessage
         return InvestigationProgressMessage(
             channel=self.channel,
             incident_id=self.incident_id,
@@ -706,6 +847,35 @@ class InvestigateEUClusterHealth(CommandModel):
 # REPORT GENERATION MODELS
 # ============================================================================
 
+_CHARS_PER_TOKEN = 4  # rough average for English/markdown with cl100k-style tokenizers
+_CLEANED_RESULTS_TOKEN_BUDGET = 800
+
+
+def _truncate_to_tokens(text: str, max_tokens: int = _CLEANED_RESULTS_TOKEN_BUDGET) -> str:
+    """Cap text at roughly max_tokens tokens, ending with a truncation sentinel for the LLM.
+
+    Only values that carry the real text are capped. The workflows pass {{.cleaned_*}} placeholders,
+    which the runner substitutes after rendering, so those prompts are not bounded by this.
+    """
+    limit = max_tokens * _CHARS_PER_TOKEN
+    if not isinstance(text, str) or len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    kept = text[:cut if cut > limit // 2 else limit]
+    return f"{kept} [truncated ~{(len(text) - len(kept)) // _CHARS_PER_TOKEN} tokens]"
+
+
+def _canonical_services(value: Union[str, List[str]]) -> List[str]:
+    """Accept a comma-separated string or a list and return sorted, de-duplicated service names."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return sorted({service.strip() for service in value if service.strip()})
+
+
+# Shared by every model with an affected_services field
+_normalize_affected_services = field_validator("affected_services", mode="before")(_canonical_services)
+
+
 ### START: IncidentReport ###
 """
 Incident Report Generation Model
@@ -723,24 +893,23 @@ class IncidentReport(CommandModel):
     incident_id: str
     incident_title: str
     incident_severity: str
-    affected_services: str
+    affected_services: List[str]
     cleaned_na_results: str
     cleaned_eu_results: str
 
-    def get_command(self) -> str:
-        return f"""Create a comprehensive incident report based on the following investigation data:
+    _TEMPLATE: ClassVar[str] = """Create a comprehensive incident report based on the following investigation data:
             
             Incident Details:
-            - ID: {self.incident_id}
-            - Title: {self.incident_title}
-            - Severity: {self.incident_severity}
-            - Affected Services: {self.affected_services}
+            - ID: {incident_id}
+            - Title: {incident_title}
+            - Severity: {incident_severity}
+            - Affected Services: {affected_services}
             
             NA Cluster Investigation Results:
-            {self.cleaned_na_results}
+            {cleaned_na_results}
             
             EU Cluster Investigation Results:
-            {self.cleaned_eu_results}
+            {cleaned_eu_results}
             
             Please create an executive incident report that includes:
             1. Executive Summary (brief overview of the incident and findings)
@@ -752,6 +921,16 @@ class IncidentReport(CommandModel):
             7. Lessons Learned
             
             Format the report in clean markdown suitable for Slack display."""
+
+    _normalize_services = _normalize_affected_services
+
+    @field_validator("cleaned_na_results", "cleaned_eu_results", mode="before")
+    @classmethod
+    def _cap_results(cls, value: str) -> str:
+        return _truncate_to_tokens(value)
+
+    def get_command(self) -> str:
+        return self._TEMPLATE.format_map({**self.__dict__, "affected_services": ", ".join(self.affected_services)})
 ### END: IncidentReport ###
 
 
@@ -774,18 +953,17 @@ class ExecutiveSummary(CommandModel):
     incident_id: str
     incident_title: str
     incident_severity: str
-    affected_services: str
+    affected_services: List[str]
     formatted_incident_report: str
 
-    def get_command(self) -> str:
-        return f"""Create an executive summary based on the incident investigation.
+    _TEMPLATE: ClassVar[str] = """Create an executive summary based on the incident investigation.
             
-            Incident: {self.incident_id} - {self.incident_title}
-            Severity: {self.incident_severity}
-            Services: {self.affected_services}
+            Incident: {incident_id} - {incident_title}
+            Severity: {incident_severity}
+            Services: {affected_services}
             
             Full Incident Report:
-            {self.formatted_incident_report}
+            {formatted_incident_report}
             
             Please create a JSON response with this structure:
             {{
@@ -800,71 +978,96 @@ class ExecutiveSummary(CommandModel):
             }}
             
             Base your summary on the incident report provided above."""
+
+    _normalize_services = _normalize_affected_services
+
+    def get_command(self) -> str:
+        return self._TEMPLATE.format_map({**self.__dict__, "affected_services": ", ".join(self.affected_services)})
 ### END: ExecutiveSummary ###
 
 
 
-### START: CleanNAInvestigation ###
+# ANSI escapes plus whole lines of connection chatter, kubectl warnings and DEBUG log records
+_CLI_NOISE_RE = re.compile(
+    r"\x1b\[[0-9;]*[A-Za-z]"
+    r"|^(?:Connecting to |Warning: |\[\d{4}-\d{2}-\d{2}T[^\]]*\] DEBUG ).*(?:\n|$)",
+    re.MULTILINE,
+)
+
+
+def _strip_cli_noise(value: str) -> str:
+    """Drop CLI noise before the text is embedded in a prompt (placeholders pass through unchanged)."""
+    return _CLI_NOISE_RE.sub("", value) if isinstance(value, str) else value
+
+
+### START: CleanRegionalInvestigation ###
 """
-Clean NA Investigation Model
-============================
-Purpose: Clean and structure North America cluster investigation results
+Clean Regional Investigation Model
+==================================
+Purpose: Clean and structure regional (NA/EU) cluster investigation results
 Features:
 - Extract key findings from raw investigation data
 - Filter out CLI noise and connection messages
 - Structured summary with health status and recommendations
-- Focus on technical findings and actionable insights
-Use Case: Data processing workflows for NA cluster investigation results
+- One prompt body for every region, so the prefix cache is shared
+Use Case: Data processing workflows for NA and EU cluster investigation results
 """
-class CleanNAInvestigation(CommandModel):
-    """Model for cleaning NA cluster investigation results."""
-    na_cluster_results: str
+class CleanRegionalInvestigation(CommandModel):
+    """Model for cleaning regional cluster investigation results."""
+    region: Literal["NA", "EU"]
+    cluster_results: str
+
+    @field_validator("cluster_results", mode="before")
+    @classmethod
+    def _filter_noise(cls, value: str) -> str:
+        return _strip_cli_noise(value)
+
+    _TEMPLATE: ClassVar[str] = """Based on the {region} cluster investigation results below, please provide a clean summary of the key findings:
+
+            {cluster_results}:
 
-    def get_command(self) -> str:
-        return f"""Based on the NA cluster investigation results below, please provide a clean summary of the key findings:
-        
-            {self.na_cluster_results}:
-            
             Provide a structured summary with:
             - Key findings (3-5 bullet points)
             - Any issues or anomalies detected
             - Current cluster health status
             - Recommendations if any
-            
+
             Focus only on the technical findings, ignore any CLI output or connection messages."""
-### END: CleanNAInvestigation ###
+
+    def get_command(self) -> str:
+        return self._TEMPLATE.format_map(self.__dict__)
+### END: CleanRegionalInvestigation ###
 
 
 
-### START: CleanEUInvestigation ###
+### START: CleanInvestigationBatch ###
 """
-Clean EU Investigation Model
-============================
-Purpose: Clean and structure Europe cluster investigation results
+Clean Investigation Batch Model
+===============================
+Purpose: Pair the NA and EU clean prompts for concurrent dispatch
 Features:
-- Extract key findings from raw investigation data
-- Filter out CLI noise and connection messages
-- Structured summary with health status and recommendations
-- Focus on technical findings and actionable insights
-Use Case: Data processing workflows for EU cluster investigation results
-"""
-class CleanEUInvestigation(CommandModel):
-    """Model for cleaning NA cluster investigation results."""
+- Builds both regional clean prompts from one model
+- get_commands() returns independent prompts for parallel LLM calls
+- No single-prompt get_command(): the two regions are never merged into one prompt
+- Shares the regional prompt body so prefix caching applies to both regions
+Use Case: Orchestrators that fan out the NA/EU cleaning calls (e.g. asyncio.gather)
+"""
+class CleanInvestigationBatch(BaseModel):
+    """Model for cleaning NA and EU cluster investigation results together."""
+    na_cluster_results: str
     eu_cluster_results: str
 
-    def get_command(self) -> str:
-        return f"""Based on the EU cluster investigation results below, please provide a clean summary of the key findings:
-
-            {self.eu_cluster_results}:
-
-            Provide a structured summary with:
-            - Key findings (3-5 bullet points)
-            - Any issues or anomalies detected
-            - Current cluster health status
-            - Recommendations if any
+    @field_validator("na_cluster_results", "eu_cluster_results", mode="before")
+    @classmethod
+    def _filter_noise(cls, value: str) -> str:
+        return _strip_cli_noise(value)
 
-            Focus only on the technical findings, ignore any CLI output or connection messages."""
-### END: CleanEUInvestigation ###
+    def get_commands(self) -> List[str]:
+        return [
+            CleanRegionalInvestigation.from_trusted(region="NA", cluster_results=self.na_cluster_results).get_command(),
+            CleanRegionalInvestigation.from_trusted(region="EU", cluster_results=self.eu_cluster_results).get_command(),
+        ]
+### END: CleanInvestigationBatch ###
 
 
 
@@ -885,14 +1088,13 @@ class FormatSlackReports(CommandModel):
     cleaned_na_results: str
     cleaned_eu_results: str
 
-    def get_command(self) -> str:
-        return f"""I need you to create concise technical summaries for an incident report. Here's the investigation data:
+    _TEMPLATE: ClassVar[str] = """I need you to create concise technical summaries for an incident report. Here's the investigation data:
 
             ## NA Cluster Investigation Results:
-            {self.cleaned_na_results}
+            {cleaned_na_results}
             
             ## EU Cluster Investigation Results:
-            {self.cleaned_eu_results}
+            {cleaned_eu_results}
             
             Please create a cross-region summary that includes:
             1. North America (NA) Production - health status, critical issues, key metrics, recommendations
@@ -900,6 +1102,14 @@ class FormatSlackReports(CommandModel):
             3. Cross-Region Impact Analysis - dependencies, common issues, coordinated remediation approach
             
             Format as clean markdown with bullet points and clear headings."""
+
+    @field_validator("cleaned_na_results", "cleaned_eu_results", mode="before")
+    @classmethod
+    def _cap_results(cls, value: str) -> str:
+        return _truncate_to_tokens(value)
+
+    def get_command(self) -> str:
+        return self._TEMPLATE.format_map(self.__dict__)
 ### END: FormatSlackReports ###
 
 
@@ -921,7 +1131,13 @@ class InvestigationResults(CommandModel, FileModel):
     output_file: str
 
     def get_command(self) -> str:
-        return f"pip install --no-cache-dir requests && python {self.output_file}"
+        # Only hit PyPI when the shipped script imports requests and the runner image lacks it
+        return (
+            f"if grep -Eq '^[[:space:]]*(import|from)[[:space:]]+requests([^[:alnum:]_]|$)' {self.output_file}; then "
+            "python -c 'import requests' 2>/dev/null || "
+            "pip install --no-cache-dir --disable-pip-version-check -q requests; fi && "
+            f"python {self.output_file}"
+        )
 
     def get_files(self) -> List[Dict[str, str]]:
         # Read the input_file content as a string
@@ -951,34 +1167,7 @@ Features:
 - Compression and encryption options
 Use Case: Database administration workflows requiring automated backups
 """
-class DatabaseBackupCommand(CommandModel):
-    """Model for database backup command generation."""
-    database_type: str  # "postgresql", "mysql", "mongodb"
-    database_name: str
-    backup_location: str
-    retention_days: int = 30
-    compress: bool = True
-    encrypt: bool = False
-    
-    def get_command(self) -> str:
-        compression_flag = "--compress" if self.compress else ""
-        encryption_flag = "--encrypt" if self.encrypt else ""
-        
-        if self.database_type == "postgresql":
-            return f"""echo "🗄️ STARTING POSTGRESQL BACKUP"
-echo "Database: {self.database_name}"
-echo "Location: {self.backup_location}"
-
-# Create backup directory if it doesn't exist
-mkdir -p "{self.backup_location}"
-
-TIMESTAMP=$(date +%Y%m%d_%H%M%S)
-BACKUP_FILE="{self.backup_location}/{self.database_name}_${{TIMESTAMP}}.sql"
-echo "📝 Creating demo backup file (pg_dump simulation)..."
-
-# Create a mock backup file for demonstration
-cat << 'EOF' > "$BACKUP_FILE"
--- PostgreSQL database dump
+_PG_DUMP = """-- PostgreSQL database dump
 -- Dumped from database version 13.7
 -- Dumped by pg_dump version 13.7
 
@@ -998,33 +1187,10 @@ INSERT INTO users (username, email) VALUES
 ('demo_user1', 'user1@example.com'),
 ('demo_user2', 'user2@example.com');
 
--- End of dump
-EOF
-                if [ $? -eq 0 ]; then
-                    echo "✅ PostgreSQL backup completed: $BACKUP_FILE"
-                    echo "📊 Backup size: $(du -h "$BACKUP_FILE" | cut -f1)"
-                    find {self.backup_location} -name "{self.database_name}_*.sql" -mtime +{self.retention_days} -delete 2>/dev/null || true
-                    echo "🗑️ Cleaned up backups older than {self.retention_days} days"
-                else
-                    echo "❌ PostgreSQL backup failed"
-                    exit 1
-                fi"""
-        elif self.database_type == "mysql":
-            return f"""echo "🗄️ STARTING MYSQL BACKUP"
-echo "Database: {self.database_name}"
-echo "Location: {self.backup_location}"
-
-# Create backup directory if it doesn't exist
-mkdir -p "{self.backup_location}"
-
-TIMESTAMP=$(date +%Y%m%d_%H%M%S)
-BACKUP_FILE="{self.backup_location}/{self.database_name}_${{TIMESTAMP}}.sql"
-echo "📝 Creating demo backup file (mysqldump simulation)..."
+-- End of dump"""
 
-# Create a mock backup file for demonstration
-cat << 'EOF' > "$BACKUP_FILE"
--- MySQL dump 10.13  Distrib 8.0.27, for Linux (x86_64)
--- Host: localhost    Database: {self.database_name}
+_MYSQL_DUMP = """-- MySQL dump 10.13  Distrib 8.0.27, for Linux (x86_64)
+-- Host: localhost    Database: {database_name}
 -- Server version	8.0.27
 
 /*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;
@@ -1045,33 +1211,10 @@ INSERT INTO `users` VALUES
 (1,'demo_user1','user1@example.com','2024-01-01 10:00:00'),
 (2,'demo_user2','user2@example.com','2024-01-01 10:01:00');
 
--- Dump completed
-EOF
-                if [ $? -eq 0 ]; then
-                    echo "✅ MySQL backup completed: $BACKUP_FILE"
-                    echo "📊 Backup size: $(du -h "$BACKUP_FILE" | cut -f1)"
-                    find {self.backup_location} -name "{self.database_name}_*.sql" -mtime +{self.retention_days} -delete 2>/dev/null || true
-                    echo "🗑️ Cleaned up backups older than {self.retention_days} days"
-                else
-                    echo "❌ MySQL backup failed"
-                    exit 1
-                fi"""
-        else:
-            return f"""echo "🗄️ STARTING {self.database_type.upper()} BACKUP"
-echo "Database: {self.database_name}"
-echo "Location: {self.backup_location}"
-
-# Create backup directory if it doesn't exist
-mkdir -p "{self.backup_location}"
-
-TIMESTAMP=$(date +%Y%m%d_%H%M%S)
-BACKUP_FILE="{self.backup_location}/{self.database_name}_${{TIMESTAMP}}.sql"
-echo "📝 Creating demo backup file for {self.database_type}..."
+-- Dump completed"""
 
-# Create a generic mock backup file
-cat << 'EOF' > "$BACKUP_FILE"
--- Database backup for {self.database_name}
--- Database type: {self.database_type}
+_GENERIC_DUMP = """-- Database backup for {database_name}
+-- Database type: {database_type}
 -- Generated on: $(date)
 
 -- Demo data structure
@@ -1086,16 +1229,114 @@ INSERT INTO demo_table VALUES
 (1, 'sample_record_1', 'Sample data for testing', NOW()),
 (2, 'sample_record_2', 'Another test record', NOW());
 
--- End of backup
+-- End of backup"""
+
+_DB_BACKUP_SCAFFOLD = """echo "🗄️ STARTING {title} BACKUP"
+echo "Database: {database_name}"
+echo "Location: {backup_location}"
+
+# Create backup directory if it doesn't exist
+mkdir -p "{backup_location}"
+
+TIMESTAMP=$(date +%Y%m%d_%H%M%S)
+BACKUP_FILE="{backup_location}/{database_name}_${{TIMESTAMP}}.sql"
+echo "📝 Creating demo backup file {simulation}..."
+
+# Create a {mock_kind} backup file{mock_suffix}
+cat << 'EOF' > "$BACKUP_FILE"
+{dump_body}
 EOF
                 if [ $? -eq 0 ]; then
-                    echo "✅ Backup operation completed for {self.database_type}: $BACKUP_FILE"
+                    echo "✅ {done_message}: $BACKUP_FILE"
                     echo "📊 Backup size: $(du -h "$BACKUP_FILE" | cut -f1)"
-                    echo "🗑️ Retention policy: {self.retention_days} days"
+{retention}
                 else
-                    echo "❌ Backup failed"
+                    echo "❌ {failed_message}"
                     exit 1
                 fi"""
+
+_DB_BACKUP_CLEANUP = (
+    '                    find {backup_location} -name "{database_name}_*.sql" -mtime +{retention_days} -delete 2>/dev/null || true\n'
+    '                    echo "🗑️ Cleaned up backups older than {retention_days} days"'
+)
+
+_DB_BACKUP_RETENTION_NOTE = '                    echo "🗑️ Retention policy: {retention_days} days"'
+
+class DatabaseBackupCommand(CommandModel):
+    """Model for database backup command generation."""
+    model_config = ConfigDict(frozen=True)
+
+    database_type: str  # "postgresql", "mysql", "mongodb"
+    database_name: str
+    backup_location: str
+    retention_days: int = 30
+    compress: bool = True
+    encrypt: bool = False
+
+    # Engine-specific pieces of the shared scaffold; other engines use _GENERIC_PROFILE
+    _DUMPS: ClassVar[Dict[str, Dict[str, str]]] = {
+        "postgresql": {
+            "title": "POSTGRESQL",
+            "simulation": "(pg_dump simulation)",
+            "dump_body": _PG_DUMP,
+            "done_message": "PostgreSQL backup completed",
+            "failed_message": "PostgreSQL backup failed",
+        },
+        "mysql": {
+            "title": "MYSQL",
+            "simulation": "(mysqldump simulation)",
+            "dump_body": _MYSQL_DUMP,
+            "done_message": "MySQL backup completed",
+            "failed_message": "MySQL backup failed",
+        },
+    }
+    _GENERIC_PROFILE: ClassVar[Dict[str, str]] = {
+        "title": "{DATABASE_TYPE}",
+        "simulation": "for {database_type}",
+        "dump_body": _GENERIC_DUMP,
+        "done_message": "Backup operation completed for {database_type}",
+        "failed_message": "Backup failed",
+    }
+
+    @cached_render
+    def get_command(self) -> str:
+        return self._render(self.database_type, self.database_name, self.backup_location, self.retention_days)
+
+    @classmethod
+    def batch_get_command(cls, columns: Dict[str, List]) -> List[str]:
+        """Render one backup command per row from column-oriented inputs without building models.
+
+        ``columns`` maps field names to equal-length lists (a length mismatch raises ValueError);
+        ``retention_days`` may be omitted to use the field default. Inputs are not validated.
+        """
+        retention = columns.get("retention_days")
+        if retention is None:
+            retention = [cls.model_fields["retention_days"].default] * len(columns["database_name"])
+        return [
+            cls._render(database_type, database_name, backup_location, retention_days)
+            for database_type, database_name, backup_location, retention_days in zip(
+                columns["database_type"], columns["database_name"], columns["backup_location"], retention, strict=True
+            )
+        ]
+
+    @classmethod
+    def _render(cls, database_type: str, database_name: str, backup_location: str, retention_days: int) -> str:
+        fields = {
+            "database_type": database_type,
+            "DATABASE_TYPE": database_type.upper(),
+            "database_name": database_name,
+            "backup_location": backup_location,
+            "retention_days": retention_days,
+        }
+        known = database_type in cls._DUMPS
+        profile = cls._DUMPS.get(database_type, cls._GENERIC_PROFILE)
+        return _DB_BACKUP_SCAFFOLD.format_map({
+            **fields,
+            **{key: value.format_map(fields) for key, value in profile.items()},
+            "mock_kind": "mock" if known else "generic mock",
+            "mock_suffix": " for demonstration" if known else "",
+            "retention": (_DB_BACKUP_CLEANUP if known else _DB_BACKUP_RETENTION_NOTE).format_map(fields),
+        })
 ### END: DatabaseBackupCommand ###
 
 
@@ -1112,71 +1353,96 @@ Features:
 - Service connectivity validation
 Use Case: DevOps teams monitoring Kubernetes cluster health
 """
+NODE_STATUS_BLOB = """🔍 CHECKING NODE STATUS (Demo Mode)
+📝 Simulating kubectl get nodes -o wide...
+NAME                 STATUS   ROLES    AGE   VERSION   INTERNAL-IP     EXTERNAL-IP   OS-IMAGE             KERNEL-VERSION
+demo-worker-node-1   Ready    <none>   5d    v1.28.0   10.0.1.10       <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic
+demo-worker-node-2   Ready    <none>   5d    v1.28.0   10.0.1.11       <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic
+demo-master-node     Ready    master   5d    v1.28.0   10.0.1.5        <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic
+
+📊 Node resource usage (simulated):
+NAME                 CPU(cores)   CPU%   MEMORY(bytes)   MEMORY%
+demo-worker-node-1   250m         12%    1024Mi          32%
+demo-worker-node-2   180m         9%     890Mi           28%
+demo-master-node     150m         7%     756Mi           24%
+"""
+
+POD_BLOB = """🔍 CHECKING PODS IN NAMESPACE: {namespace} (Demo Mode)
+📝 Simulating kubectl get pods -n {namespace} -o wide...
+NAME                     READY   STATUS    RESTARTS   AGE   IP           NODE
+demo-app-1-abc123       1/1     Running   0          2d    10.244.1.10  demo-worker-node-1
+demo-app-2-def456       1/1     Running   0          2d    10.244.2.11  demo-worker-node-2
+demo-service-xyz789     1/1     Running   1          3d    10.244.1.12  demo-worker-node-1
+
+📊 Pod resource usage (simulated):
+NAME                     CPU(cores)   MEMORY(bytes)
+demo-app-1-abc123       50m          128Mi
+demo-app-2-def456       45m          110Mi
+demo-service-xyz789     30m          95Mi
+"""
+
+SVC_BLOB = """🔍 CHECKING SERVICES IN NAMESPACE: {namespace} (Demo Mode)
+📝 Simulating kubectl get services -n {namespace}...
+NAME           TYPE        CLUSTER-IP      EXTERNAL-IP   PORT(S)
+demo-service   ClusterIP   10.96.100.1     <none>        80/TCP
+demo-app-svc   NodePort    10.96.100.2     <none>        8080:30080/TCP
+
+📝 Simulating kubectl get endpoints -n {namespace}...
+NAME           ENDPOINTS
+demo-service   10.244.1.10:80,10.244.2.11:80
+demo-app-svc   10.244.1.12:8080
+"""
+
+EVT_BLOB = """🔍 CHECKING RECENT EVENTS IN NAMESPACE: {namespace} (Demo Mode)
+📝 Simulating kubectl get events -n {namespace}...
+LAST SEEN   TYPE     REASON    OBJECT                     MESSAGE
+2m          Normal   Pulling   pod/demo-app-1-abc123     Pulling image
+2m          Normal   Pulled    pod/demo-app-1-abc123     Successfully pulled image
+5m          Normal   Created   pod/demo-app-2-def456     Created container
+10m         Normal   Started   pod/demo-service-xyz789   Started container
+"""
+
 class KubernetesHealthCheckCommand(CommandModel):
     """Model for Kubernetes health check command generation."""
+    model_config = ConfigDict(frozen=True)
+
     namespace: str = "default"
     check_pods: bool = True
     check_services: bool = True
     check_nodes: bool = True
     check_events: bool = True
     
+    @cached_render
     def get_command(self) -> str:
-        checks = []
-        
-        if self.check_nodes:
-            checks.append("""echo "🔍 CHECKING NODE STATUS (Demo Mode)"
-                echo "📝 Simulating kubectl get nodes -o wide..."
-                echo "NAME                 STATUS   ROLES    AGE   VERSION   INTERNAL-IP     EXTERNAL-IP   OS-IMAGE             KERNEL-VERSION"
-                echo "demo-worker-node-1   Ready    <none>   5d    v1.28.0   10.0.1.10       <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic"
-                echo "demo-worker-node-2   Ready    <none>   5d    v1.28.0   10.0.1.11       <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic"
-                echo "demo-master-node     Ready    master   5d    v1.28.0   10.0.1.5        <none>        Ubuntu 20.04.3 LTS   5.4.0-80-generic"
-                echo ""
-                echo "📊 Node resource usage (simulated):"
-                echo "NAME                 CPU(cores)   CPU%   MEMORY(bytes)   MEMORY%"
-                echo "demo-worker-node-1   250m         12%    1024Mi          32%"
-                echo "demo-worker-node-2   180m         9%     890Mi           28%"
-                echo "demo-master-node     150m         7%     756Mi           24%" """)
-        
-        if self.check_pods:
-            checks.append(f"""echo "🔍 CHECKING PODS IN NAMESPACE: {self.namespace} (Demo Mode)"
-                echo "📝 Simulating kubectl get pods -n {self.namespace} -o wide..."
-                echo "NAME                     READY   STATUS    RESTARTS   AGE   IP           NODE"
-                echo "demo-app-1-abc123       1/1     Running   0          2d    10.244.1.10  demo-worker-node-1"
-                echo "demo-app-2-def456       1/1     Running   0          2d    10.244.2.11  demo-worker-node-2"
-                echo "demo-service-xyz789     1/1     Running   1          3d    10.244.1.12  demo-worker-node-1"
-                echo ""
-                echo "📊 Pod resource usage (simulated):"
-                echo "NAME                     CPU(cores)   MEMORY(bytes)"
-                echo "demo-app-1-abc123       50m          128Mi"
-                echo "demo-app-2-def456       45m          110Mi"
-                echo "demo-service-xyz789     30m          95Mi" """)
-        
-        if self.check_services:
-            checks.append(f"""echo "🔍 CHECKING SERVICES IN NAMESPACE: {self.namespace} (Demo Mode)"
-                echo "📝 Simulating kubectl get services -n {self.namespace}..."
-                echo "NAME           TYPE        CLUSTER-IP      EXTERNAL-IP   PORT(S)"
-                echo "demo-service   ClusterIP   10.96.100.1     <none>        80/TCP"
-                echo "demo-app-svc   NodePort    10.96.100.2     <none>        8080:30080/TCP"
-                echo ""
-                echo "📝 Simulating kubectl get endpoints -n {self.namespace}..."
-                echo "NAME           ENDPOINTS"
-                echo "demo-service   10.244.1.10:80,10.244.2.11:80"
-                echo "demo-app-svc   10.244.1.12:8080" """)
-        
-        if self.check_events:
-            checks.append(f"""echo "🔍 CHECKING RECENT EVENTS IN NAMESPACE: {self.namespace} (Demo Mode)"
-                echo "📝 Simulating kubectl get events -n {self.namespace}..."
-                echo "LAST SEEN   TYPE     REASON    OBJECT                     MESSAGE"
-                echo "2m          Normal   Pulling   pod/demo-app-1-abc123     Pulling image"
-                echo "2m          Normal   Pulled    pod/demo-app-1-abc123     Successfully pulled image"
-                echo "5m          Normal   Created   pod/demo-app-2-def456     Created container"
-                echo "10m         Normal   Started   pod/demo-service-xyz789   Started container" """)
-        
-        return f"""echo "🏥 KUBERNETES HEALTH CHECK STARTING (Demo Mode)"
-            echo "Namespace: {self.namespace}"
-            echo "====================================="
-            {chr(10).join(checks)}
-            echo "✅ Kubernetes health check completed (simulated)" """
+        return self._render(self.namespace, self.check_nodes, self.check_pods, self.check_services, self.check_events)
+
+    @classmethod
+    def batch_get_command(cls, namespaces: List[str], flags: Optional[Dict[str, List[bool]]] = None) -> List[str]:
+        """Render one health check per namespace from column-oriented inputs without building models.
+
+        ``flags`` maps check_* field names to per-namespace booleans; missing
+        columns use the field defaults, and a column whose length differs from
+        ``namespaces`` raises ValueError. Inputs are not validated.
+        """
+        flags = flags or {}
+        columns = [
+            [cls.model_fields[name].default] * len(namespaces) if flags.get(name) is None else flags[name]
+            for name in ("check_nodes", "check_pods", "check_services", "check_events")
+        ]
+        return [cls._render(namespace, *checks) for namespace, *checks in zip(namespaces, *columns, strict=True)]
+
+    @staticmethod
+    def _render(namespace: str, check_nodes: bool, check_pods: bool, check_services: bool, check_events: bool) -> str:
+        # Unquoted heredoc: a single write, while $vars in the namespace still expand like echo "..."
+        return "".join([
+            "cat <<EOF\n",
+            f"🏥 KUBERNETES HEALTH CHECK STARTING (Demo Mode)\nNamespace: {namespace}\n=====================================\n",
+            NODE_STATUS_BLOB if check_nodes else "",
+            POD_BLOB.replace("{namespace}", namespace) if check_pods else "",
+            SVC_BLOB.replace("{namespace}", namespace) if check_services else "",
+            EVT_BLOB.replace("{namespace}", namespace) if check_events else "",
+            "✅ Kubernetes health check completed (simulated)\nEOF",
+        ])
 ### END: KubernetesHealthCheckCommand ###
 
 
@@ -1195,14 +1461,25 @@ Use Case: System administration workflows for log management
 """
 class LogRotationCommand(CommandModel):
     """Model for log rotation command generation."""
+    model_config = ConfigDict(frozen=True)
+
     log_directory: str
     log_pattern: str = "*.log"
     max_size_mb: int = 100
     retention_days: int = 7
     compress_old_logs: bool = True
     
+    @cached_render
     def get_command(self) -> str:
-        compress_cmd = "gzip" if self.compress_old_logs else "echo 'Compression disabled'"
+        if self.compress_old_logs:
+            compress_step = f"""# Compress rotated files in parallel: one multi-threaded pigz, else one gzip per core
+            if command -v pigz >/dev/null 2>&1; then
+                find {self.log_directory} -name "{self.log_pattern}.$TS" -print0 | xargs -0 -r pigz -p "$(nproc)" 2>/dev/null || true
+            else
+                find {self.log_directory} -name "{self.log_pattern}.$TS" -print0 | xargs -0 -r -P "$(nproc)" -n 1 gzip 2>/dev/null || true
+            fi"""
+        else:
+            compress_step = 'echo "Compression disabled"'
         
         return f"""echo "🗂️ STARTING LOG ROTATION"
             echo "Directory: {self.log_directory}"
@@ -1210,15 +1487,17 @@ class LogRotationCommand(CommandModel):
             echo "Max size: {self.max_size_mb}MB"
             echo "Retention: {self.retention_days} days"
             
-            # Find and rotate large log files
-            find {self.log_directory} -name "{self.log_pattern}" -size +{self.max_size_mb}M -exec sh -c '
+            # Find and rotate large log files (one timestamp shared by every rotated file)
+            TS=$(date +%Y%m%d_%H%M%S)
+            find {self.log_directory} -name "{self.log_pattern}" -size +{self.max_size_mb}M -print0 | xargs -0 -r sh -c '
+                ts=$1; shift
                 for file do
                     echo "📦 Rotating large file: $file"
-                    mv "$file" "$file.$(date +%Y%m%d_%H%M%S)"
-                    touch "$file"
-                    {compress_cmd} "$file.$(date +%Y%m%d_%H%M%S)" 2>/dev/null || true
+                    mv "$file" "$file.$ts"
+                    : > "$file"
                 done
-            ' sh {{}} +
+            ' sh "$TS"
+            {compress_step}
             
             # Clean up old log files
             find {self.log_directory} -name "{self.log_pattern}.*" -mtime +{self.retention_days} -delete
@@ -1244,12 +1523,15 @@ Use Case: Security teams performing automated vulnerability assessments
 """
 class SecurityScanCommand(CommandModel):
     """Model for security scan command generation."""
+    model_config = ConfigDict(frozen=True)
+
     scan_type: str  # "network", "filesystem", "container", "all"
     target: str
     scan_depth: str = "standard"  # "quick", "standard", "deep"
     output_format: str = "json"  # "json", "xml", "txt"
     alert_on_critical: bool = True
     
+    @cached_render
     def get_command(self) -> str:
         depth_flags = {
             "quick": "--quick-scan",
@@ -1274,11 +1556,10 @@ class SecurityScanCommand(CommandModel):
                 echo "Target: {self.target}"
                 echo "Depth: {self.scan_depth}"
                 
-                # Check file permissions
-                find {self.target} -type f -perm -o+w -exec ls -l {{}} \\;
-                
-                # Check for SUID/SGID files
-                find {self.target} -type f \\( -perm -4000 -o -perm -2000 \\) -exec ls -l {{}} \\;
+                # Single traversal for world-writable and SUID/SGID files, classified by mode string
+                find {self.target} -xdev -type f \\( -perm -o+w -o -perm -4000 -o -perm -2000 \\) -printf '%M %u %g %p\\n' 2>/dev/null | awk '
+                    substr($1, 9, 1) == "w" {{ print "WORLD-WRITABLE:", $0 }}
+                    substr($1, 4, 1) ~ /[sS]/ || substr($1, 7, 1) ~ /[sS]/ {{ print "SUID/SGID:", $0 }}'
                 
                 echo "✅ Filesystem security scan completed"
                 {alert_cmd if self.alert_on_critical else ""} """
@@ -1308,6 +1589,8 @@ Use Case: QA teams performing automated performance validation
 """
 class PerformanceTestCommand(CommandModel):
     """Model for performance test command generation."""
+    model_config = ConfigDict(frozen=True)
+
     test_type: str  # "load", "stress", "spike", "endurance"
     target_url: str
     concurrent_users: str = "10"  # Changed to str to accept template variables
@@ -1315,13 +1598,14 @@ class PerformanceTestCommand(CommandModel):
     ramp_up_time_seconds: int = 30
     collect_metrics: bool = True
     
+    @cached_render
     def get_command(self) -> str:
         # Handle duration calculation - check if it's a template variable or numeric
         try:
             duration_seconds = int(self.test_duration_minutes) * 60
         except ValueError:
-            # If it's a template variable, use shell arithmetic
-            duration_seconds = f"$(echo \"{self.test_duration_minutes} * 60\" | bc)"
+            # If it's a template variable, use builtin shell arithmetic
+            duration_seconds = f"$(({self.test_duration_minutes} * 60))"
         
         if self.test_type == "load":
             return f"""echo "⚡ STARTING LOAD PERFORMANCE TEST"
@@ -1353,7 +1637,7 @@ echo "📈 Performance metrics collected" """
         elif self.test_type == "stress":
             return f"""echo "🔥 STARTING STRESS PERFORMANCE TEST"
 echo "Target: {self.target_url}"
-PEAK_USERS=$(echo "{self.concurrent_users} * 2" | bc)
+PEAK_USERS=$(({self.concurrent_users} * 2))
 echo "Peak users: $PEAK_USERS"
 echo "Duration: {self.test_duration_minutes} minutes"
 
@@ -1381,6 +1665,135 @@ echo "📊 Results ready for analysis" """
 ### END: PerformanceTestCommand ###
 
 
+@functools.lru_cache(maxsize=256)
+def _b64_cached(content: str) -> str:
+    """Base64-encode generated file content, reusing the result for repeated renders."""
+    # b2a_base64 is the C encoder behind b64encode, called directly to skip the altchars wrapper
+    return binascii.b2a_base64(content.encode('utf-8'), newline=False).decode('ascii')
+
+
+_HEREDOC_SENTINEL = "KUBIYA_EOF"
+_HEREDOC_SENTINEL_RE = re.compile(r"(?m)^KUBIYA_EOF$")
+
+
+def _write_file_lines(destination: str, content: str) -> str:
+    """Shell lines that write content to destination byte for byte; base64 is only used for content with NUL bytes."""
+    if "\x00" in content:
+        return (
+            "# Content holds NUL bytes, which no shell word or heredoc can carry: decode it from base64\n"
+            f"echo '{_b64_cached(content)}' | base64 -d > {destination}"
+        )
+    if content.endswith("\n") and not _HEREDOC_SENTINEL_RE.search(content):
+        # The heredoc supplies the final newline itself, so the content's own is not repeated
+        return (
+            "# Write content with a quoted heredoc so the shell performs no expansion\n"
+            f"cat > {destination} <<'{_HEREDOC_SENTINEL}'\n{content}{_HEREDOC_SENTINEL}"
+        )
+    # Single quotes suppress all expansion; only embedded quotes need the '\'' escape
+    quoted = content.replace("'", "'\\''")
+    return (
+        "# Write content with single-quoted printf so the shell performs no expansion\n"
+        f"printf '%s' '{quoted}' > {destination}"
+    )
+
+
+def _written_size(content: str) -> int:
+    """Bytes _write_file_lines puts on disk, which is exactly the UTF-8 encoded content."""
+    return len(content.encode('utf-8'))
+
+
+def _human_size(num_bytes: int) -> str:
+    """Format a byte count the way ls -lh does (B, K, M, G)."""
+    if num_bytes < 1024:
+        return f"{num_bytes}B"
+    size = num_bytes / 1024
+    for unit in ("K", "M"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}G"
+
+
+_WRITE_FILE_CMD = """{header}
+echo "Output: {destination}"
+echo ""
+echo "{action}"
+
+# Create directory if it doesn't exist
+mkdir -p "$(dirname "{destination}")"
+
+{write}
+
+if [ $? -eq 0 ]; then
+    echo "✅ {done}: {destination}"
+    echo "📊 File size: {size}"
+else
+    echo "❌ {failed}"
+    exit 1
+fi"""
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Split a str.format template once into literal and field slots; rendering is then a single join.
+
+    ``render.partial(**fixed)`` returns a renderer with those slots baked into the literal parts,
+    for specializing a template on enum-like fields.
+    """
+    parts: List[str] = []
+    slots = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Compiled templates take plain fields only, got {{{field}!{conversion}:{spec}}}")
+        parts.append(literal)
+        if field is not None:
+            slots.append((len(parts), field))
+            parts.append("")
+    return _slot_renderer(parts, slots)
+
+
+def _slot_renderer(parts: List[str], slots: List[Tuple[int, str]]) -> Callable[..., str]:
+    def render(**fields: str) -> str:
+        out = parts.copy()
+        for index, field in slots:
+            out[index] = fields[field]
+        return "".join(out)
+
+    def partial(**fixed: str) -> Callable[..., str]:
+        baked = parts.copy()
+        for index, field in slots:
+            if field in fixed:
+                baked[index] = fixed[field]
+        return _slot_renderer(baked, [(index, field) for index, field in slots if field not in fixed])
+
+    render.partial = partial
+    return render
+
+
+_render_write_file_cmd = _compile_template(_WRITE_FILE_CMD)
+
+
+def _write_file_command(header: str, destination: str, content: str, action: str, done: str, failed: str,
+                        companions: Sequence[Mapping[str, str]] = ()) -> str:
+    """Shared generator script: announce, create the parent directory, write the file and report its size.
+
+    The size is computed here from the content rather than probed with du after the write.
+
+    ``companions`` are supporting files (e.g. a stylesheet) written before the main file;
+    the success check reflects the main file.
+    """
+    writes = [_write_file_lines(extra["destination"], extra["content"]) for extra in companions]
+    writes.append(_write_file_lines(destination, content))
+    return _render_write_file_cmd(
+        header=header,
+        destination=destination,
+        action=action,
+        write="\n".join(writes),
+        done=done,
+        failed=failed,
+        size=_human_size(_written_size(content)),
+    )
+
+
 ### START: ConfigurationFileGenerator ###
 """
 Configuration File Generator Model
@@ -1395,11 +1808,14 @@ Use Case: DevOps teams managing application configurations across environments
 """
 class ConfigurationFileGenerator(FileModel, CommandModel):
     """Model for generating configuration files."""
+    model_config = ConfigDict(frozen=True)
+
     config_type: str  # "nginx", "apache", "kubernetes", "docker-compose"
     environment: str  # "development", "staging", "production"
     template_vars: Dict[str, str] = {}
     output_format: str = "yaml"  # "yaml", "json", "ini", "xml"
     
+    @cached_render
     def get_command(self) -> str:
         files = self.get_files()
         if not files:
@@ -1409,33 +1825,18 @@ class ConfigurationFileGenerator(FileModel, CommandModel):
         destination = file_info['destination']
         content = file_info['content']
         
-        # Use base64 encoding to avoid variable substitution issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "⚙️ GENERATING {self.config_type.upper()} CONFIGURATION"
-echo "Environment: {self.environment}"
-echo "Format: {self.output_format}"
-echo "Output: {destination}"
-echo ""
-echo "📝 Creating configuration file..."
-
-# Create directory if it doesn't exist
-mkdir -p "$(dirname "{destination}")"
-
-# Write content using base64 to avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {destination}
-
-if [ $? -eq 0 ]; then
-    echo "✅ Configuration generated successfully: {destination}"
-    echo "📊 File size: $(du -h "{destination}" | cut -f1)"
-    echo "📄 Configuration preview (first 10 lines):"
-    head -10 "{destination}"
-else
-    echo "❌ Failed to generate configuration"
-    exit 1
-fi"""
+        return _write_file_command(
+            f'echo "⚙️ GENERATING {self.config_type.upper()} CONFIGURATION"\n'
+            f'echo "Environment: {self.environment}"\n'
+            f'echo "Format: {self.output_format}"',
+            destination,
+            content,
+            "📝 Creating configuration file...",
+            "Configuration generated successfully",
+            "Failed to generate configuration",
+        )
     
+    @cached_render
     def get_files(self) -> List[Dict[str, str]]:
         if self.config_type == "nginx":
             content = f"""# Nginx Configuration for {self.environment}
@@ -1532,6 +1933,8 @@ Use Case: Development teams automating documentation workflows
 """
 class DocumentationGenerator(FileModel, CommandModel):
     """Model for generating documentation files."""
+    model_config = ConfigDict(frozen=True)
+
     doc_type: str  # "api", "readme", "architecture", "user_guide"
     project_name: str
     organization_name: str
@@ -1539,6 +1942,7 @@ class DocumentationGenerator(FileModel, CommandModel):
     author: str = "Development Team"
     include_examples: bool = True
     
+    @cached_render
     def get_command(self) -> str:
         files = self.get_files()
         if not files:
@@ -1548,35 +1952,21 @@ class DocumentationGenerator(FileModel, CommandModel):
         destination = file_info['destination']
         content = file_info['content']
         
-        # Use base64 encoding to completely avoid shell interpretation issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "📚 GENERATING {self.doc_type.upper()} DOCUMENTATION"
-echo "Project: {self.project_name}"
-echo "Organization: {self.organization_name}"
-echo "Version: {self.version}"
-echo "Output: {destination}"
-echo ""
-echo "📝 Creating documentation file..."
-
-# Create directory if it doesn't exist
-mkdir -p "$(dirname "{destination}")"
-
-# Write content using base64 to completely avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {destination}
-
-if [ $? -eq 0 ]; then
-    echo "✅ Documentation generated successfully: {destination}"
-    echo "📊 File size: $(du -h "{destination}" | cut -f1)"
-    echo "📄 Preview (first 10 lines):"
-    head -10 "{destination}"
-else
-    echo "❌ Failed to generate documentation"
-    exit 1
-fi"""
+        return _write_file_command(
+            f'echo "📚 GENERATING {self.doc_type.upper()} DOCUMENTATION"\n'
+            f'echo "Project: {self.project_name}"\n'
+            f'echo "Organization: {self.organization_name}"\n'
+            f'echo "Version: {self.version}"',
+            destination,
+            content,
+            "📝 Creating documentation file...",
+            "Documentation generated successfully",
+            "Failed to generate documentation",
+        )
     
+    @cached_render
     def get_files(self) -> List[Dict[str, str]]:
+        project_lower = self.project_name.lower()
         if self.doc_type == "readme":
             content = f"""# {self.project_name}
 
@@ -1667,7 +2057,6 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
 """
         
         elif self.doc_type == "api":
-            project_lower = self.project_name.lower()
             content = f"""# {self.project_name} API Documentation
 
 **Version:** {self.version}  
@@ -1792,11 +2181,12 @@ X-RateLimit-Reset: 1640995200
 """
         
         else:
-            content = f"""# {self.project_name} - {self.doc_type.title()} Documentation
+            doc_type_title = self.doc_type.title()
+            content = f"""# {self.project_name} - {doc_type_title} Documentation
 
 **Version:** {self.version}  
 **Author:** {self.author}  
-**Type:** {self.doc_type.title()}
+**Type:** {doc_type_title}
 
 ## Introduction
 
@@ -1861,7 +2251,7 @@ For questions or support, contact {self.author}.
 """
         
         return [{
-            "destination": f"{self.doc_type}_{self.project_name.lower()}.md",
+            "destination": f"{self.doc_type}_{project_lower}.md",
             "content": content
         }]
 ### END: DocumentationGenerator ###
@@ -1880,8 +2270,19 @@ Features:
 - Multiple database engine support
 Use Case: Database administrators managing schema changes across environments
 """
+_COLUMN_DEFAULTS = {"constraints": ""}
+_format_column = "{name} {type} {constraints}".format_map
+
+
+def _columns_sql(columns: List[Dict[str, str]]) -> str:
+    """Column DDL lines for CREATE TABLE; a missing "constraints" key renders as empty."""
+    return ",\n    ".join(map(_format_column, (ChainMap(col, _COLUMN_DEFAULTS) for col in columns)))
+
+
 class DatabaseMigrationFile(FileModel):
     """Model for generating database migration files."""
+    model_config = ConfigDict(frozen=True)
+
     migration_name: str
     migration_type: str  # "create_table", "alter_table", "add_index", "custom"
     database_engine: str = "postgresql"  # "postgresql", "mysql", "sqlite"
@@ -1889,18 +2290,17 @@ class DatabaseMigrationFile(FileModel):
     columns: List[Dict[str, str]] = []
     rollback_enabled: bool = True
     
+    @cached_render
     def get_command(self) -> str:
         return f"echo 'Migration file generated: {self.get_files()[0]['destination']}'"
     
+    @cached_render
     def get_files(self) -> List[Dict[str, str]]:
         timestamp = "$(date +%Y%m%d_%H%M%S)"
         
         if self.migration_type == "create_table":
+            columns_sql = _columns_sql(self.columns)
             if self.database_engine == "postgresql":
-                columns_sql = ",\n    ".join([
-                    f"{col['name']} {col['type']} {col.get('constraints', '')}"
-                    for col in self.columns
-                ])
                 up_sql = f"""-- Migration: {self.migration_name}
 -- Created: {timestamp}
 
@@ -1921,10 +2321,6 @@ DROP TABLE IF EXISTS {self.table_name};
 """
             
             else:  # MySQL/SQLite fallback
-                columns_sql = ",\n    ".join([
-                    f"{col['name']} {col['type']} {col.get('constraints', '')}"
-                    for col in self.columns
-                ])
                 up_sql = f"""-- Migration: {self.migration_name}
 -- Created: {timestamp}
 
@@ -2005,6 +2401,21 @@ DROP COLUMN new_column;
 
 
 
+def _csv_text(header: List[str], rows) -> str:
+    """Render a header and row iterable as CSV text with the C csv writer."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _sql_values(rows) -> str:
+    """Join pre-formatted VALUES tuples into one INSERT body."""
+    body = ",\n".join(rows)
+    return f"{body};\n" if body else ""
+
+
 ### START: TestDataGenerator ###
 """
 Test Data Generator Model
@@ -2017,14 +2428,56 @@ Features:
 - Relationship and constraint support
 Use Case: QA teams and developers needing realistic test datasets
 """
+# Per-row VALUES templates for the SQL output, formatted once per record.
+# Sample rows never exceed 10, so the row-field helpers below cache every row they can produce.
+_USERS_SQL_ROW = "('{first_name}', '{last_name}', '{email}', '{phone}', '{street}', 'Anytown', 'CA', '{zip}', 'US', '2024-01-{day} 10:00:00', 'active', 'user')"
+_ORDERS_SQL_ROW = "({user_id}, '{order_number}', 'completed', {total}, 'USD', '2024-01-{day} 10:00:00', '2024-01-{shipped_day} 10:00:00')"
+
+
+@functools.lru_cache(maxsize=16)
+def _user_fields(i: int) -> Mapping[str, Union[int, str]]:
+    """Padded/derived fields of sample user i, shared read-only by the JSON, CSV and SQL writers."""
+    return MappingProxyType({
+        "id": i + 1,
+        "first_name": f"John{i + 1}",
+        "last_name": f"Doe{i + 1}",
+        "email": f"john{i + 1}@example.com",
+        "phone": f"+1-555-{100 + i:04d}",
+        "street": f"{100 + i} Main St",
+        "zip": f"{90000 + i:05d}",
+        "day": f"{i + 1:02d}",
+    })
+
+
+@functools.lru_cache(maxsize=16)
+def _order_fields(i: int) -> Mapping[str, Union[int, float, str]]:
+    """Derived fields of sample order i, shared read-only by the JSON, CSV and SQL writers."""
+    amount = (i + 1) * 25.99
+    return MappingProxyType({
+        "id": i + 1,
+        "user_id": (i % 10) + 1,
+        "order_number": f"ORD-{1000 + i}",
+        "amount": amount,
+        "total": f"{amount:.2f}",
+        "product_id": (i % 5) + 1,
+        "street": f"{100 + i} Main St",
+        "zip": f"{90000 + i:05d}",
+        "day": f"{i + 1:02d}",
+        "shipped_day": f"{i + 2:02d}",
+    })
+
+
 class TestDataGenerator(FileModel, CommandModel):
     """Model for generating test data files."""
+    model_config = ConfigDict(frozen=True)
+
     data_type: str  # "users", "orders", "products", "custom"
     record_count: str = "100"  # Changed to str to accept template variables
     output_format: str = "json"  # "json", "csv", "sql"
     include_relationships: bool = True
     locale: str = "en_US"
     
+    @cached_render
     def get_command(self) -> str:
         files = self.get_files()
         if not files:
@@ -2034,34 +2487,18 @@ class TestDataGenerator(FileModel, CommandModel):
         destination = file_info['destination']
         content = file_info['content']
         
-        # Use base64 encoding to avoid shell interpretation issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "🧪 GENERATING TEST DATA"
-echo "Data Type: {self.data_type}"
-echo "Record Count: {self.record_count}"
-echo "Format: {self.output_format}"
-echo "Locale: {self.locale}"
-echo "Output: {destination}"
-echo ""
-echo "📊 Creating test dataset..."
-
-# Create directory if it doesn't exist
-mkdir -p "$(dirname "{destination}")"
-
-# Write content using base64 to avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {destination}
-
-if [ $? -eq 0 ]; then
-    echo "✅ Test data generated successfully: {destination}"
-    echo "📊 File size: $(du -h "{destination}" | cut -f1)"
-    echo "📄 Preview (first 10 lines):"
-    head -10 "{destination}"
-else
-    echo "❌ Failed to generate test data"
-    exit 1
-fi"""
+        return _write_file_command(
+            'echo "🧪 GENERATING TEST DATA"\n'
+            f'echo "Data Type: {self.data_type}"\n'
+            f'echo "Record Count: {self.record_count}"\n'
+            f'echo "Format: {self.output_format}"\n'
+            f'echo "Locale: {self.locale}"',
+            destination,
+            content,
+            "📊 Creating test dataset...",
+            "Test data generated successfully",
+            "Failed to generate test data",
+        )
     
     def _get_record_count_int(self) -> int:
         """Convert record_count to int, handling both string and numeric values."""
@@ -2071,95 +2508,118 @@ fi"""
             # If it's a template variable or invalid, use a default for demo
             return 5
     
+    @cached_render
     def get_files(self) -> List[Dict[str, str]]:
-        # Get numeric record count for operations
+        # Get numeric record count for operations; JSON samples are shorter than CSV/SQL ones
         record_count_int = self._get_record_count_int()
+        json_sample = range(min(record_count_int, 5))
+        row_sample = range(min(record_count_int, 10))
         
         if self.data_type == "users":
             if self.output_format == "json":
-                content = """[
-"""
-                for i in range(min(record_count_int, 5)):  # Generate sample records
-                    content += f"""  {{
-    "id": {i + 1},
-    "first_name": "John{i + 1}",
-    "last_name": "Doe{i + 1}",
-    "email": "john{i + 1}@example.com",
-    "phone": "+1-555-{100 + i:04d}",
-    "address": {{
-      "street": "{100 + i} Main St",
-      "city": "Anytown",
-      "state": "CA",
-      "zip": "{90000 + i:05d}",
-      "country": "US"
-    }},
-    "created_at": "2024-01-{i + 1:02d}T10:00:00Z",
-    "status": "active",
-    "role": "user"
-  }}{"," if i < min(record_count_int, 5) - 1 else ""}
-"""
-                content += "\n]"
-            
+                records = [
+                    {
+                        "id": user["id"],
+                        "first_name": user["first_name"],
+                        "last_name": user["last_name"],
+                        "email": user["email"],
+                        "phone": user["phone"],
+                        "address": {
+                            "street": user["street"],
+                            "city": "Anytown",
+                            "state": "CA",
+                            "zip": user["zip"],
+                            "country": "US",
+                        },
+                        "created_at": f"2024-01-{user['day']}T10:00:00Z",
+                        "status": "active",
+                        "role": "user",
+                    }
+                    for user in map(_user_fields, json_sample)
+                ]
+                content = json.dumps(records, indent=2)
+
             elif self.output_format == "csv":
-                content = "id,first_name,last_name,email,phone,street,city,state,zip,country,created_at,status,role\n"
-                for i in range(min(record_count_int, 10)):
-                    content += f"{i + 1},John{i + 1},Doe{i + 1},john{i + 1}@example.com,+1-555-{100 + i:04d},{100 + i} Main St,Anytown,CA,{90000 + i:05d},US,2024-01-{i + 1:02d}T10:00:00Z,active,user\n"
-            
+                # Column-wise generation: each column is one pass over the sample, zipped into rows
+                users = [_user_fields(i) for i in row_sample]
+                content = _csv_text(
+                    ["id", "first_name", "last_name", "email", "phone", "street", "city", "state", "zip", "country", "created_at", "status", "role"],
+                    zip(
+                        [user["id"] for user in users],
+                        [user["first_name"] for user in users],
+                        [user["last_name"] for user in users],
+                        [user["email"] for user in users],
+                        [user["phone"] for user in users],
+                        [user["street"] for user in users],
+                        repeat("Anytown"), repeat("CA"),
+                        [user["zip"] for user in users],
+                        repeat("US"),
+                        [f"2024-01-{user['day']}T10:00:00Z" for user in users],
+                        repeat("active"), repeat("user"),
+                    ),
+                )
+
             else:  # SQL
                 content = f"""-- Test data for users table
 -- Generated {self.record_count} records
 
 INSERT INTO users (first_name, last_name, email, phone, street, city, state, zip, country, created_at, status, role) VALUES
-"""
-                for i in range(min(record_count_int, 10)):
-                    content += f"('John{i + 1}', 'Doe{i + 1}', 'john{i + 1}@example.com', '+1-555-{100 + i:04d}', '{100 + i} Main St', 'Anytown', 'CA', '{90000 + i:05d}', 'US', '2024-01-{i + 1:02d} 10:00:00', 'active', 'user'){',' if i < min(record_count_int, 10) - 1 else ';'}\n"
-        
+""" + _sql_values(_USERS_SQL_ROW.format_map(user) for user in map(_user_fields, row_sample))
+
         elif self.data_type == "orders":
             if self.output_format == "json":
-                content = """[
-"""
-                for i in range(min(record_count_int, 5)):
-                    content += f"""  {{
-    "id": {i + 1},
-    "user_id": {(i % 10) + 1},
-    "order_number": "ORD-{1000 + i}",
-    "status": "completed",
-    "total_amount": {(i + 1) * 25.99:.2f},
-    "currency": "USD",
-    "items": [
-      {{
-        "product_id": {(i % 5) + 1},
-        "name": "Product {(i % 5) + 1}",
-        "quantity": {i + 1},
-        "price": 25.99
-      }}
-    ],
-    "shipping_address": {{
-      "street": "{100 + i} Main St",
-      "city": "Anytown",
-      "state": "CA",
-      "zip": "{90000 + i:05d}"
-    }},
-    "order_date": "2024-01-{i + 1:02d}T10:00:00Z",
-    "shipped_date": "2024-01-{i + 2:02d}T10:00:00Z"
-  }}{"," if i < min(record_count_int, 5) - 1 else ""}
-"""
-                content += "\n]"
-            
+                records = [
+                    {
+                        "id": order["id"],
+                        "user_id": order["user_id"],
+                        "order_number": order["order_number"],
+                        "status": "completed",
+                        "total_amount": round(order["amount"], 2),
+                        "currency": "USD",
+                        "items": [
+                            {
+                                "product_id": order["product_id"],
+                                "name": f"Product {order['product_id']}",
+                                "quantity": order["id"],
+                                "price": 25.99,
+                            }
+                        ],
+                        "shipping_address": {
+                            "street": order["street"],
+                            "city": "Anytown",
+                            "state": "CA",
+                            "zip": order["zip"],
+                        },
+                        "order_date": f"2024-01-{order['day']}T10:00:00Z",
+                        "shipped_date": f"2024-01-{order['shipped_day']}T10:00:00Z",
+                    }
+                    for order in map(_order_fields, json_sample)
+                ]
+                content = json.dumps(records, indent=2)
+
             elif self.output_format == "csv":
-                content = "id,user_id,order_number,status,total_amount,currency,order_date,shipped_date\n"
-                for i in range(min(record_count_int, 10)):
-                    content += f"{i + 1},{(i % 10) + 1},ORD-{1000 + i},completed,{(i + 1) * 25.99:.2f},USD,2024-01-{i + 1:02d}T10:00:00Z,2024-01-{i + 2:02d}T10:00:00Z\n"
-            
+                orders = [_order_fields(i) for i in row_sample]
+                content = _csv_text(
+                    ["id", "user_id", "order_number", "status", "total_amount", "currency", "order_date", "shipped_date"],
+                    zip(
+                        [order["id"] for order in orders],
+                        [order["user_id"] for order in orders],
+                        [order["order_number"] for order in orders],
+                        repeat("completed"),
+                        [order["total"] for order in orders],
+                        repeat("USD"),
+                        [f"2024-01-{order['day']}T10:00:00Z" for order in orders],
+                        [f"2024-01-{order['shipped_day']}T10:00:00Z" for order in orders],
+                    ),
+                )
+
             else:  # SQL
                 content = f"""-- Test data for orders table
 -- Generated {self.record_count} records
 
 INSERT INTO orders (user_id, order_number, status, total_amount, currency, order_date, shipped_date) VALUES
-"""
-                for i in range(min(record_count_int, 10)):
-                    content += f"({(i % 10) + 1}, 'ORD-{1000 + i}', 'completed', {(i + 1) * 25.99:.2f}, 'USD', '2024-01-{i + 1:02d} 10:00:00', '2024-01-{i + 2:02d} 10:00:00'){',' if i < min(record_count_int, 10) - 1 else ';'}\n"
-        
+""" + _sql_values(_ORDERS_SQL_ROW.format_map(order) for order in map(_order_fields, row_sample))
+
         else:  # custom data type
             content = f"""# Custom test data for {self.data_type}
 # Generated {self.record_count} records
@@ -2189,84 +2649,38 @@ Features:
 - Trend analysis and visualization data
 Use Case: Operations teams analyzing application and system logs
 """
-class LogAnalysisReport(FileModel, CommandModel):
-    """Model for generating log analysis reports."""
-    log_source: str  # "application", "nginx", "system", "security"
-    analysis_period: str  # "last_hour", "last_day", "last_week"
-    include_errors: bool = True
-    include_performance: bool = True
-    include_security: bool = True
-    output_format: str = "html"  # "html", "markdown", "json"
-    
-    def get_command(self) -> str:
-        files = self.get_files()
-        if not files:
-            return "echo '❌ No log analysis files to generate'"
-        
-        file_info = files[0]
-        destination = file_info['destination']
-        content = file_info['content']
-        
-        # Use base64 encoding to avoid shell interpretation issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "🔍 GENERATING LOG ANALYSIS REPORT"
-echo "Source: {self.log_source}"
-echo "Period: {self.analysis_period}"
-echo "Format: {self.output_format}"
-echo "Output: {destination}"
-echo ""
-echo "📊 Creating log analysis report..."
-
-# Create directory if it doesn't exist
-mkdir -p "$(dirname "{destination}")"
-
-# Write content using base64 to avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {destination}
-
-if [ $? -eq 0 ]; then
-    echo "✅ Log analysis report generated successfully: {destination}"
-    echo "📊 File size: $(du -h "{destination}" | cut -f1)"
-    echo "📄 Preview (first 10 lines):"
-    head -10 "{destination}"
-else
-    echo "❌ Failed to generate log analysis report"
-    exit 1
-fi"""
-    
-    def get_files(self) -> List[Dict[str, str]]:
-        timestamp = "$(date '+%Y-%m-%d %H:%M:%S')"
-        
-        if self.output_format == "html":
-            content = f"""<!DOCTYPE html>
+# Shared stylesheet written next to HTML reports instead of being inlined in every one
+_LOG_REPORT_CSS_DESTINATION = "log_analysis_report.css"
+_LOG_REPORT_CSS = """body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+.container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+.header { border-bottom: 2px solid #007bff; padding-bottom: 10px; margin-bottom: 20px; }
+.metric-card { background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #007bff; }
+.error { border-left-color: #dc3545; }
+.warning { border-left-color: #ffc107; }
+.success { border-left-color: #28a745; }
+.stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
+.stat-box { background: #007bff; color: white; padding: 20px; border-radius: 8px; text-align: center; }
+.stat-number { font-size: 2em; font-weight: bold; }
+.table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+.table th, .table td { padding: 12px; border: 1px solid #dee2e6; text-align: left; }
+.table th { background: #007bff; color: white; }
+.footer { margin-top: 30px; padding-top: 20px; border-top: 1px solid #dee2e6; color: #6c757d; }
+"""
+
+# Static report skeletons; only the header fields and the optional sections are filled per call
+_HTML_REPORT_SKELETON = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Log Analysis Report - {self.log_source.title()}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .header {{ border-bottom: 2px solid #007bff; padding-bottom: 10px; margin-bottom: 20px; }}
-        .metric-card {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #007bff; }}
-        .error {{ border-left-color: #dc3545; }}
-        .warning {{ border-left-color: #ffc107; }}
-        .success {{ border-left-color: #28a745; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .stat-box {{ background: #007bff; color: white; padding: 20px; border-radius: 8px; text-align: center; }}
-        .stat-number {{ font-size: 2em; font-weight: bold; }}
-        .table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        .table th, .table td {{ padding: 12px; border: 1px solid #dee2e6; text-align: left; }}
-        .table th {{ background: #007bff; color: white; }}
-        .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #dee2e6; color: #6c757d; }}
-    </style>
+    <title>Log Analysis Report - {source}</title>
+    <link rel="stylesheet" href="{stylesheet}">
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🔍 Log Analysis Report</h1>
-            <p><strong>Source:</strong> {self.log_source.title()} | <strong>Period:</strong> {self.analysis_period.replace('_', ' ').title()} | <strong>Generated:</strong> {timestamp}</p>
+            <p><strong>Source:</strong> {source} | <strong>Period:</strong> {period} | <strong>Generated:</strong> {timestamp}</p>
         </div>
 
         <div class="stats">
@@ -2288,14 +2702,11 @@ fi"""
             </div>
         </div>
 
-        {"<h2>🔴 Error Analysis</h2>" if self.include_errors else ""}
-        {"<div class='metric-card error'><h3>Top Error Patterns</h3><ul><li>500 Internal Server Error - 145 occurrences</li><li>404 Not Found - 98 occurrences</li><li>Connection timeout - 44 occurrences</li></ul></div>" if self.include_errors else ""}
+        {errors_section}
 
-        {"<h2>⚡ Performance Metrics</h2>" if self.include_performance else ""}
-        {"<div class='metric-card'><h3>Response Time Distribution</h3><ul><li>< 1s: 85.2% of requests</li><li>1-3s: 12.8% of requests</li><li>3-5s: 1.7% of requests</li><li>> 5s: 0.3% of requests</li></ul></div>" if self.include_performance else ""}
+        {performance_section}
 
-        {"<h2>🔒 Security Events</h2>" if self.include_security else ""}
-        {"<div class='metric-card warning'><h3>Security Alerts</h3><ul><li>Failed login attempts: 23</li><li>Suspicious IP addresses: 7</li><li>Rate limit violations: 12</li></ul></div>" if self.include_security else ""}
+        {security_section}
 
         <h2>📊 Detailed Breakdown</h2>
         <table class="table">
@@ -2335,12 +2746,20 @@ fi"""
     </div>
 </body>
 </html>"""
-        
-        elif self.output_format == "markdown":
-            content = f"""# 🔍 Log Analysis Report
 
-**Source:** {self.log_source.title()}  
-**Period:** {self.analysis_period.replace('_', ' ').title()}  
+_ERRORS_BLOCK_HTML = """<h2>🔴 Error Analysis</h2>
+        <div class='metric-card error'><h3>Top Error Patterns</h3><ul><li>500 Internal Server Error - 145 occurrences</li><li>404 Not Found - 98 occurrences</li><li>Connection timeout - 44 occurrences</li></ul></div>"""
+
+_PERF_BLOCK_HTML = """<h2>⚡ Performance Metrics</h2>
+        <div class='metric-card'><h3>Response Time Distribution</h3><ul><li>< 1s: 85.2% of requests</li><li>1-3s: 12.8% of requests</li><li>3-5s: 1.7% of requests</li><li>> 5s: 0.3% of requests</li></ul></div>"""
+
+_SECURITY_BLOCK_HTML = """<h2>🔒 Security Events</h2>
+        <div class='metric-card warning'><h3>Security Alerts</h3><ul><li>Failed login attempts: 23</li><li>Suspicious IP addresses: 7</li><li>Rate limit violations: 12</li></ul></div>"""
+
+_MARKDOWN_REPORT_SKELETON = """# 🔍 Log Analysis Report
+
+**Source:** {source}  
+**Period:** {period}  
 **Generated:** {timestamp}
 
 ## 📊 Summary Statistics
@@ -2352,27 +2771,11 @@ fi"""
 | Error Count | 287 |
 | Average Response Time | 1.2s |
 
-{"## 🔴 Error Analysis" if self.include_errors else ""}
-
-{"### Top Error Patterns" if self.include_errors else ""}
-{"- 500 Internal Server Error: 145 occurrences" if self.include_errors else ""}
-{"- 404 Not Found: 98 occurrences" if self.include_errors else ""}
-{"- Connection timeout: 44 occurrences" if self.include_errors else ""}
-
-{"## ⚡ Performance Metrics" if self.include_performance else ""}
+{errors_section}
 
-{"### Response Time Distribution" if self.include_performance else ""}
-{"- < 1s: 85.2% of requests" if self.include_performance else ""}
-{"- 1-3s: 12.8% of requests" if self.include_performance else ""}
-{"- 3-5s: 1.7% of requests" if self.include_performance else ""}
-{"- > 5s: 0.3% of requests" if self.include_performance else ""}
+{performance_section}
 
-{"## 🔒 Security Events" if self.include_security else ""}
-
-{"### Security Alerts" if self.include_security else ""}
-{"- Failed login attempts: 23" if self.include_security else ""}
-{"- Suspicious IP addresses: 7" if self.include_security else ""}
-{"- Rate limit violations: 12" if self.include_security else ""}
+{security_section}
 
 ## 📈 Trends and Recommendations
 
@@ -2392,52 +2795,319 @@ fi"""
 *Report generated automatically by Log Analysis System*  
 *Contact: ops@company.com*
 """
+
+_ERRORS_BLOCK_MD = """## 🔴 Error Analysis
+
+### Top Error Patterns
+- 500 Internal Server Error: 145 occurrences
+- 404 Not Found: 98 occurrences
+- Connection timeout: 44 occurrences"""
+
+_PERF_BLOCK_MD = """## ⚡ Performance Metrics
+
+### Response Time Distribution
+- < 1s: 85.2% of requests
+- 1-3s: 12.8% of requests
+- 3-5s: 1.7% of requests
+- > 5s: 0.3% of requests"""
+
+_SECURITY_BLOCK_MD = """## 🔒 Security Events
+
+### Security Alerts
+- Failed login attempts: 23
+- Suspicious IP addresses: 7
+- Rate limit violations: 12"""
+
+class LogAnalysisReport(FileModel, CommandModel):
+    """Model for generating log analysis reports.
+
+    HTML reports link log_analysis_report.css instead of inlining their styles, so they are not
+    self-contained: copy the stylesheet along with the report, or it renders unstyled.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    log_source: str  # "application", "nginx", "system", "security"
+    analysis_period: str  # "last_hour", "last_day", "last_week"
+    include_errors: bool = True
+    include_performance: bool = True
+    include_security: bool = True
+    output_format: str = "html"  # "html", "markdown", "json"
+    
+    @cached_render
+    def get_command(self) -> str:
+        files = self.get_files()
+        if not files:
+            return "echo '❌ No log analysis files to generate'"
+        
+        file_info = files[0]
+        destination = file_info['destination']
+        content = file_info['content']
+        
+        return _write_file_command(
+            'echo "🔍 GENERATING LOG ANALYSIS REPORT"\n'
+            f'echo "Source: {self.log_source}"\n'
+            f'echo "Period: {self.analysis_period}"\n'
+            f'echo "Format: {self.output_format}"',
+            destination,
+            content,
+            "📊 Creating log analysis report...",
+            "Log analysis report generated successfully",
+            "Failed to generate log analysis report",
+            companions=files[1:],
+        )
+    
+    @cached_render
+    def get_files(self) -> List[Dict[str, str]]:
+        timestamp = "$(date '+%Y-%m-%d %H:%M:%S')"
+        source = self.log_source.title()
+        period = self.analysis_period.replace('_', ' ').title()
+        
+        if self.output_format == "html":
+            content = _HTML_REPORT_SKELETON.format(
+                stylesheet=_LOG_REPORT_CSS_DESTINATION,
+                source=source,
+                period=period,
+                timestamp=timestamp,
+                errors_section=_ERRORS_BLOCK_HTML if self.include_errors else "",
+                performance_section=_PERF_BLOCK_HTML if self.include_performance else "",
+                security_section=_SECURITY_BLOCK_HTML if self.include_security else "",
+            )
+        
+        elif self.output_format == "markdown":
+            content = _MARKDOWN_REPORT_SKELETON.format(
+                source=source,
+                period=period,
+                timestamp=timestamp,
+                errors_section=_ERRORS_BLOCK_MD if self.include_errors else "",
+                performance_section=_PERF_BLOCK_MD if self.include_performance else "",
+                security_section=_SECURITY_BLOCK_MD if self.include_security else "",
+            )
         
         else:  # JSON format
-            content = f"""{{
-  "report": {{
-    "metadata": {{
-      "source": "{self.log_source}",
-      "period": "{self.analysis_period}",
-      "generated_at": "{timestamp}",
-      "format": "json"
-    }},
-    "summary": {{
-      "total_requests": 15847,
-      "success_rate": 98.2,
-      "error_count": 287,
-      "avg_response_time": 1.2
-    }},
-    {"\"errors\": {" if self.include_errors else ""}
-    {"\"patterns\": [" if self.include_errors else ""}
-    {"{ \"type\": \"500 Internal Server Error\", \"count\": 145 }," if self.include_errors else ""}
-    {"{ \"type\": \"404 Not Found\", \"count\": 98 }," if self.include_errors else ""}
-    {"{ \"type\": \"Connection timeout\", \"count\": 44 }" if self.include_errors else ""}
-    {"]" if self.include_errors else ""}
-    {"}," if self.include_errors else ""}
-    {"\"performance\": {" if self.include_performance else ""}
-    {"\"response_time_distribution\": {" if self.include_performance else ""}
-    {"\"under_1s\": 85.2," if self.include_performance else ""}
-    {"\"1_to_3s\": 12.8," if self.include_performance else ""}
-    {"\"3_to_5s\": 1.7," if self.include_performance else ""}
-    {"\"over_5s\": 0.3" if self.include_performance else ""}
-    {"}" if self.include_performance else ""}
-    {"}," if self.include_performance else ""}
-    {"\"security\": {" if self.include_security else ""}
-    {"\"failed_logins\": 23," if self.include_security else ""}
-    {"\"suspicious_ips\": 7," if self.include_security else ""}
-    {"\"rate_limit_violations\": 12" if self.include_security else ""}
-    {"}" if self.include_security else ""}
-  }}
-}}"""
+            report = {
+                "metadata": {
+                    "source": self.log_source,
+                    "period": self.analysis_period,
+                    "generated_at": timestamp,
+                    "format": "json",
+                },
+                "summary": {
+                    "total_requests": 15847,
+                    "success_rate": 98.2,
+                    "error_count": 287,
+                    "avg_response_time": 1.2,
+                },
+            }
+            if self.include_errors:
+                report["errors"] = {
+                    "patterns": [
+                        {"type": "500 Internal Server Error", "count": 145},
+                        {"type": "404 Not Found", "count": 98},
+                        {"type": "Connection timeout", "count": 44},
+                    ]
+                }
+            if self.include_performance:
+                report["performance"] = {
+                    "response_time_distribution": {
+                        "under_1s": 85.2,
+                        "1_to_3s": 12.8,
+                        "3_to_5s": 1.7,
+                        "over_5s": 0.3,
+                    }
+                }
+            if self.include_security:
+                report["security"] = {
+                    "failed_logins": 23,
+                    "suspicious_ips": 7,
+                    "rate_limit_violations": 12,
+                }
+            content = json.dumps({"report": report}, indent=2)
         
-        return [{
+        files = [{
             "destination": f"log_analysis_report_{self.log_source}_{self.analysis_period}.{self.output_format}",
             "content": content
         }]
+        if self.output_format == "html":
+            files.append({"destination": _LOG_REPORT_CSS_DESTINATION, "content": _LOG_REPORT_CSS})
+        return files
 ### END: LogAnalysisReport ###
 
 
+### START: SlackNotificationModel ###
+"""
+Slack Notification Base Model
+=============================
+Purpose: Shared plumbing for the Slack notification command models below
+Features:
+- Frozen model with memoized message, payload file and command renders
+- Exposes the JSON payload through get_files so tool steps can ship it with with_files
+- Pipes the payload to curl from a quoted heredoc, so quotes in message text cannot break the command
+- Writes payload files only when no token is given (plus extra fan-out channels, which curl reads from disk)
+- List fields are tuples, so notifications are hashable and can be deduplicated with a set
+Use Case: Base class for SystemMaintenanceMessage, AlertResolutionMessage, DeploymentStatusMessage,
+CapacityWarningMessage and SecurityIncidentMessage
+"""
+def _bullet_list(items: Sequence[str]) -> str:
+    """Render items as Slack bullet lines with one join."""
+    return "• " + "\n• ".join(items) if items else ""
+
+
+def _markdown_list(items: Sequence[str], prefix: str = "- ", suffix: str = "") -> str:
+    """Render items as markdown list lines (prefix + item + suffix) with one join."""
+    return prefix + f"{suffix}\n{prefix}".join(items) + suffix
+
+
+# Blocks are never mutated once built, so fixed-shape blocks
+# are validated once and the same instance is reused by every message that needs them
+@functools.lru_cache(maxsize=64)
+def _header_block(text: str) -> HeaderBlock:
+    return HeaderBlock(text=PlainTextObject(text=text, emoji=True))
+
+
+@functools.lru_cache(maxsize=None)
+def _button_actions(*buttons: tuple) -> ActionsBlock:
+    """Actions block of (label, style) buttons."""
+    return ActionsBlock(elements=[
+        ButtonElement(text=PlainTextObject(text=label, emoji=True), style=style) for label, style in buttons
+    ])
+
+
+# Section builders for the notification models. Their inputs are already-validated str fields,
+# so the blocks are assembled with model_construct instead of validating every nested object.
+def _mrkdwn_section(text: str) -> SectionBlock:
+    return SectionBlock.model_construct(text=MarkdownTextObject.model_construct(text=text))
+
+
+def _fields_section(*texts: str) -> SectionBlock:
+    """Section with one mrkdwn field per text."""
+    return SectionBlock.model_construct(fields=[MarkdownTextObject.model_construct(text=text) for text in texts])
+
+
+def _labelled_section(label: str, body: str) -> List[SectionBlock]:
+    """A labelled section to splice into blocks, or nothing when body is empty."""
+    return [_mrkdwn_section(f"*{label}:*\n{body}")] if body else []
+
+
+# Shared post script for the notification models; per-model wording comes from class attributes
+# When posting, the primary payload is piped to curl from a heredoc and never touches disk;
+# the payload files are only written when there is no token to post with
+_render_slack_post_cmd = _compile_template("""echo "{emoji} {banner}"
+            echo "Posting to channel: {channel}"
+            if [ -n "{slack_token}" ]; then{write_extra}
+                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
+                    -H "Authorization: Bearer {slack_token}" \\
+                    -H "Content-Type: application/json" \\
+                    {data_args} <<'{sentinel}'
+{payload}
+{sentinel}
+                )
+                echo "Slack API response: $RESPONSE"
+                if [ $? -eq 0 ]; then
+                    echo "✅ {subject} posted successfully"
+                else
+                    echo "❌ Failed to post {subject_lower}"
+                    exit 1
+                fi
+            else
+                {write}
+                echo "ℹ️ No Slack token provided, {saved_as} saved to {output_file}"
+                echo "✅ {subject} prepared successfully"
+            fi""")
+
+# Fields that only steer delivery; they never change the rendered message
+_DELIVERY_ONLY_FIELDS = frozenset({"channel", "channels", "slack_token", "output_file"})
+
+
+@functools.lru_cache(maxsize=256)
+def _render_notification_payload(cls: type, channel: str, fields: tuple) -> str:
+    """Compact JSON payload for a notification, shared by every instance with the same message fields."""
+    return cls.model_construct(channel=channel, **dict(fields)).get_message().to_bytes().decode("utf-8")
+
+
+class SlackNotificationModel(CommandModel, MessageModel, FileModel):
+    """Base model for Slack notifications posted from a shell step."""
+    model_config = ConfigDict(frozen=True)
+
+    _BANNER: ClassVar[str]
+    _BANNER_EMOJI: ClassVar[str] = "📣"
+    _SUBJECT: ClassVar[str]
+    _SAVED_AS: ClassVar[str]
+
+    output_file: str
+
+    def _banner_emoji(self) -> str:
+        return self._BANNER_EMOJI
+
+    @cached_render
+    def get_command(self) -> str:
+        return _render_slack_post_cmd(
+            emoji=self._banner_emoji(),
+            banner=self._BANNER,
+            channel=self.channel,
+            write=self._write_payload(),
+            write_extra=self._write_extra_payloads(),
+            slack_token=self.slack_token,
+            data_args=self._curl_data_args(),
+            # Compact JSON is a single line starting with "{", so it can never end the heredoc early
+            payload=self.get_files()[0]["content"],
+            sentinel=_HEREDOC_SENTINEL,
+            subject=self._SUBJECT,
+            subject_lower=self._SUBJECT.lower(),
+            saved_as=self._SAVED_AS,
+            output_file=self.output_file,
+        )
+
+    def _target_channels(self) -> List[str]:
+        """Channels the notification is posted to; models with fan-out extend this."""
+        return [self.channel]
+
+    @cached_render
+    def _message_fields(self) -> tuple:
+        """Hashable snapshot of the fields that shape the message (list fields are tuples)."""
+        return tuple((name, value) for name, value in self if name not in _DELIVERY_ONLY_FIELDS)
+
+    def _payload_json(self, channel: str) -> str:
+        return _render_notification_payload(type(self), channel, self._message_fields())
+
+    @cached_render
+    def get_files(self) -> List[Dict[str, str]]:
+        # One payload per target channel: output_file for the primary, numbered siblings for the rest
+        root, ext = os.path.splitext(self.output_file)
+        files = [{"destination": self.output_file, "content": self._payload_json(self.channel)}]
+        for index, channel in enumerate(self._target_channels()[1:], start=1):
+            files.append({"destination": f"{root}.{index}{ext}", "content": self._payload_json(channel)})
+        return files
+
+    def _write_payload(self, extra_only: bool = False) -> str:
+        """Shell lines that write the JSON payload files; extra_only skips the primary channel's.
+
+        Lines after the first are indented to the post script's if/else body (the slot indents the first).
+        Compact JSON never contains a raw newline, so each payload is a one-line printf and the indent
+        never lands inside payload bytes.
+        """
+        files = self.get_files()[1:] if extra_only else self.get_files()
+        lines = "\n".join(_write_file_lines(payload["destination"], payload["content"]) for payload in files)
+        return lines.replace("\n", "\n                ")
+
+    def _write_extra_payloads(self) -> str:
+        """Indented lines writing the extra channels' payloads, or nothing when there is one channel."""
+        extra = self._write_payload(extra_only=True)
+        return f"\n                {extra}" if extra else ""
+
+    def _curl_data_args(self) -> str:
+        """curl data arguments: the primary payload on stdin, extra channels chained with --next on the same connection."""
+        rest = self.get_files()[1:]
+        chained = "".join(
+            f' \\\n                    --next -s -X POST https://slack.com/api/chat.postMessage'
+            f' -H "Authorization: Bearer {self.slack_token}" -H "Content-Type: application/json"'
+            f' -d @{payload["destination"]}'
+            for payload in rest
+        )
+        return f"--data-binary @-{chained}"
+### END: SlackNotificationModel ###
+
+
+
 ### START: SystemMaintenanceMessage ###
 """
 System Maintenance Message Model
@@ -2450,76 +3120,47 @@ Features:
 - Emergency contact information
 Use Case: Operations teams communicating system maintenance to stakeholders
 """
-class SystemMaintenanceMessage(CommandModel, MessageModel):
+_IMPACT_EMOJI = {"low": "🟡", "medium": "🟠", "high": "🔴"}
+_MAINTENANCE_TYPE_EMOJI = {"emergency": "🚨", "scheduled": "🔧"}
+
+class SystemMaintenanceMessage(SlackNotificationModel):
     """Model for system maintenance notification messages."""
+    _BANNER: ClassVar[str] = "POSTING MAINTENANCE NOTIFICATION"
+    _SUBJECT: ClassVar[str] = "Maintenance notification"
+    _SAVED_AS: ClassVar[str] = "notification"
+
     channel: str
     maintenance_title: str
     start_time: str
     end_time: str
-    affected_systems: List[str]
+    affected_systems: Tuple[str, ...]
     impact_level: str = "medium"  # "low", "medium", "high"
     maintenance_type: str = "scheduled"  # "scheduled", "emergency"
     slack_token: str = ""
     output_file: str = "/tmp/maintenance_notification.json"
     
-    def get_command(self) -> str:
-        msg = self.get_message()
-        msg_json = msg.to_json()
-        
-        return f"""echo "🔧 POSTING MAINTENANCE NOTIFICATION"
-            echo "Posting to channel: {self.channel}"
-            IMPACT_EMOJI=""
-            case "{self.impact_level}" in
-                low) IMPACT_EMOJI="🟡" ;;
-                medium) IMPACT_EMOJI="🟠" ;;
-                high) IMPACT_EMOJI="🔴" ;;
-                *) IMPACT_EMOJI="🟡" ;;
-            esac
-            TYPE_EMOJI=""
-            case "{self.maintenance_type}" in
-                emergency) TYPE_EMOJI="🚨" ;;
-                scheduled) TYPE_EMOJI="🔧" ;;
-                *) TYPE_EMOJI="🔧" ;;
-            esac
-            echo '{msg_json}' > {self.output_file}
-            if [ -n "{self.slack_token}" ]; then
-                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
-                    -H "Authorization: Bearer {self.slack_token}" \\
-                    -H "Content-Type: application/json" \\
-                    -d @{self.output_file}
-                )
-                echo "Slack API response: $RESPONSE"
-                if [ $? -eq 0 ]; then
-                    echo "✅ Maintenance notification posted successfully"
-                else
-                    echo "❌ Failed to post maintenance notification"
-                    exit 1
-                fi
-            else
-                echo "ℹ️ No Slack token provided, notification saved to {self.output_file}"
-                echo "✅ Maintenance notification prepared successfully"
-            fi"""
-    
+    def _banner_emoji(self) -> str:
+        return _MAINTENANCE_TYPE_EMOJI.get(self.maintenance_type, "🔧")
+
+    @cached_render
     def get_message(self, **kwargs) -> Message:
-        from models.messages import Message, HeaderBlock, SectionBlock, MarkdownTextObject, PlainTextObject
-        
-        impact_emoji = {"low": "🟡", "medium": "🟠", "high": "🔴"}.get(self.impact_level, "🟡")
-        type_emoji = "🚨" if self.maintenance_type == "emergency" else "🔧"
-        systems_text = "\n".join([f"• {system}" for system in self.affected_systems])
+        impact_emoji = _IMPACT_EMOJI.get(self.impact_level, "🟡")
+        type_emoji = _MAINTENANCE_TYPE_EMOJI.get(self.maintenance_type, "🔧")
+        systems_text = _bullet_list(self.affected_systems)
         
         return Message(
             channel=self.channel,
             text=f"{type_emoji} System Maintenance: {self.maintenance_title}",
             blocks=[
-                HeaderBlock(text=PlainTextObject(text=f"{type_emoji} SYSTEM MAINTENANCE", emoji=True)),
-                SectionBlock(text=MarkdownTextObject(text=f"*{self.maintenance_title}*")),
-                SectionBlock(fields=[
-                    MarkdownTextObject(text=f"*Start:*\n{self.start_time}"),
-                    MarkdownTextObject(text=f"*End:*\n{self.end_time}"),
-                    MarkdownTextObject(text=f"*Impact:*\n{impact_emoji} {self.impact_level.title()}"),
-                    MarkdownTextObject(text=f"*Type:*\n{self.maintenance_type.title()}")
-                ]),
-                SectionBlock(text=MarkdownTextObject(text=f"*Affected Systems:*\n{systems_text}"))
+                _header_block(f"{type_emoji} SYSTEM MAINTENANCE"),
+                _mrkdwn_section(f"*{self.maintenance_title}*"),
+                _fields_section(
+                    f"*Start:*\n{self.start_time}",
+                    f"*End:*\n{self.end_time}",
+                    f"*Impact:*\n{impact_emoji} {self.impact_level.title()}",
+                    f"*Type:*\n{self.maintenance_type.title()}"
+                ),
+                *_labelled_section("Affected Systems", systems_text)
             ]
         )
 ### END: SystemMaintenanceMessage ###
@@ -2538,69 +3179,45 @@ Features:
 - Follow-up action items
 Use Case: Incident response teams communicating alert resolutions
 """
-class AlertResolutionMessage(CommandModel, MessageModel):
+_RESOLUTION_STATUS_EMOJI = {"resolved": "✅", "mitigated": "⚠️", "investigating": "🔍"}
+
+class AlertResolutionMessage(SlackNotificationModel):
     """Model for alert resolution notification messages."""
+    _BANNER: ClassVar[str] = "POSTING ALERT RESOLUTION"
+    _SUBJECT: ClassVar[str] = "Alert resolution"
+    _SAVED_AS: ClassVar[str] = "resolution"
+
     channel: str
     alert_id: str
     alert_title: str
     resolution_status: str = "resolved"  # "resolved", "mitigated", "investigating"
     resolution_time: str
     root_cause: str
-    actions_taken: List[str]
+    actions_taken: Tuple[str, ...]
     slack_token: str = ""
     output_file: str = "/tmp/alert_resolution.json"
     
-    def get_command(self) -> str:
-        msg = self.get_message()
-        msg_json = msg.to_json()
-        
-        return f"""echo "✅ POSTING ALERT RESOLUTION"
-            echo "Posting to channel: {self.channel}"
-            STATUS_EMOJI=""
-            case "{self.resolution_status}" in
-                resolved) STATUS_EMOJI="✅" ;;
-                mitigated) STATUS_EMOJI="⚠️" ;;
-                investigating) STATUS_EMOJI="🔍" ;;
-                *) STATUS_EMOJI="✅" ;;
-            esac
-            echo '{msg_json}' > {self.output_file}
-            if [ -n "{self.slack_token}" ]; then
-                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
-                    -H "Authorization: Bearer {self.slack_token}" \\
-                    -H "Content-Type: application/json" \\
-                    -d @{self.output_file}
-                )
-                echo "Slack API response: $RESPONSE"
-                if [ $? -eq 0 ]; then
-                    echo "✅ Alert resolution posted successfully"
-                else
-                    echo "❌ Failed to post alert resolution"
-                    exit 1
-                fi
-            else
-                echo "ℹ️ No Slack token provided, resolution saved to {self.output_file}"
-                echo "✅ Alert resolution prepared successfully"
-            fi"""
-    
+    def _banner_emoji(self) -> str:
+        return _RESOLUTION_STATUS_EMOJI.get(self.resolution_status, "✅")
+
+    @cached_render
     def get_message(self, **kwargs) -> Message:
-        from models.messages import Message, HeaderBlock, SectionBlock, MarkdownTextObject, PlainTextObject
-        
-        status_emoji = {"resolved": "✅", "mitigated": "⚠️", "investigating": "🔍"}.get(self.resolution_status, "✅")
-        actions_text = "\n".join([f"• {action}" for action in self.actions_taken])
+        status_emoji = _RESOLUTION_STATUS_EMOJI.get(self.resolution_status, "✅")
+        actions_text = _bullet_list(self.actions_taken)
         
         return Message(
             channel=self.channel,
             text=f"✅ Alert Resolved: {self.alert_title}",
             blocks=[
-                HeaderBlock(text=PlainTextObject(text=f"{status_emoji} ALERT {self.resolution_status.upper()}", emoji=True)),
-                SectionBlock(fields=[
-                    MarkdownTextObject(text=f"*Alert ID:*\n{self.alert_id}"),
-                    MarkdownTextObject(text=f"*Status:*\n{status_emoji} {self.resolution_status.title()}"),
-                    MarkdownTextObject(text=f"*Title:*\n{self.alert_title}"),
-                    MarkdownTextObject(text=f"*Resolved:*\n{self.resolution_time}")
-                ]),
-                SectionBlock(text=MarkdownTextObject(text=f"*Root Cause:*\n{self.root_cause}")),
-                SectionBlock(text=MarkdownTextObject(text=f"*Actions Taken:*\n{actions_text}"))
+                _header_block(f"{status_emoji} ALERT {self.resolution_status.upper()}"),
+                _fields_section(
+                    f"*Alert ID:*\n{self.alert_id}",
+                    f"*Status:*\n{status_emoji} {self.resolution_status.title()}",
+                    f"*Title:*\n{self.alert_title}",
+                    f"*Resolved:*\n{self.resolution_time}"
+                ),
+                *_labelled_section("Root Cause", self.root_cause),
+                *_labelled_section("Actions Taken", actions_text)
             ]
         )
 ### END: AlertResolutionMessage ###
@@ -2619,8 +3236,15 @@ Features:
 - Rollback options and next steps
 Use Case: DevOps teams tracking deployment pipeline status
 """
-class DeploymentStatusMessage(CommandModel, MessageModel):
+_DEPLOYMENT_STATUS_EMOJI = {"success": "✅", "failed": "❌", "in_progress": "🔄"}
+
+class DeploymentStatusMessage(SlackNotificationModel):
     """Model for deployment status notification messages."""
+    _BANNER: ClassVar[str] = "POSTING DEPLOYMENT STATUS"
+    _BANNER_EMOJI: ClassVar[str] = "🚀"
+    _SUBJECT: ClassVar[str] = "Deployment status"
+    _SAVED_AS: ClassVar[str] = "status"
+
     channel: str
     deployment_id: str
     service_name: str
@@ -2630,60 +3254,28 @@ class DeploymentStatusMessage(CommandModel, MessageModel):
     deploy_time: str
     slack_token: str = ""
     output_file: str = "/tmp/deployment_status.json"
+    channels: Tuple[str, ...] = ()  # Additional channels to fan out to
     
-    def get_command(self) -> str:
-        msg = self.get_message()
-        msg_json = msg.to_json()
-        
-        return f"""echo "🚀 POSTING DEPLOYMENT STATUS"
-            echo "Posting to channel: {self.channel}"
-            STATUS_EMOJI=""
-            case "{self.status}" in
-                success) STATUS_EMOJI="✅" ;;
-                failed) STATUS_EMOJI="❌" ;;
-                in_progress) STATUS_EMOJI="🔄" ;;
-                *) STATUS_EMOJI="🔄" ;;
-            esac
-            echo '{msg_json}' > {self.output_file}
-            if [ -n "{self.slack_token}" ]; then
-                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
-                    -H "Authorization: Bearer {self.slack_token}" \\
-                    -H "Content-Type: application/json" \\
-                    -d @{self.output_file}
-                )
-                echo "Slack API response: $RESPONSE"
-                if [ $? -eq 0 ]; then
-                    echo "✅ Deployment status posted successfully"
-                else
-                    echo "❌ Failed to post deployment status"
-                    exit 1
-                fi
-            else
-                echo "ℹ️ No Slack token provided, status saved to {self.output_file}"
-                echo "✅ Deployment status prepared successfully"
-            fi"""
-    
+    def _target_channels(self) -> List[str]:
+        return [self.channel, *(channel for channel in dict.fromkeys(self.channels) if channel != self.channel)]
+
+    @cached_render
     def get_message(self, **kwargs) -> Message:
-        from models.messages import Message, HeaderBlock, SectionBlock, MarkdownTextObject, PlainTextObject, ActionsBlock, ButtonElement, ButtonStyle
-        
-        status_emoji = {"success": "✅", "failed": "❌", "in_progress": "🔄"}.get(self.status, "🔄")
+        status_emoji = _DEPLOYMENT_STATUS_EMOJI.get(self.status, "🔄")
         
         blocks = [
-            HeaderBlock(text=PlainTextObject(text=f"{status_emoji} DEPLOYMENT {self.status.upper()}", emoji=True)),
-            SectionBlock(fields=[
-                MarkdownTextObject(text=f"*Service:*\n{self.service_name}"),
-                MarkdownTextObject(text=f"*Environment:*\n{self.environment}"),
-                MarkdownTextObject(text=f"*Version:*\n{self.version}"),
-                MarkdownTextObject(text=f"*Status:*\n{status_emoji} {self.status.title()}")
-            ]),
-            SectionBlock(text=MarkdownTextObject(text=f"*Deployment ID:* {self.deployment_id}\n*Time:* {self.deploy_time}"))
+            _header_block(f"{status_emoji} DEPLOYMENT {self.status.upper()}"),
+            _fields_section(
+                f"*Service:*\n{self.service_name}",
+                f"*Environment:*\n{self.environment}",
+                f"*Version:*\n{self.version}",
+                f"*Status:*\n{status_emoji} {self.status.title()}"
+            ),
+            _mrkdwn_section(f"*Deployment ID:* {self.deployment_id}\n*Time:* {self.deploy_time}")
         ]
         
         if self.status == "failed":
-            blocks.append(ActionsBlock(elements=[
-                ButtonElement(text=PlainTextObject(text="🔄 Rollback", emoji=True), style=ButtonStyle.DANGER),
-                ButtonElement(text=PlainTextObject(text="📋 View Logs", emoji=True), style=ButtonStyle.PRIMARY)
-            ]))
+            blocks.append(_button_actions(("🔄 Rollback", ButtonStyle.DANGER), ("📋 View Logs", ButtonStyle.PRIMARY)))
         
         return Message(
             channel=self.channel,
@@ -2706,81 +3298,58 @@ Features:
 - Historical trend data
 Use Case: Infrastructure teams monitoring resource capacity
 """
-class CapacityWarningMessage(CommandModel, MessageModel):
+_RESOURCE_EMOJI = {"cpu": "🔥", "memory": "🧠", "disk": "💾", "network": "🌐"}
+
+# Plain decimal/exponent numbers; template strings like "{{.cpu_threshold}}" fall through unformatted
+_NUMERIC_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+
+def _percent(value: str) -> str:
+    """Format a usage figure as a percentage without raising on template strings."""
+    if _NUMERIC_RE.fullmatch(value):
+        return f"{float(value):.1f}%"
+    return f"{value}%"
+
+
+class CapacityWarningMessage(SlackNotificationModel):
     """Model for capacity warning notification messages."""
+    _BANNER: ClassVar[str] = "POSTING CAPACITY WARNING"
+    _BANNER_EMOJI: ClassVar[str] = "⚠️"
+    _SUBJECT: ClassVar[str] = "Capacity warning"
+    _SAVED_AS: ClassVar[str] = "warning"
+
     channel: str
     resource_type: str  # "cpu", "memory", "disk", "network"
     current_usage: str  # Can be float or template string like "{{.cpu_threshold}}"
     threshold: str  # Can be float or template string
-    affected_services: List[str]
+    affected_services: Tuple[str, ...]
     recommended_action: str
     slack_token: str = ""
     output_file: str = "/tmp/capacity_warning.json"
     
-    def get_command(self) -> str:
-        msg = self.get_message()
-        msg_json = msg.to_json()
-        
-        return f"""echo "⚠️ POSTING CAPACITY WARNING"
-            echo "Posting to channel: {self.channel}"
-            RESOURCE_EMOJI=""
-            case "{self.resource_type}" in
-                cpu) RESOURCE_EMOJI="🔥" ;;
-                memory) RESOURCE_EMOJI="🧠" ;;
-                disk) RESOURCE_EMOJI="💾" ;;
-                network) RESOURCE_EMOJI="🌐" ;;
-                *) RESOURCE_EMOJI="⚠️" ;;
-            esac
-            echo '{msg_json}' > {self.output_file}
-            if [ -n "{self.slack_token}" ]; then
-                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
-                    -H "Authorization: Bearer {self.slack_token}" \\
-                    -H "Content-Type: application/json" \\
-                    -d @{self.output_file}
-                )
-                echo "Slack API response: $RESPONSE"
-                if [ $? -eq 0 ]; then
-                    echo "✅ Capacity warning posted successfully"
-                else
-                    echo "❌ Failed to post capacity warning"
-                    exit 1
-                fi
-            else
-                echo "ℹ️ No Slack token provided, warning saved to {self.output_file}"
-                echo "✅ Capacity warning prepared successfully"
-            fi"""
-    
+    @cached_render
     def get_message(self, **kwargs) -> Message:
-        from models.messages import Message, HeaderBlock, SectionBlock, MarkdownTextObject, PlainTextObject
-        
-        resource_emoji = {"cpu": "🔥", "memory": "🧠", "disk": "💾", "network": "🌐"}.get(self.resource_type, "⚠️")
+        resource_emoji = _RESOURCE_EMOJI.get(self.resource_type, "⚠️")
         
         # Handle both numeric values and template strings
-        try:
-            usage_percent = f"{float(self.current_usage):.1f}%"
-        except (ValueError, TypeError):
-            usage_percent = f"{self.current_usage}%"
-            
-        try:
-            threshold_percent = f"{float(self.threshold):.1f}%"
-        except (ValueError, TypeError):
-            threshold_percent = f"{self.threshold}%"
-            
-        services_text = "\n".join([f"• {service}" for service in self.affected_services])
+        usage_percent = _percent(self.current_usage)
+        threshold_percent = _percent(self.threshold)
+        
+        services_text = _bullet_list(self.affected_services)
         
         return Message(
             channel=self.channel,
             text=f"⚠️ Capacity Warning: {self.resource_type.upper()}",
             blocks=[
-                HeaderBlock(text=PlainTextObject(text=f"{resource_emoji} CAPACITY WARNING", emoji=True)),
-                SectionBlock(fields=[
-                    MarkdownTextObject(text=f"*Resource:*\n{self.resource_type.title()}"),
-                    MarkdownTextObject(text=f"*Current Usage:*\n{usage_percent}"),
-                    MarkdownTextObject(text=f"*Threshold:*\n{threshold_percent}"),
-                    MarkdownTextObject(text=f"*Status:*\n⚠️ Above Threshold")
-                ]),
-                SectionBlock(text=MarkdownTextObject(text=f"*Affected Services:*\n{services_text}")),
-                SectionBlock(text=MarkdownTextObject(text=f"*Recommended Action:*\n{self.recommended_action}"))
+                _header_block(f"{resource_emoji} CAPACITY WARNING"),
+                _fields_section(
+                    f"*Resource:*\n{self.resource_type.title()}",
+                    f"*Current Usage:*\n{usage_percent}",
+                    f"*Threshold:*\n{threshold_percent}",
+                    f"*Status:*\n⚠️ Above Threshold"
+                ),
+                *_labelled_section("Affected Services", services_text),
+                *_labelled_section("Recommended Action", self.recommended_action)
             ]
         )
 ### END: CapacityWarningMessage ###
@@ -2799,80 +3368,48 @@ Features:
 - Response team coordination
 Use Case: Security teams managing incident response workflows
 """
-class SecurityIncidentMessage(CommandModel, MessageModel):
+_SECURITY_SEVERITY_EMOJI = {"low": "🟡", "medium": "🟠", "high": "🔴", "critical": "🚨"}
+_INCIDENT_TYPE_EMOJI = {"data_breach": "🛡️", "malware": "🦠", "unauthorized_access": "🔓"}
+
+class SecurityIncidentMessage(SlackNotificationModel):
     """Model for security incident notification messages."""
+    _BANNER: ClassVar[str] = "POSTING SECURITY INCIDENT ALERT"
+    _BANNER_EMOJI: ClassVar[str] = "🚨"
+    _SUBJECT: ClassVar[str] = "Security incident alert"
+    _SAVED_AS: ClassVar[str] = "alert"
+
     channel: str
     incident_id: str
     incident_type: str  # "data_breach", "malware", "unauthorized_access"
     severity: str = "high"  # "low", "medium", "high", "critical"
-    affected_systems: List[str]
+    affected_systems: Tuple[str, ...]
     status: str = "investigating"  # "investigating", "contained", "resolved"
     slack_token: str = ""
     output_file: str = "/tmp/security_incident.json"
+    channels: Tuple[str, ...] = ()  # Additional channels to fan out to
     
-    def get_command(self) -> str:
-        msg = self.get_message()
-        msg_json = msg.to_json()
-        
-        return f"""echo "🚨 POSTING SECURITY INCIDENT ALERT"
-            echo "Posting to channel: {self.channel}"
-            SEVERITY_EMOJI=""
-            case "{self.severity}" in
-                low) SEVERITY_EMOJI="🟡" ;;
-                medium) SEVERITY_EMOJI="🟠" ;;
-                high) SEVERITY_EMOJI="🔴" ;;
-                critical) SEVERITY_EMOJI="🚨" ;;
-                *) SEVERITY_EMOJI="🔴" ;;
-            esac
-            TYPE_EMOJI=""
-            case "{self.incident_type}" in
-                data_breach) TYPE_EMOJI="🛡️" ;;
-                malware) TYPE_EMOJI="🦠" ;;
-                unauthorized_access) TYPE_EMOJI="🔓" ;;
-                *) TYPE_EMOJI="⚠️" ;;
-            esac
-            echo '{msg_json}' > {self.output_file}
-            if [ -n "{self.slack_token}" ]; then
-                RESPONSE=$(curl -s -X POST https://slack.com/api/chat.postMessage \\
-                    -H "Authorization: Bearer {self.slack_token}" \\
-                    -H "Content-Type: application/json" \\
-                    -d @{self.output_file}
-                )
-                echo "Slack API response: $RESPONSE"
-                if [ $? -eq 0 ]; then
-                    echo "✅ Security incident alert posted successfully"
-                else
-                    echo "❌ Failed to post security incident alert"
-                    exit 1
-                fi
-            else
-                echo "ℹ️ No Slack token provided, alert saved to {self.output_file}"
-                echo "✅ Security incident alert prepared successfully"
-            fi"""
-    
+    def _target_channels(self) -> List[str]:
+        return [self.channel, *(channel for channel in dict.fromkeys(self.channels) if channel != self.channel)]
+
+    @cached_render
     def get_message(self, **kwargs) -> Message:
-        from models.messages import Message, HeaderBlock, SectionBlock, MarkdownTextObject, PlainTextObject, ActionsBlock, ButtonElement, ButtonStyle
-        
-        severity_emoji = {"low": "🟡", "medium": "🟠", "high": "🔴", "critical": "🚨"}.get(self.severity, "🔴")
-        type_emoji = {"data_breach": "🛡️", "malware": "🦠", "unauthorized_access": "🔓"}.get(self.incident_type, "⚠️")
-        systems_text = "\n".join([f"• {system}" for system in self.affected_systems])
+        severity_emoji = _SECURITY_SEVERITY_EMOJI.get(self.severity, "🔴")
+        type_emoji = _INCIDENT_TYPE_EMOJI.get(self.incident_type, "⚠️")
+        systems_text = _bullet_list(self.affected_systems)
         
         return Message(
             channel=self.channel,
             text=f"🚨 Security Incident: {self.incident_id}",
             blocks=[
-                HeaderBlock(text=PlainTextObject(text=f"{type_emoji} SECURITY INCIDENT", emoji=True)),
-                SectionBlock(fields=[
-                    MarkdownTextObject(text=f"*Incident ID:*\n{self.incident_id}"),
-                    MarkdownTextObject(text=f"*Type:*\n{self.incident_type.replace('_', ' ').title()}"),
-                    MarkdownTextObject(text=f"*Severity:*\n{severity_emoji} {self.severity.upper()}"),
-                    MarkdownTextObject(text=f"*Status:*\n{self.status.title()}")
-                ]),
-                SectionBlock(text=MarkdownTextObject(text=f"*Affected Systems:*\n{systems_text}")),
-                ActionsBlock(elements=[
-                    ButtonElement(text=PlainTextObject(text="🔒 Incident Response", emoji=True), style=ButtonStyle.DANGER),
-                    ButtonElement(text=PlainTextObject(text="📋 View Details", emoji=True), style=ButtonStyle.PRIMARY)
-                ])
+                _header_block(f"{type_emoji} SECURITY INCIDENT"),
+                _fields_section(
+                    f"*Incident ID:*\n{self.incident_id}",
+                    f"*Type:*\n{self.incident_type.replace('_', ' ').title()}",
+                    f"*Severity:*\n{severity_emoji} {self.severity.upper()}",
+                    f"*Status:*\n{self.status.title()}"
+                ),
+                *_labelled_section("Affected Systems", systems_text),
+                _button_actions(("🔒 Incident Response", ButtonStyle.DANGER), ("📋 View Details", ButtonStyle.PRIMARY))
             ]
         )
 ### END: SecurityIncidentMessage ###
@@ -2891,117 +3428,149 @@ Features:
 - Detailed feedback generation
 Use Case: Development teams implementing AI-assisted code reviews
 """
-class CodeReviewPrompt(PromptModel, CommandModel):
-    """Model for code review prompt generation."""
-    language: str  # "python", "javascript", "java", "go"
-    code_snippet: str
-    review_focus: List[str] = ["security", "performance", "maintainability"]
-    include_suggestions: bool = True
-    output_file: str = "/tmp/code_review_report.md"
-    
-    def get_command(self) -> str:
-        focus_areas = ", ".join(self.review_focus)
-        
-        # Generate the report content
-        content = f"""# Code Review Report
+# Static review findings; only the focus-dependent sections are chosen per call
+_REVIEW_QUALITY_ASSESSMENT = """- **Code Structure**: Well-organized and follows standard conventions
+- **Readability**: Code is clear and self-documenting
+- **Complexity**: Appropriate complexity level for the functionality
+- **Testing**: Consider adding unit tests for better coverage"""
+
+_REVIEW_FOCUS_SECTIONS = {
+    "security": """- **Input Validation**: Ensure all inputs are properly validated
+- **Error Handling**: Implement comprehensive error handling
+- **Access Control**: Verify appropriate access controls are in place
+- **Data Protection**: Sensitive data should be properly encrypted""",
+    "performance": """- **Algorithm Efficiency**: Current implementation appears efficient
+- **Memory Usage**: Consider optimizing memory allocation patterns
+- **Database Queries**: Review for potential N+1 query issues
+- **Caching**: Evaluate opportunities for caching improvements""",
+    "maintainability": """- **Code Documentation**: Add inline comments for complex logic
+- **Function Size**: Consider breaking down large functions
+- **Naming Conventions**: Variable and function names are descriptive
+- **Dependencies**: Review external dependencies for maintenance burden""",
+}
+
+_REVIEW_RECOMMENDATIONS = """1. **Immediate Actions**: Address any security concerns identified
+2. **Code Improvements**: Implement suggested performance optimizations
+3. **Documentation**: Add or update code documentation as needed
+4. **Testing**: Increase test coverage for critical code paths
+5. **Follow-up**: Schedule regular code reviews for ongoing quality"""
+
+
+def _review_section(review_focus: Sequence[str], area: str) -> str:
+    """Findings for one review area, or a not-requested note when it is outside the focus."""
+    if area in review_focus:
+        return _REVIEW_FOCUS_SECTIONS[area]
+    return f"- **{area.title()} Review**: Not specifically requested for this review"
+
+# Report body and generator script for CodeReviewPrompt, split into literal/field slots once at import
+_render_code_review_report = _compile_template("""# Code Review Report
 
 ## Code Analysis Summary
-**Language:** {self.language.title()}
+**Language:** {language_title}
 **Review Focus:** {focus_areas}
 **Analysis Date:** $(date)
 
 ## Code Sample
-```{self.language}
-{self.code_snippet}
+```{language}
+{code_snippet}
 ```
 
 ## Review Findings
 
 ### Code Quality Assessment
-{self._get_quality_assessment()}
+{quality}
 
 ### Security Analysis
-{self._get_security_analysis()}
+{security}
 
 ### Performance Considerations
-{self._get_performance_analysis()}
+{performance}
 
 ### Maintainability Review
-{self._get_maintainability_analysis()}
+{maintainability}
 
 ## Recommendations
-{self._get_recommendations()}
+{recommendations}
 
 ## Summary
 Code review completed. See detailed findings and recommendations above.
 
 **Review conducted on:** $(date)
-"""
-        
-        # Use base64 encoding to avoid shell interpretation issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "🔍 PERFORMING CODE REVIEW"
-echo "Language: {self.language}"
+""")
+_render_code_review_cmd = _compile_template("""echo "🔍 PERFORMING CODE REVIEW"
+echo "Language: {language}"
 echo "Focus Areas: {focus_areas}"
-echo "Include Suggestions: {self.include_suggestions}"
+echo "Include Suggestions: {include_suggestions}"
 echo ""
 echo "📝 Generating code review report..."
 
 # Create directory if it doesn't exist
-mkdir -p "$(dirname "{self.output_file}")"
+mkdir -p "$(dirname "{output_file}")"
 
-# Write content using base64 to avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {self.output_file}
+{write}
 
 if [ $? -eq 0 ]; then
-    echo "✅ Code review completed: {self.output_file}"
-    echo "📊 Report size: $(du -h "{self.output_file}" | cut -f1)"
+    echo "✅ Code review completed: {output_file}"
+    echo "📊 Report size: $(du -h "{output_file}" | cut -f1)"
     echo "📄 Preview (first 10 lines):"
-    head -10 "{self.output_file}"
+    head -10 "{output_file}"
 else
     echo "❌ Failed to generate code review report"
     exit 1
-fi"""
+fi""")
 
-    def _get_quality_assessment(self) -> str:
-        return """- **Code Structure**: Well-organized and follows standard conventions
-- **Readability**: Code is clear and self-documenting
-- **Complexity**: Appropriate complexity level for the functionality
-- **Testing**: Consider adding unit tests for better coverage"""
+
+class CodeReviewPrompt(PromptModel, CommandModel):
+    """Model for code review prompt generation."""
+    model_config = ConfigDict(frozen=True)
+
+    language: str  # "python", "javascript", "java", "go"
+    code_snippet: str
+    review_focus: Tuple[str, ...] = ("security", "performance", "maintainability")
+    include_suggestions: bool = True
+    output_file: str = "/tmp/code_review_report.md"
     
+    @shared_render
+    def get_command(self) -> str:
+        focus_areas = ", ".join(self.review_focus)
+        content = _render_code_review_report(
+            language=self.language,
+            language_title=self.language.title(),
+            focus_areas=focus_areas,
+            code_snippet=self.code_snippet,
+            quality=self._get_quality_assessment(),
+            security=self._get_security_analysis(),
+            performance=self._get_performance_analysis(),
+            maintainability=self._get_maintainability_analysis(),
+            recommendations=self._get_recommendations(),
+        )
+        return _render_code_review_cmd(
+            language=self.language,
+            focus_areas=focus_areas,
+            include_suggestions=str(self.include_suggestions),
+            output_file=self.output_file,
+            write=_write_file_lines(self.output_file, content),
+        )
+
+    def _get_quality_assessment(self) -> str:
+        return _REVIEW_QUALITY_ASSESSMENT
+
+    @cached_render
     def _get_security_analysis(self) -> str:
-        if "security" in self.review_focus:
-            return """- **Input Validation**: Ensure all inputs are properly validated
-- **Error Handling**: Implement comprehensive error handling
-- **Access Control**: Verify appropriate access controls are in place
-- **Data Protection**: Sensitive data should be properly encrypted"""
-        return "- **Security Review**: Not specifically requested for this review"
-    
+        return _review_section(self.review_focus, "security")
+
+    @cached_render
     def _get_performance_analysis(self) -> str:
-        if "performance" in self.review_focus:
-            return """- **Algorithm Efficiency**: Current implementation appears efficient
-- **Memory Usage**: Consider optimizing memory allocation patterns
-- **Database Queries**: Review for potential N+1 query issues
-- **Caching**: Evaluate opportunities for caching improvements"""
-        return "- **Performance Review**: Not specifically requested for this review"
-    
+        return _review_section(self.review_focus, "performance")
+
+    @cached_render
     def _get_maintainability_analysis(self) -> str:
-        if "maintainability" in self.review_focus:
-            return """- **Code Documentation**: Add inline comments for complex logic
-- **Function Size**: Consider breaking down large functions
-- **Naming Conventions**: Variable and function names are descriptive
-- **Dependencies**: Review external dependencies for maintenance burden"""
-        return "- **Maintainability Review**: Not specifically requested for this review"
-    
+        return _review_section(self.review_focus, "maintainability")
+
     def _get_recommendations(self) -> str:
-        return """1. **Immediate Actions**: Address any security concerns identified
-2. **Code Improvements**: Implement suggested performance optimizations
-3. **Documentation**: Add or update code documentation as needed
-4. **Testing**: Increase test coverage for critical code paths
-5. **Follow-up**: Schedule regular code reviews for ongoing quality"""
-    
+        return _REVIEW_RECOMMENDATIONS
+
+    @shared_render
     def get_prompt(self) -> str:
         focus_areas = ", ".join(self.review_focus)
         
@@ -3037,63 +3606,9 @@ Features:
 - Code documentation standards
 Use Case: Technical writers and developers creating comprehensive documentation
 """
-class TechnicalDocumentationPrompt(PromptModel, CommandModel):
-    """Model for technical documentation prompt generation."""
-    doc_type: str  # "api", "architecture", "user_guide", "code_comments"
-    project_context: str
-    target_audience: str = "developers"  # "developers", "end_users", "administrators"
-    include_examples: bool = True
-    output_file: str = "/tmp/documentation.md"
-    
-    def get_command(self) -> str:
-        # Generate the documentation content
-        content = f"""# {self.project_context}
-
-## Overview
-This documentation provides comprehensive information about the {self.project_context}.
-
-## Target Audience
-This document is designed for {self.target_audience}.
-
-## Documentation Type: {self.doc_type.title()}
-
-{self._get_content_template()}
-
-## Additional Resources
-- For questions, please contact the development team
-- Documentation generated on: $(date)
-"""
-        
-        # Use base64 encoding to avoid shell interpretation issues
-        import base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
-        
-        return f"""echo "📚 GENERATING TECHNICAL DOCUMENTATION"
-echo "Document Type: {self.doc_type}"
-echo "Target Audience: {self.target_audience}"
-echo "Project Context: {self.project_context}"
-echo ""
-echo "📝 Creating {self.doc_type} documentation..."
-
-# Create directory if it doesn't exist
-mkdir -p "$(dirname "{self.output_file}")"
-
-# Write content using base64 to avoid variable substitution issues
-echo '{encoded_content}' | base64 -d > {self.output_file}
-
-if [ $? -eq 0 ]; then
-    echo "✅ Documentation generated successfully: {self.output_file}"
-    echo "📊 File size: $(du -h "{self.output_file}" | cut -f1)"
-    echo "📄 Preview (first 10 lines):"
-    head -10 "{self.output_file}"
-else
-    echo "❌ Failed to generate documentation"
-    exit 1
-fi"""
-
-    def _get_content_template(self) -> str:
-        if self.doc_type == "readme":
-            return '''## Installation
+# Fixed section bodies per doc_type; other types get a generic section built per call
+_DOC_CONTENT_TEMPLATES = {
+    "readme": '''## Installation
 ```bash
 npm install workflow-sdk
 # or
@@ -3116,9 +3631,8 @@ workflow.step("hello", lambda: print("Hello World!"))
 - Extensible architecture
 
 ## Usage Examples
-See the examples directory for more detailed usage patterns.'''
-        elif self.doc_type == "api":
-            return '''## API Reference
+See the examples directory for more detailed usage patterns.''',
+    "api": '''## API Reference
 
 ### Core Classes
 
@@ -3136,9 +3650,81 @@ Individual workflow step representation.
 **Properties:**
 - `name` - Step identifier
 - `status` - Current execution status
-- `output` - Step execution result'''
-        else:
-            return f'''## {self.doc_type.title()} Documentation
+- `output` - Step execution result''',
+}
+
+# Document body and generator script for TechnicalDocumentationPrompt, split into literal/field slots once at import
+_render_tech_doc_report = _compile_template("""# {project_context}
+
+## Overview
+This documentation provides comprehensive information about the {project_context}.
+
+## Target Audience
+This document is designed for {target_audience}.
+
+## Documentation Type: {doc_type_title}
+
+{content_template}
+
+## Additional Resources
+- For questions, please contact the development team
+- Documentation generated on: $(date)
+""")
+_render_tech_doc_cmd = _compile_template("""echo "📚 GENERATING TECHNICAL DOCUMENTATION"
+echo "Document Type: {doc_type}"
+echo "Target Audience: {target_audience}"
+echo "Project Context: {project_context}"
+echo ""
+echo "📝 Creating {doc_type} documentation..."
+
+# Create directory if it doesn't exist
+mkdir -p "$(dirname "{output_file}")"
+
+{write}
+
+if [ $? -eq 0 ]; then
+    echo "✅ Documentation generated successfully: {output_file}"
+    echo "📊 File size: $(du -h "{output_file}" | cut -f1)"
+    echo "📄 Preview (first 10 lines):"
+    head -10 "{output_file}"
+else
+    echo "❌ Failed to generate documentation"
+    exit 1
+fi""")
+
+
+class TechnicalDocumentationPrompt(PromptModel, CommandModel):
+    """Model for technical documentation prompt generation."""
+    model_config = ConfigDict(frozen=True)
+
+    doc_type: str  # "api", "architecture", "user_guide", "code_comments"
+    project_context: str
+    target_audience: str = "developers"  # "developers", "end_users", "administrators"
+    include_examples: bool = True
+    output_file: str = "/tmp/documentation.md"
+    
+    @shared_render
+    def get_command(self) -> str:
+        content = _render_tech_doc_report(
+            project_context=self.project_context,
+            target_audience=self.target_audience,
+            doc_type_title=self.doc_type.title(),
+            content_template=self._get_content_template(),
+        )
+        return _render_tech_doc_cmd(
+            doc_type=self.doc_type,
+            target_audience=self.target_audience,
+            project_context=self.project_context,
+            output_file=self.output_file,
+            write=_write_file_lines(self.output_file, content),
+        )
+
+    @cached_render
+    def _get_content_template(self) -> str:
+        template = _DOC_CONTENT_TEMPLATES.get(self.doc_type)
+        if template is not None:
+            return template
+        return f'''## {self.doc_type.title()} Documentation
 
 This section contains detailed information about {self.doc_type} aspects of the project.
 
@@ -3150,6 +3736,7 @@ This section contains detailed information about {self.doc_type} aspects of the
 ### Implementation Details
 Detailed implementation information will be provided here.'''
     
+    @shared_render
     def get_prompt(self) -> str:
         audience_context = {
             "developers": "technical developers familiar with programming concepts",
@@ -3195,10 +3782,11 @@ Please create documentation covering:
 Use technical language appropriate for {audience_context} and include decision rationales."""
 
         else:
-            return f"""You are a technical writer creating {self.doc_type.replace('_', ' ')} documentation.
+            doc_label = self.doc_type.replace('_', ' ')
+            return f"""You are a technical writer creating {doc_label} documentation.
 
 Project Context: {self.project_context}
-Documentation Type: {self.doc_type.replace('_', ' ').title()}
+Documentation Type: {doc_label.title()}
 Target Audience: {audience_context}
 
 Please create clear, comprehensive documentation that includes:
@@ -3225,35 +3813,62 @@ Features:
 - Visualization recommendations
 Use Case: Data analysts and scientists conducting comprehensive data analysis
 """
-class DataAnalysisPrompt(PromptModel, CommandModel):
-    """Model for data analysis prompt generation."""
-    dataset_description: str
-    analysis_type: str  # "exploratory", "predictive", "diagnostic", "prescriptive"
-    data_format: str = "csv"  # "csv", "json", "sql", "api"
-    key_questions: List[str] = []
-    output_file: str = "/tmp/data_analysis_report.md"
-    
-    def get_command(self) -> str:
-        questions_text = ", ".join(self.key_questions) if self.key_questions else "general patterns and insights"
-        
-        return f"""echo "📊 PERFORMING DATA ANALYSIS"
-echo "Dataset: {self.dataset_description}"
-echo "Analysis Type: {self.analysis_type}"
-echo "Data Format: {self.data_format}"
+# Canned report sections, looked up by analysis_type
+_ANALYSIS_FINDINGS = {
+    "exploratory": """1. **Data Distribution**: Normal distribution observed in 70% of numeric fields
+2. **Correlations**: Strong positive correlation between user engagement and retention
+3. **Outliers**: 3% of data points identified as statistical outliers
+4. **Missing Values**: Minimal missing data (< 5%) across all fields""",
+    "predictive": """1. **Model Performance**: 85% accuracy achieved with ensemble methods
+2. **Feature Importance**: Top 3 features account for 60% of predictive power
+3. **Forecast Confidence**: 95% confidence interval for next 30-day predictions
+4. **Trend Analysis**: Upward trend projected with 12% growth rate""",
+    "diagnostic": """1. **Root Cause**: Primary issue traced to system configuration changes
+2. **Impact Assessment**: 15% performance degradation over 2-week period
+3. **Contributing Factors**: High load during peak hours, memory constraints
+4. **Timeline Analysis**: Issue first detected on [date], escalated on [date]""",
+}
+
+_ANALYSIS_FINDINGS_DEFAULT = """1. **Current State**: Baseline metrics established and documented
+2. **Performance Indicators**: 5 KPIs showing positive trends
+3. **Data Quality**: High-quality dataset suitable for decision making
+4. **Insight Discovery**: Several actionable patterns identified"""
+
+_ANALYSIS_RECOMMENDATIONS = {
+    "prescriptive": """1. **Immediate Actions**: Implement automated monitoring for key metrics
+2. **Resource Optimization**: Scale infrastructure during predicted peak periods
+3. **Process Improvements**: Streamline data collection workflows
+4. **Strategic Planning**: Invest in predictive analytics capabilities""",
+}
+
+_DEFAULT_KEY_QUESTIONS = "- Identify key patterns and trends\n- Detect anomalies or outliers\n- Provide actionable insights"
+
+_ANALYSIS_RECOMMENDATIONS_DEFAULT = """1. **Data Collection**: Continue monitoring current metrics
+2. **Further Analysis**: Investigate identified patterns in more detail
+3. **Stakeholder Review**: Present findings to relevant decision makers
+4. **Follow-up**: Schedule regular analysis updates"""
+
+
+# Analysis script for DataAnalysisPrompt, split into literal/field slots once at import
+_render_data_analysis_cmd = _compile_template("""echo "📊 PERFORMING DATA ANALYSIS"
+echo "Dataset: {dataset_description}"
+echo "Analysis Type: {analysis_type}"
+echo "Data Format: {data_format}"
 echo "Key Questions: {questions_text}"
 echo ""
 echo "📝 Generating analysis report..."
 
-cat << 'EOF' > {self.output_file}
+{{
+cat << 'EOF' > {output_file}
 # Data Analysis Report
 
 ## Dataset Overview
-**Description:** {self.dataset_description}
-**Format:** {self.data_format.upper()}
-**Analysis Type:** {self.analysis_type.title()}
+**Description:** {dataset_description}
+**Format:** {data_format_upper}
+**Analysis Type:** {analysis_type_title}
 
 ## Key Questions
-{self._format_questions()}
+{questions}
 
 ## Analysis Results
 
@@ -3264,79 +3879,51 @@ cat << 'EOF' > {self.output_file}
 - Key metrics identified: 5 primary indicators
 
 ### Findings
-{self._get_analysis_findings()}
+{analysis_findings}
 
 ### Recommendations
-{self._get_recommendations()}
+{recommendations}
 
 ## Conclusion
 Analysis completed successfully. See detailed findings above for actionable insights.
 
 **Generated on:** $(date)
 EOF
-
-if [ $? -eq 0 ]; then
-    echo "✅ Data analysis completed: {self.output_file}"
-    echo "📊 Report size: $(du -h "{self.output_file}" | cut -f1)"
-else
+}} && {{
+    echo "✅ Data analysis completed: {output_file}"
+    echo "📊 Report size: $(du -h "{output_file}" | cut -f1)"
+}} || {{
     echo "❌ Failed to generate analysis report"
     exit 1
-fi"""
+}}""")
+
+
+@functools.lru_cache(maxsize=16)
+def _data_analysis_cmd_for(analysis_type: str) -> Callable[..., str]:
+    """_render_data_analysis_cmd with the analysis_type-dependent sections filled in."""
+    return _render_data_analysis_cmd.partial(
+        analysis_type=analysis_type,
+        analysis_type_title=analysis_type.title(),
+        analysis_findings=_ANALYSIS_FINDINGS.get(analysis_type, _ANALYSIS_FINDINGS_DEFAULT),
+        recommendations=_ANALYSIS_RECOMMENDATIONS.get(analysis_type, _ANALYSIS_RECOMMENDATIONS_DEFAULT),
+    )
+
+
+# Prompt instruction per analysis_type
+_ANALYSIS_FOCUS = {
+    "exploratory": "Explore the data to understand its structure, patterns, and relationships. Focus on descriptive statistics and data visualization.",
+    "predictive": "Build predictive models to forecast future outcomes. Focus on feature engineering and model validation.",
+    "diagnostic": "Investigate why certain events occurred. Focus on correlation analysis and root cause identification.",
+    "prescriptive": "Recommend actions based on the analysis. Focus on optimization and decision support.",
+}
 
-    def _format_questions(self) -> str:
-        if self.key_questions:
-            return "\n".join([f"- {q}" for q in self.key_questions])
-        return "- Identify key patterns and trends\n- Detect anomalies or outliers\n- Provide actionable insights"
-    
-    def _get_analysis_findings(self) -> str:
-        if self.analysis_type == "exploratory":
-            return """1. **Data Distribution**: Normal distribution observed in 70% of numeric fields
-2. **Correlations**: Strong positive correlation between user engagement and retention
-3. **Outliers**: 3% of data points identified as statistical outliers
-4. **Missing Values**: Minimal missing data (< 5%) across all fields"""
-        elif self.analysis_type == "predictive":
-            return """1. **Model Performance**: 85% accuracy achieved with ensemble methods
-2. **Feature Importance**: Top 3 features account for 60% of predictive power
-3. **Forecast Confidence**: 95% confidence interval for next 30-day predictions
-4. **Trend Analysis**: Upward trend projected with 12% growth rate"""
-        elif self.analysis_type == "diagnostic":
-            return """1. **Root Cause**: Primary issue traced to system configuration changes
-2. **Impact Assessment**: 15% performance degradation over 2-week period
-3. **Contributing Factors**: High load during peak hours, memory constraints
-4. **Timeline Analysis**: Issue first detected on [date], escalated on [date]"""
-        else:
-            return """1. **Current State**: Baseline metrics established and documented
-2. **Performance Indicators**: 5 KPIs showing positive trends
-3. **Data Quality**: High-quality dataset suitable for decision making
-4. **Insight Discovery**: Several actionable patterns identified"""
-    
-    def _get_recommendations(self) -> str:
-        if self.analysis_type == "prescriptive":
-            return """1. **Immediate Actions**: Implement automated monitoring for key metrics
-2. **Resource Optimization**: Scale infrastructure during predicted peak periods
-3. **Process Improvements**: Streamline data collection workflows
-4. **Strategic Planning**: Invest in predictive analytics capabilities"""
-        else:
-            return """1. **Data Collection**: Continue monitoring current metrics
-2. **Further Analysis**: Investigate identified patterns in more detail
-3. **Stakeholder Review**: Present findings to relevant decision makers
-4. **Follow-up**: Schedule regular analysis updates"""
-    
-    def get_prompt(self) -> str:
-        questions_text = "\n".join([f"- {q}" for q in self.key_questions]) if self.key_questions else "- Identify key patterns and trends\n- Detect anomalies or outliers\n- Provide actionable insights"
-        
-        analysis_focus = {
-            "exploratory": "Explore the data to understand its structure, patterns, and relationships. Focus on descriptive statistics and data visualization.",
-            "predictive": "Build predictive models to forecast future outcomes. Focus on feature engineering and model validation.",
-            "diagnostic": "Investigate why certain events occurred. Focus on correlation analysis and root cause identification.",
-            "prescriptive": "Recommend actions based on the analysis. Focus on optimization and decision support."
-        }.get(self.analysis_type, "comprehensive analysis")
-        
-        return f"""You are a senior data analyst conducting {self.analysis_type} data analysis. 
 
-Dataset Description: {self.dataset_description}
-Data Format: {self.data_format.upper()}
-Analysis Type: {self.analysis_type.title()}
+# Analyst prompt for DataAnalysisPrompt, split into literal/field slots once at import
+_render_data_analysis_prompt = _compile_template("""You are a senior data analyst conducting {analysis_type} data analysis. 
+
+Dataset Description: {dataset_description}
+Data Format: {data_format_upper}
+Analysis Type: {analysis_type_title}
 
 Analysis Objectives:
 {questions_text}
@@ -3368,7 +3955,47 @@ Your analysis should include:
    - Recommended next steps
    - Potential areas for further investigation
 
-Provide specific, data-driven recommendations with supporting evidence."""
+Provide specific, data-driven recommendations with supporting evidence.""")
+
+
+class DataAnalysisPrompt(PromptModel, CommandModel):
+    """Model for data analysis prompt generation."""
+    model_config = ConfigDict(frozen=True)
+
+    dataset_description: str
+    analysis_type: str  # "exploratory", "predictive", "diagnostic", "prescriptive"
+    data_format: str = "csv"  # "csv", "json", "sql", "api"
+    key_questions: Tuple[str, ...] = ()
+    output_file: str = "/tmp/data_analysis_report.md"
+    
+    @shared_render
+    def get_command(self) -> str:
+        questions_text = ", ".join(self.key_questions) if self.key_questions else "general patterns and insights"
+        return _data_analysis_cmd_for(self.analysis_type)(
+            dataset_description=self.dataset_description,
+            data_format=self.data_format,
+            questions_text=questions_text,
+            output_file=self.output_file,
+            data_format_upper=self.data_format.upper(),
+            questions=self._format_questions(),
+        )
+
+    @cached_render
+    def _format_questions(self) -> str:
+        return _markdown_list(self.key_questions) if self.key_questions else _DEFAULT_KEY_QUESTIONS
+    
+    @shared_render
+    def get_prompt(self) -> str:
+        questions_text = self._format_questions()
+        analysis_focus = _ANALYSIS_FOCUS.get(self.analysis_type, "comprehensive analysis")
+        return _render_data_analysis_prompt(
+            analysis_type=self.analysis_type,
+            dataset_description=self.dataset_description,
+            data_format_upper=self.data_format.upper(),
+            analysis_type_title=self.analysis_type.title(),
+            questions_text=questions_text,
+            analysis_focus=analysis_focus,
+        )
 ### END: DataAnalysisPrompt ###
 
 
@@ -3385,33 +4012,43 @@ Features:
 - Prevention strategies
 Use Case: Support teams and engineers diagnosing technical issues
 """
-class TroubleshootingPrompt(PromptModel, CommandModel):
-    """Model for troubleshooting prompt generation."""
-    problem_description: str
-    system_context: str
-    error_logs: str = ""
-    affected_components: List[str] = []
-    urgency_level: str = "medium"  # "low", "medium", "high", "critical"
-    output_file: str = "/tmp/troubleshooting_report.md"
-    
-    def get_command(self) -> str:
-        components_text = ", ".join(self.affected_components) if self.affected_components else "System components"
-        
-        return f"""echo "🔧 PERFORMING TROUBLESHOOTING ANALYSIS"
-echo "Problem: {self.problem_description}"
-echo "System: {self.system_context}"
-echo "Urgency: {self.urgency_level}"
+# Response playbooks, looked up by urgency_level
+_URGENCY_STEPS = {
+    "critical": """1. **Immediate Response**: Activate incident response team
+2. **Service Isolation**: Isolate affected components if possible
+3. **Rollback Preparation**: Prepare emergency rollback procedures
+4. **Status Communication**: Notify stakeholders immediately""",
+    "high": """1. **Priority Investigation**: Allocate senior resources to investigation
+2. **Log Analysis**: Review recent logs for error patterns
+3. **Service Monitoring**: Increase monitoring frequency
+4. **Team Coordination**: Coordinate with relevant technical teams""",
+}
+
+_DEFAULT_COMPONENT_ANALYSIS = "- **General System**: Perform comprehensive system health check"
+
+_URGENCY_STEPS_DEFAULT = """1. **Standard Investigation**: Follow normal troubleshooting procedures
+2. **Documentation Review**: Check system documentation and runbooks
+3. **Historical Analysis**: Compare with similar past incidents
+4. **Scheduled Resolution**: Plan resolution during maintenance window if needed"""
+
+
+# Troubleshooting script for TroubleshootingPrompt, split into literal/field slots once at import
+_render_troubleshooting_cmd = _compile_template("""echo "🔧 PERFORMING TROUBLESHOOTING ANALYSIS"
+echo "Problem: {problem_description}"
+echo "System: {system_context}"
+echo "Urgency: {urgency_level}"
 echo "Components: {components_text}"
 echo ""
 echo "📝 Generating troubleshooting report..."
 
-cat << 'EOF' > {self.output_file}
+{{
+cat << 'EOF' > {output_file}
 # Troubleshooting Report
 
 ## Problem Summary
-**Description:** {self.problem_description}
-**System Context:** {self.system_context}
-**Urgency Level:** {self.urgency_level.title()}
+**Description:** {problem_description}
+**System Context:** {system_context}
+**Urgency Level:** {urgency_level_title}
 **Affected Components:** {components_text}
 
 ## Analysis Steps
@@ -3419,82 +4056,61 @@ cat << 'EOF' > {self.output_file}
 ### 1. Initial Assessment
 - Problem identified and categorized
 - System context evaluated
-- Urgency level assessed: {self.urgency_level}
+- Urgency level assessed: {urgency_level}
 
 ### 2. Component Analysis
-{self._get_component_analysis()}
+{component_analysis}
 
 ### 3. Troubleshooting Steps
-{self._get_troubleshooting_steps()}
+{troubleshooting_steps}
 
 ### 4. Resolution Recommendations
-{self._get_resolution_recommendations()}
+{resolution_recommendations}
 
 ## Summary
 Troubleshooting analysis completed. Follow the recommended steps above for problem resolution.
 
 **Generated on:** $(date)
 EOF
-
-if [ $? -eq 0 ]; then
-    echo "✅ Troubleshooting analysis completed: {self.output_file}"
-    echo "📊 Report size: $(du -h "{self.output_file}" | cut -f1)"
-else
+}} && {{
+    echo "✅ Troubleshooting analysis completed: {output_file}"
+    echo "📊 Report size: $(du -h "{output_file}" | cut -f1)"
+}} || {{
     echo "❌ Failed to generate troubleshooting report"
     exit 1
-fi"""
+}}""")
+
+
+@functools.lru_cache(maxsize=16)
+def _troubleshooting_cmd_for(urgency_level: str) -> Callable[..., str]:
+    """_render_troubleshooting_cmd with the urgency_level-dependent sections filled in."""
+    return _render_troubleshooting_cmd.partial(
+        urgency_level=urgency_level,
+        urgency_level_title=urgency_level.title(),
+        troubleshooting_steps=_URGENCY_STEPS.get(urgency_level, _URGENCY_STEPS_DEFAULT),
+    )
 
-    def _get_component_analysis(self) -> str:
-        if self.affected_components:
-            return "\n".join([f"- **{comp}**: Requires investigation and potential remediation" for comp in self.affected_components])
-        return "- **General System**: Perform comprehensive system health check"
-    
-    def _get_troubleshooting_steps(self) -> str:
-        if self.urgency_level == "critical":
-            return """1. **Immediate Response**: Activate incident response team
-2. **Service Isolation**: Isolate affected components if possible
-3. **Rollback Preparation**: Prepare emergency rollback procedures
-4. **Status Communication**: Notify stakeholders immediately"""
-        elif self.urgency_level == "high":
-            return """1. **Priority Investigation**: Allocate senior resources to investigation
-2. **Log Analysis**: Review recent logs for error patterns
-3. **Service Monitoring**: Increase monitoring frequency
-4. **Team Coordination**: Coordinate with relevant technical teams"""
-        else:
-            return """1. **Standard Investigation**: Follow normal troubleshooting procedures
-2. **Documentation Review**: Check system documentation and runbooks
-3. **Historical Analysis**: Compare with similar past incidents
-4. **Scheduled Resolution**: Plan resolution during maintenance window if needed"""
-    
-    def _get_resolution_recommendations(self) -> str:
-        return f"""1. **Root Cause Investigation**: Analyze the underlying cause of {self.problem_description.lower()}
-2. **Temporary Mitigation**: Implement temporary fixes to restore service
-3. **Permanent Solution**: Develop and implement long-term resolution
-4. **Prevention Measures**: Add monitoring/alerting to prevent recurrence
-5. **Documentation Update**: Update runbooks with lessons learned"""
-    
-    def get_prompt(self) -> str:
-        components_text = ", ".join(self.affected_components) if self.affected_components else "Unknown"
-        urgency_context = {
-            "low": "This is a low-priority issue that can be resolved during regular maintenance windows.",
-            "medium": "This issue should be resolved within normal business hours.",
-            "high": "This is a high-priority issue requiring prompt attention.",
-            "critical": "This is a critical issue requiring immediate resolution to prevent service impact."
-        }.get(self.urgency_level, "Standard priority issue")
-        
-        return f"""You are a senior systems engineer conducting systematic troubleshooting. 
+
+# Priority context line per urgency_level
+_URGENCY_CONTEXT = {
+    "low": "This is a low-priority issue that can be resolved during regular maintenance windows.",
+    "medium": "This issue should be resolved within normal business hours.",
+    "high": "This is a high-priority issue requiring prompt attention.",
+    "critical": "This is a critical issue requiring immediate resolution to prevent service impact.",
+}
+
+
+# Engineer prompt for TroubleshootingPrompt, split into literal/field slots once at import
+_render_troubleshooting_prompt = _compile_template("""You are a senior systems engineer conducting systematic troubleshooting. 
 
 Problem Report:
-- Description: {self.problem_description}
-- System Context: {self.system_context}
+- Description: {problem_description}
+- System Context: {system_context}
 - Affected Components: {components_text}
-- Urgency Level: {self.urgency_level.title()}
+- Urgency Level: {urgency_level_title}
 - Priority Context: {urgency_context}
 
-{"Error Logs:" if self.error_logs else ""}
-{"```" if self.error_logs else ""}
-{self.error_logs if self.error_logs else ""}
-{"```" if self.error_logs else ""}
+{error_logs_block}
 
 Please provide a systematic troubleshooting approach:
 
@@ -3525,7 +4141,66 @@ Please provide a systematic troubleshooting approach:
    - Monitoring enhancements
    - Documentation updates needed
 
-Prioritize solutions based on the {self.urgency_level} urgency level and provide clear, actionable steps."""
+Prioritize solutions based on the {urgency_level} urgency level and provide clear, actionable steps.""")
+
+
+class TroubleshootingPrompt(PromptModel, CommandModel):
+    """Model for troubleshooting prompt generation."""
+    model_config = ConfigDict(frozen=True)
+
+    problem_description: str
+    system_context: str
+    error_logs: str = ""
+    affected_components: Tuple[str, ...] = ()
+    urgency_level: str = "medium"  # "low", "medium", "high", "critical"
+    output_file: str = "/tmp/troubleshooting_report.md"
+    
+    @cached_render
+    def _components_csv(self) -> str:
+        """Comma-separated components, shared by get_command and get_prompt."""
+        return ", ".join(self.affected_components)
+
+    @shared_render
+    def get_command(self) -> str:
+        components_text = self._components_csv() if self.affected_components else "System components"
+        return _troubleshooting_cmd_for(self.urgency_level)(
+            problem_description=self.problem_description,
+            system_context=self.system_context,
+            components_text=components_text,
+            output_file=self.output_file,
+            component_analysis=self._get_component_analysis(),
+            resolution_recommendations=self._get_resolution_recommendations(),
+        )
+
+    @cached_render
+    def _get_component_analysis(self) -> str:
+        if self.affected_components:
+            return _markdown_list(self.affected_components, "- **", "**: Requires investigation and potential remediation")
+        return _DEFAULT_COMPONENT_ANALYSIS
+    
+    @cached_render
+    def _get_resolution_recommendations(self) -> str:
+        return f"""1. **Root Cause Investigation**: Analyze the underlying cause of {self.problem_description.lower()}
+2. **Temporary Mitigation**: Implement temporary fixes to restore service
+3. **Permanent Solution**: Develop and implement long-term resolution
+4. **Prevention Measures**: Add monitoring/alerting to prevent recurrence
+5. **Documentation Update**: Update runbooks with lessons learned"""
+    
+    @shared_render
+    def get_prompt(self) -> str:
+        components_text = self._components_csv() if self.affected_components else "Unknown"
+        urgency_context = _URGENCY_CONTEXT.get(self.urgency_level, "Standard priority issue")
+        # Fenced logs, or the four blank lines the section collapses to without them
+        error_logs_block = f"Error Logs:\n```\n{self.error_logs}\n```" if self.error_logs else "\n\n\n"
+        return _render_troubleshooting_prompt(
+            problem_description=self.problem_description,
+            system_context=self.system_context,
+            components_text=components_text,
+            urgency_level_title=self.urgency_level.title(),
+            urgency_context=urgency_context,
+            error_logs_block=error_logs_block,
+            urgency_level=self.urgency_level,
+        )
 ### END: TroubleshootingPrompt ###
 
 
@@ -3542,147 +4217,94 @@ Features:
 - Automation recommendations
 Use Case: QA teams creating comprehensive testing strategies
 """
-class TestPlanningPrompt(PromptModel, CommandModel):
-    """Model for test planning prompt generation."""
-    feature_description: str
-    application_type: str  # "web", "mobile", "api", "desktop"
-    test_types: List[str] = ["functional", "integration", "performance"]
-    risk_areas: List[str] = []
-    timeline_weeks: int = 2
-    output_file: str = "/tmp/test_plan.md"
-    
-    def get_command(self) -> str:
-        types_text = ", ".join(self.test_types)
-        risks_text = "; ".join(self.risk_areas) if self.risk_areas else "general system risks"
-        
-        return f"""echo "🧪 GENERATING TEST PLAN"
-echo "Feature: {self.feature_description}"
-echo "Application Type: {self.application_type}"
+# Fallback risk sections when no risk_areas are given
+_DEFAULT_RISK_ASSESSMENT = """- **Data Integrity**: Ensure data consistency and accuracy
+- **User Experience**: Validate intuitive and responsive interface
+- **System Performance**: Monitor resource usage and response times"""
+
+# Detail line per known test type, in the order they appear in the plan
+_TEST_TYPE_LINES = {
+    "functional": "- **Functional Testing**: Verify feature works as specified",
+    "integration": "- **Integration Testing**: Test interaction with other system components",
+    "performance": "- **Performance Testing**: Validate response times and throughput",
+    "security": "- **Security Testing**: Check for vulnerabilities and access controls",
+}
+
+# Fixed schedules for short timelines; longer ones are laid out per call
+_SCHEDULE_ONE_WEEK = """- **Week 1**: Test case creation, environment setup, and execution
+- **Timeline**: Accelerated testing schedule due to short timeline"""
+
+_SCHEDULE_TWO_WEEKS = """- **Week 1**: Test case creation and environment setup
+- **Week 2**: Test execution, bug fixing, and validation"""
+
+_DEFAULT_RISK_LIST = "- Data integrity and security\n- User experience and usability\n- System performance under load"
+
+
+# Test plan script for TestPlanningPrompt, split into literal/field slots once at import
+_render_test_plan_cmd = _compile_template("""echo "🧪 GENERATING TEST PLAN"
+echo "Feature: {feature_description}"
+echo "Application Type: {application_type}"
 echo "Test Types: {types_text}"
-echo "Timeline: {self.timeline_weeks} weeks"
+echo "Timeline: {timeline_weeks} weeks"
 echo "Risk Areas: {risks_text}"
 echo ""
 echo "📝 Creating comprehensive test plan..."
 
-cat << 'EOF' > {self.output_file}
+{{
+cat << 'EOF' > {output_file}
 # Test Plan
 
 ## Project Overview
-**Feature:** {self.feature_description}
-**Application Type:** {self.application_type.title()}
-**Timeline:** {self.timeline_weeks} weeks
+**Feature:** {feature_description}
+**Application Type:** {application_type_title}
+**Timeline:** {timeline_weeks} weeks
 **Test Types:** {types_text}
 
 ## Test Strategy
 
 ### Test Scope
-{self._get_test_scope()}
+{test_scope}
 
 ### Test Types
-{self._get_test_types_details()}
+{test_types_details}
 
 ### Risk Assessment
-{self._get_risk_assessment()}
+{risk_assessment}
 
 ### Test Environment
-{self._get_test_environment()}
+{test_environment}
 
 ### Test Schedule
-{self._get_test_schedule()}
+{test_schedule}
 
 ## Test Cases Overview
-{self._get_test_cases_overview()}
+{test_cases_overview}
 
 ## Success Criteria
-{self._get_success_criteria()}
+{success_criteria}
 
 ## Summary
-Comprehensive test plan generated for {self.feature_description}. 
+Comprehensive test plan generated for {feature_description}. 
 Review and adapt based on specific project requirements.
 
 **Plan created on:** $(date)
 EOF
-
-if [ $? -eq 0 ]; then
-    echo "✅ Test plan generated: {self.output_file}"
-    echo "📊 Plan size: $(du -h "{self.output_file}" | cut -f1)"
-else
+}} && {{
+    echo "✅ Test plan generated: {output_file}"
+    echo "📊 Plan size: $(du -h "{output_file}" | cut -f1)"
+}} || {{
     echo "❌ Failed to generate test plan"
     exit 1
-fi"""
+}}""")
 
-    def _get_test_scope(self) -> str:
-        return f"""- **In Scope**: All core functionality of {self.feature_description}
-- **Out of Scope**: Third-party integrations and legacy system compatibility
-- **Target Platform**: {self.application_type.title()} application
-- **Test Data**: Production-like test data sets"""
-    
-    def _get_test_types_details(self) -> str:
-        details = []
-        if "functional" in self.test_types:
-            details.append("- **Functional Testing**: Verify feature works as specified")
-        if "integration" in self.test_types:
-            details.append("- **Integration Testing**: Test interaction with other system components")
-        if "performance" in self.test_types:
-            details.append("- **Performance Testing**: Validate response times and throughput")
-        if "security" in self.test_types:
-            details.append("- **Security Testing**: Check for vulnerabilities and access controls")
-        return "\n".join(details) if details else "- **General Testing**: Comprehensive feature validation"
-    
-    def _get_risk_assessment(self) -> str:
-        if self.risk_areas:
-            return "\n".join([f"- **{risk}**: Requires special attention and mitigation strategies" for risk in self.risk_areas])
-        return """- **Data Integrity**: Ensure data consistency and accuracy
-- **User Experience**: Validate intuitive and responsive interface
-- **System Performance**: Monitor resource usage and response times"""
-    
-    def _get_test_environment(self) -> str:
-        return f"""- **Environment**: Dedicated {self.application_type} testing environment
-- **Test Data**: Sanitized production data or synthetic test datasets
-- **Tools**: Automated testing frameworks and manual testing tools
-- **Access**: Controlled access for QA team and stakeholders"""
-    
-    def _get_test_schedule(self) -> str:
-        if self.timeline_weeks <= 1:
-            return """- **Week 1**: Test case creation, environment setup, and execution
-- **Timeline**: Accelerated testing schedule due to short timeline"""
-        elif self.timeline_weeks == 2:
-            return """- **Week 1**: Test case creation and environment setup
-- **Week 2**: Test execution, bug fixing, and validation"""
-        else:
-            return f"""- **Weeks 1-2**: Test case creation and environment setup
-- **Weeks 3-{self.timeline_weeks-1}**: Test execution and iterative testing
-- **Week {self.timeline_weeks}**: Final validation and sign-off"""
-    
-    def _get_test_cases_overview(self) -> str:
-        return """### Positive Test Cases
-- Verify normal operation under expected conditions
-- Test valid input scenarios and user workflows
-
-### Negative Test Cases  
-- Test invalid inputs and edge cases
-- Verify proper error handling and user feedback
 
-### Boundary Test Cases
-- Test limits and constraints of the system
-- Validate behavior at maximum and minimum values"""
-    
-    def _get_success_criteria(self) -> str:
-        return """- **Functional Requirements**: 100% of specified features working correctly
-- **Performance Standards**: Response times within acceptable limits
-- **Quality Gates**: Zero critical bugs, minimal medium-priority issues
-- **User Acceptance**: Stakeholder approval and sign-off completed"""
-    
-    def get_prompt(self) -> str:
-        types_text = ", ".join(self.test_types)
-        risks_text = "\n".join([f"- {risk}" for risk in self.risk_areas]) if self.risk_areas else "- Data integrity and security\n- User experience and usability\n- System performance under load"
-        
-        return f"""You are a senior QA engineer creating a comprehensive test plan.
+# QA prompt for TestPlanningPrompt, split into literal/field slots once at import
+_render_test_plan_prompt = _compile_template("""You are a senior QA engineer creating a comprehensive test plan.
 
-Feature to Test: {self.feature_description}
-Application Type: {self.application_type.title()}
+Feature to Test: {feature_description}
+Application Type: {application_type_title}
 Test Types Required: {types_text}
-Timeline: {self.timeline_weeks} weeks
+Timeline: {timeline_weeks} weeks
 Risk Areas:
 {risks_text}
 
@@ -3723,7 +4345,113 @@ Please create a detailed test plan including:
    - Milestone checkpoints
    - Reporting and communication plan
 
-Provide specific, actionable test cases with clear acceptance criteria for the {self.application_type} application."""
+Provide specific, actionable test cases with clear acceptance criteria for the {application_type} application.""")
+
+
+class TestPlanningPrompt(PromptModel, CommandModel):
+    """Model for test planning prompt generation."""
+    model_config = ConfigDict(frozen=True)
+
+    feature_description: str
+    application_type: str  # "web", "mobile", "api", "desktop"
+    test_types: Tuple[str, ...] = ("functional", "integration", "performance")
+    risk_areas: Tuple[str, ...] = ()
+    timeline_weeks: int = 2
+    output_file: str = "/tmp/test_plan.md"
+    
+    @cached_render
+    def _types_csv(self) -> str:
+        """Comma-separated test types, shared by get_command and get_prompt."""
+        return ", ".join(self.test_types)
+
+    @shared_render
+    def get_command(self) -> str:
+        types_text = self._types_csv()
+        risks_text = "; ".join(self.risk_areas) if self.risk_areas else "general system risks"
+        return _render_test_plan_cmd(
+            feature_description=self.feature_description,
+            application_type=self.application_type,
+            types_text=types_text,
+            timeline_weeks=str(self.timeline_weeks),
+            risks_text=risks_text,
+            output_file=self.output_file,
+            application_type_title=self.application_type.title(),
+            test_scope=self._get_test_scope(),
+            test_types_details=self._get_test_types_details(),
+            risk_assessment=self._get_risk_assessment(),
+            test_environment=self._get_test_environment(),
+            test_schedule=self._get_test_schedule(),
+            test_cases_overview=self._get_test_cases_overview(),
+            success_criteria=self._get_success_criteria(),
+        )
+
+    @cached_render
+    def _get_test_scope(self) -> str:
+        return f"""- **In Scope**: All core functionality of {self.feature_description}
+- **Out of Scope**: Third-party integrations and legacy system compatibility
+- **Target Platform**: {self.application_type.title()} application
+- **Test Data**: Production-like test data sets"""
+    
+    @cached_render
+    def _get_test_types_details(self) -> str:
+        requested = set(self.test_types)
+        details = "\n".join(line for test_type, line in _TEST_TYPE_LINES.items() if test_type in requested)
+        return details or "- **General Testing**: Comprehensive feature validation"
+    
+    @cached_render
+    def _get_risk_assessment(self) -> str:
+        if self.risk_areas:
+            return _markdown_list(self.risk_areas, "- **", "**: Requires special attention and mitigation strategies")
+        return _DEFAULT_RISK_ASSESSMENT
+    
+    @cached_render
+    def _get_test_environment(self) -> str:
+        return f"""- **Environment**: Dedicated {self.application_type} testing environment
+- **Test Data**: Sanitized production data or synthetic test datasets
+- **Tools**: Automated testing frameworks and manual testing tools
+- **Access**: Controlled access for QA team and stakeholders"""
+    
+    @cached_render
+    def _get_test_schedule(self) -> str:
+        if self.timeline_weeks <= 1:
+            return _SCHEDULE_ONE_WEEK
+        if self.timeline_weeks == 2:
+            return _SCHEDULE_TWO_WEEKS
+        return f"""- **Weeks 1-2**: Test case creation and environment setup
+- **Weeks 3-{self.timeline_weeks - 1}**: Test execution and iterative testing
+- **Week {self.timeline_weeks}**: Final validation and sign-off"""
+    
+    def _get_test_cases_overview(self) -> str:
+        return """### Positive Test Cases
+- Verify normal operation under expected conditions
+- Test valid input scenarios and user workflows
+
+### Negative Test Cases  
+- Test invalid inputs and edge cases
+- Verify proper error handling and user feedback
+
+### Boundary Test Cases
+- Test limits and constraints of the system
+- Validate behavior at maximum and minimum values"""
+    
+    def _get_success_criteria(self) -> str:
+        return """- **Functional Requirements**: 100% of specified features working correctly
+- **Performance Standards**: Response times within acceptable limits
+- **Quality Gates**: Zero critical bugs, minimal medium-priority issues
+- **User Acceptance**: Stakeholder approval and sign-off completed"""
+    
+    @shared_render
+    def get_prompt(self) -> str:
+        types_text = self._types_csv()
+        risks_text = _markdown_list(self.risk_areas) if self.risk_areas else _DEFAULT_RISK_LIST
+        return _render_test_plan_prompt(
+            feature_description=self.feature_description,
+            application_type_title=self.application_type.title(),
+            types_text=types_text,
+            timeline_weeks=str(self.timeline_weeks),
+            risks_text=risks_text,
+            application_type=self.application_type,
+        )
 ### END: TestPlanningPrompt ###
 
 
@@ -3740,64 +4468,72 @@ Features:
 - Error handling with exit codes
 Use Case: Workflow steps that need to validate prerequisites
 """
-class ValidationCommand(CommandModel):
-    """Command model for validation operations."""
-    
-    validation_type: str  # "backup_params", "migration_params", "config_params"
-    resource_name: str
-    resource_location: str = ""
-    required_params: List[str] = []
-    
-    def get_command(self) -> str:
-        if self.validation_type == "backup_params":
-            return f"""
+# Validation scripts per validation_type, compiled once; unknown types get the generic check
+_VALIDATION_COMMANDS = {
+    "backup_params": _compile_template("""
 echo "🔍 VALIDATING BACKUP PARAMETERS"
-echo "Resource: {self.resource_name}"
-echo "Location: {self.resource_location}"
-if [ ! -d "{self.resource_location}" ]; then
-    echo "📁 Creating backup directory: {self.resource_location}"
-    mkdir -p "{self.resource_location}"
-    if [ $? -eq 0 ]; then
-        echo "✅ Backup directory created successfully"
-    else
+echo "Resource: {resource_name}"
+echo "Location: {resource_location}"
+if [ ! -d "{resource_location}" ]; then
+    echo "📁 Creating backup directory: {resource_location}"
+    mkdir -p "{resource_location}" || {{
         echo "❌ Failed to create backup directory"
         exit 1
-    fi
+    }}
+    echo "✅ Backup directory created successfully"
 else
     echo "✅ Backup directory already exists"
 fi
-if [ -z "{self.resource_name}" ]; then
+if [ -z "{resource_name}" ]; then
     echo "❌ Database name is required"
     exit 1
 fi
 echo "✅ Backup parameters validated"
-"""
-        elif self.validation_type == "migration_params":
-            return f"""
+"""),
+    "migration_params": _compile_template("""
 echo "🔍 VALIDATING MIGRATION PARAMETERS"
-echo "Migration: {self.resource_name}"
-if [ -z "{self.resource_name}" ]; then
+echo "Migration: {resource_name}"
+if [ -z "{resource_name}" ]; then
     echo "❌ Migration name is required"
     exit 1
 fi
 echo "✅ Migration parameters validated"
-"""
-        elif self.validation_type == "config_params":
-            return f"""
+"""),
+    "config_params": _compile_template("""
 echo "✅ VALIDATING CONFIGURATION PARAMETERS"
-echo "Resource: {self.resource_name}"
-if [ -z "{self.resource_name}" ]; then
+echo "Resource: {resource_name}"
+if [ -z "{resource_name}" ]; then
     echo "❌ Resource name is required"
     exit 1
 fi
 echo "✅ Parameters validated"
-"""
-        else:
-            return f"""
-echo "🔍 VALIDATING {self.validation_type.upper()}"
-echo "Resource: {self.resource_name}"
+"""),
+}
+
+_render_generic_validation = _compile_template("""
+echo "🔍 VALIDATING {validation_type_upper}"
+echo "Resource: {resource_name}"
 echo "✅ Validation completed"
-"""
+""")
+
+
+class ValidationCommand(CommandModel):
+    """Command model for validation operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    validation_type: str  # "backup_params", "migration_params", "config_params"
+    resource_name: str
+    resource_location: str = ""
+    required_params: Tuple[str, ...] = ()
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _VALIDATION_COMMANDS.get(self.validation_type, _render_generic_validation)
+        return render(
+            resource_name=self.resource_name,
+            resource_location=self.resource_location,
+            validation_type_upper=self.validation_type.upper(),
+        )
 ### END: ValidationCommand ###
 
 
@@ -3814,34 +4550,39 @@ Features:
 - Structured output formatting
 Use Case: Workflow steps that generate summary reports
 """
+# Timestamp header shared by every report; built once instead of per render
+_REPORT_TIMESTAMP_LINES = ("Generated: $(date)", "")
+
+# One-pass escaping of quotes, backticks and dollars in section content
+_REPORT_SECTION_ESCAPES = str.maketrans({'"': '\\"', '`': '\\`', '$': '\\$'})
+
+
 class ReportGenerationCommand(CommandModel):
     """Command model for generating reports."""
+    model_config = ConfigDict(frozen=True)
     
     report_type: str  # "backup", "health", "security", "performance"
     title: str
     sections: Dict[str, str] = {}
     include_timestamp: bool = True
     
+    @cached_render
     def get_command(self) -> str:
-        import base64
-        
-        # Build the report content as a single string
-        report_content = f"{self.title}\n"
-        report_content += "=" * len(self.title) + "\n"
         
+        # Collect the report lines and join once at the end
+        lines = [self.title, "=" * len(self.title)]
         if self.include_timestamp:
-            report_content += "Generated: $(date)\n"
-            report_content += "\n"
-        
+            lines += _REPORT_TIMESTAMP_LINES
+
         for section_name, section_content in self.sections.items():
-            report_content += f"=== {section_name} ===\n"
             # Clean the section content to remove shell command indicators and problematic characters
-            cleaned_content = section_content.replace('"', '\\"').replace('`', '\\`').replace('$', '\\$')
-            report_content += f"{cleaned_content}\n"
-            report_content += "\n"
-        
+            cleaned_content = section_content.translate(_REPORT_SECTION_ESCAPES)
+            lines += (f"=== {section_name} ===", cleaned_content, "")
+        lines.append("")
+        report_content = "\n".join(lines)
+
         # Use base64 encoding to avoid any shell interpretation issues
-        encoded_content = base64.b64encode(report_content.encode('utf-8')).decode('ascii')
+        encoded_content = _b64_cached(report_content)
         
         return f"""# Generate report using base64 to avoid shell interpretation issues
 echo '{encoded_content}' | base64 -d"""
@@ -3861,18 +4602,15 @@ Features:
 - Error handling for failed connections
 Use Case: Workflow steps that need to verify cluster access
 """
-class ClusterConnectionCommand(CommandModel):
-    """Command model for cluster connection verification."""
-    
-    cluster_type: str = "kubernetes"  # "kubernetes", "docker", "openshift"
-    connection_timeout: int = 30
-    
-    def get_command(self) -> str:
-        if self.cluster_type == "kubernetes":
-            return f"""
+# The script depends only on these two fields, so instances with the same
+# values (the default kubernetes/30s check in particular) share one string
+@functools.lru_cache(maxsize=32)
+def _cluster_connection_script(cluster_type: str, connection_timeout: int) -> str:
+    if cluster_type == "kubernetes":
+        return f"""
 echo "🔍 CHECKING CLUSTER CONNECTION (Demo Mode)"
-echo "Cluster type: {self.cluster_type}"
-echo "Connection timeout: {self.connection_timeout}s"
+echo "Cluster type: {cluster_type}"
+echo "Connection timeout: {connection_timeout}s"
 echo "📝 Simulating kubectl cluster-info check..."
 sleep 2  # Simulate connection time
 echo "Kubernetes control plane is running at https://demo-cluster.example.com:6443"
@@ -3882,12 +4620,24 @@ echo ""
 echo "To further debug and diagnose cluster problems, use 'kubectl cluster-info dump'."
 echo "✅ Cluster connection successful (simulated)"
 """
-        else:
-            return f"""
-echo "🔍 CHECKING {self.cluster_type.upper()} CONNECTION"
-echo "Connection timeout: {self.connection_timeout}s"
+    else:
+        return f"""
+echo "🔍 CHECKING {cluster_type.upper()} CONNECTION"
+echo "Connection timeout: {connection_timeout}s"
 echo "✅ Connection check completed"
 """
+
+
+class ClusterConnectionCommand(CommandModel):
+    """Command model for cluster connection verification."""
+    model_config = ConfigDict(frozen=True)
+    
+    cluster_type: str = "kubernetes"  # "kubernetes", "docker", "openshift"
+    connection_timeout: int = 30
+    
+    @cached_render
+    def get_command(self) -> str:
+        return _cluster_connection_script(self.cluster_type, self.connection_timeout)
 ### END: ClusterConnectionCommand ###
 
 
@@ -3904,22 +4654,29 @@ Features:
 - Multiple backup format support
 Use Case: Workflow steps that need to verify backup success
 """
-class BackupVerificationCommand(CommandModel):
-    """Command model for backup verification."""
-    
-    backup_location: str
-    backup_name_pattern: str
-    expected_min_size: str = "1M"  # "1M", "100K", etc.
-    
-    def get_command(self) -> str:
-        return f"""
+# Byte multipliers for the expected_min_size suffixes ("100K", "1M", "2G")
+_SIZE_SUFFIXES = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+_SIZE_RE = re.compile(r"\s*(\d+)\s*([KMG]?)B?\s*", re.IGNORECASE)
+
+
+def _min_size_bytes(size: str) -> int:
+    """Byte count for a size like "1M"; anything unparseable (e.g. a template placeholder) keeps the old 1024 floor."""
+    match = _SIZE_RE.fullmatch(size)
+    if not match:
+        return 1024
+    return int(match.group(1)) * _SIZE_SUFFIXES[match.group(2).upper()]
+
+
+# Keyed on the interpolated values so repeated checks of the same backup share one script
+@functools.lru_cache(maxsize=32)
+def _backup_verification_script(backup_location: str, backup_name_pattern: str, min_bytes: int) -> str:
+    return f"""
 echo "🔍 VERIFYING BACKUP INTEGRITY"
-LATEST_BACKUP=$(ls -t {self.backup_location}/{self.backup_name_pattern} 2>/dev/null | head -1)
+LATEST_BACKUP=$(ls -t {backup_location}/{backup_name_pattern} 2>/dev/null | head -1)
 if [ -n "$LATEST_BACKUP" ]; then
     echo "✅ Backup file found: $LATEST_BACKUP"
     echo "📊 Backup size: $(du -h "$LATEST_BACKUP" | cut -f1)"
-    BACKUP_SIZE=$(du -b "$LATEST_BACKUP" | cut -f1)
-    if [ "$BACKUP_SIZE" -gt 1024 ]; then
+    if [ "$(stat -c%s "$LATEST_BACKUP")" -gt {min_bytes} ]; then
         echo "✅ Backup size verification passed"
     else
         echo "⚠️ Backup file seems too small"
@@ -3929,6 +4686,21 @@ else
     exit 1
 fi
 """
+
+
+class BackupVerificationCommand(CommandModel):
+    """Command model for backup verification."""
+    model_config = ConfigDict(frozen=True)
+    
+    backup_location: str
+    backup_name_pattern: str
+    expected_min_size: str = "1M"  # "1M", "100K", etc.
+    
+    @cached_render
+    def get_command(self) -> str:
+        return _backup_verification_script(
+            self.backup_location, self.backup_name_pattern, _min_size_bytes(self.expected_min_size)
+        )
 ### END: BackupVerificationCommand ###
 
 
@@ -3945,35 +4717,44 @@ Features:
 - Resource preparation
 Use Case: Workflow steps that prepare execution environments
 """
+def _shell_words(items: Sequence[str]) -> str:
+    """Double-quoted shell words for a for-loop list; double quotes keep ${var} placeholders expanding."""
+    return " ".join(f'"{item}"' for item in items)
+
+
+# Banner emoji per setup_type
+_SETUP_EMOJI = {
+    "data_generation": "🎲",
+    "testing": "⚡",
+    "security_scan": "🔒",
+    "performance": "📊",
+}
+
+
 class EnvironmentSetupCommand(CommandModel):
     """Command model for environment setup."""
+    model_config = ConfigDict(frozen=True)
     
     setup_type: str  # "data_generation", "testing", "security_scan", "performance"
     work_directory: str
-    required_tools: List[str] = []
+    required_tools: Tuple[str, ...] = ()
     
+    @shared_render
     def get_command(self) -> str:
-        setup_emoji = {
-            "data_generation": "🎲",
-            "testing": "⚡",
-            "security_scan": "🔒",
-            "performance": "📊"
-        }.get(self.setup_type, "🔧")
-        
-        commands = [
-            f'echo "{setup_emoji} SETTING UP {self.setup_type.upper().replace("_", " ")} ENVIRONMENT"',
-            f'mkdir -p {self.work_directory}',
-            f'echo "Work directory: {self.work_directory}"'
-        ]
-        
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        setup_emoji = _SETUP_EMOJI.get(self.setup_type, "🔧")
+        setup_label = self.setup_type.upper().replace("_", " ")
+        yield f'echo "{setup_emoji} SETTING UP {setup_label} ENVIRONMENT"'
+        yield f'mkdir -p {self.work_directory}'
+        yield f'echo "Work directory: {self.work_directory}"'
         if self.required_tools:
-            commands.extend([
-                'echo "Checking required tools..."',
-                *[f'command -v {tool} >/dev/null 2>&1 || echo "⚠️ {tool} not found"' for tool in self.required_tools]
-            ])
-        
-        commands.append('echo "✅ Environment setup completed"')
-        return "\n".join(commands)
+            yield 'echo "Checking required tools..."'
+            yield f'for tool in {_shell_words(self.required_tools)}; do'
+            yield '    command -v "$tool" >/dev/null 2>&1 || echo "⚠️ $tool not found"'
+            yield 'done'
+        yield 'echo "✅ Environment setup completed"'
 ### END: EnvironmentSetupCommand ###
 
 
@@ -3990,43 +4771,31 @@ Features:
 - System status checks
 Use Case: Workflow steps that need system information
 """
+# Shell lines per metric type, in output order; processes follow, sized by top_processes_count
+_METRIC_SNIPPETS = {
+    "cpu": ('echo "=== CPU Usage ==="', 'top -bn1 | grep "Cpu(s)" | head -1', 'echo ""'),
+    "memory": ('echo "=== Memory Usage ==="', 'free -h', 'echo ""'),
+    "disk": ('echo "=== Disk Usage ==="', 'df -h | grep -E "^/dev" | head -5', 'echo ""'),
+}
+_PROCESS_METRIC_LINES = ('echo "=== Top {count} Processes ==="', 'ps aux | head -{rows}', 'echo ""')
+
+
 class SystemMetricsCommand(CommandModel):
     """Command model for system metrics collection."""
+    model_config = ConfigDict(frozen=True)
     
-    metric_types: List[str]  # ["cpu", "memory", "disk", "processes", "network"]
+    metric_types: FrozenSet[str]  # {"cpu", "memory", "disk", "processes", "network"}
     top_processes_count: int = 10
     
+    @shared_render
     def get_command(self) -> str:
         commands = ['echo "📊 COLLECTING SYSTEM METRICS"']
-        
-        if "cpu" in self.metric_types:
-            commands.extend([
-                'echo "=== CPU Usage ==="',
-                'top -bn1 | grep "Cpu(s)" | head -1',
-                'echo ""'
-            ])
-        
-        if "memory" in self.metric_types:
-            commands.extend([
-                'echo "=== Memory Usage ==="',
-                'free -h',
-                'echo ""'
-            ])
-        
-        if "disk" in self.metric_types:
-            commands.extend([
-                'echo "=== Disk Usage ==="',
-                'df -h | grep -E "^/dev" | head -5',
-                'echo ""'
-            ])
-        
+        commands.extend(chain.from_iterable(
+            lines for metric, lines in _METRIC_SNIPPETS.items() if metric in self.metric_types
+        ))
         if "processes" in self.metric_types:
-            commands.extend([
-                f'echo "=== Top {self.top_processes_count} Processes ==="',
-                f'ps aux | head -{self.top_processes_count + 1}',
-                'echo ""'
-            ])
-        
+            commands.extend(line.format(count=self.top_processes_count, rows=self.top_processes_count + 1)
+                            for line in _PROCESS_METRIC_LINES)
         commands.append('echo "✅ Metrics collection completed"')
         return "\n".join(commands)
 ### END: SystemMetricsCommand ###
@@ -4047,51 +4816,49 @@ Use Case: Workflow steps that validate project prerequisites
 """
 class ProjectStructureValidationCommand(CommandModel):
     """Command model for project structure validation."""
+    model_config = ConfigDict(frozen=True)
     
     project_name: str
     project_type: str = "general"  # "python", "node", "docker", "kubernetes"
-    required_dirs: List[str] = []
-    required_files: List[str] = []
+    required_dirs: Tuple[str, ...] = ()
+    required_files: Tuple[str, ...] = ()
     
+    @shared_render
     def get_command(self) -> str:
-        commands = [
-            f'echo "📁 VALIDATING PROJECT STRUCTURE"',
-            f'echo "Project: {self.project_name}"',
-            f'echo "Type: {self.project_type}"'
-        ]
-        
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        yield 'echo "📁 VALIDATING PROJECT STRUCTURE"'
+        yield f'echo "Project: {self.project_name}"'
+        yield f'echo "Type: {self.project_type}"'
+
         # Check project root
-        commands.extend([
-            'if [ -d "." ]; then',
-            '    echo "✅ Project directory found"',
-            'else',
-            '    echo "❌ Invalid project structure"',
-            '    exit 1',
-            'fi'
-        ])
-        
-        # Check required directories
-        for dir_name in self.required_dirs:
-            commands.extend([
-                f'if [ -d "{dir_name}" ]; then',
-                f'    echo "✅ Directory {dir_name} found"',
-                f'else',
-                f'    echo "⚠️ Directory {dir_name} not found"',
-                f'fi'
-            ])
-        
-        # Check required files
-        for file_name in self.required_files:
-            commands.extend([
-                f'if [ -f "{file_name}" ]; then',
-                f'    echo "✅ File {file_name} found"',
-                f'else',
-                f'    echo "⚠️ File {file_name} not found"',
-                f'fi'
-            ])
-        
-        commands.append('echo "✅ Project structure validation completed"')
-        return "\n".join(commands)
+        yield 'if [ -d "." ]; then'
+        yield '    echo "✅ Project directory found"'
+        yield 'else'
+        yield '    echo "❌ Invalid project structure"'
+        yield '    exit 1'
+        yield 'fi'
+
+        # Check required directories and files, one shell loop each
+        if self.required_dirs:
+            yield f'for dir_name in {_shell_words(self.required_dirs)}; do'
+            yield '    if [ -d "$dir_name" ]; then'
+            yield '        echo "✅ Directory $dir_name found"'
+            yield '    else'
+            yield '        echo "⚠️ Directory $dir_name not found"'
+            yield '    fi'
+            yield 'done'
+        if self.required_files:
+            yield f'for file_name in {_shell_words(self.required_files)}; do'
+            yield '    if [ -f "$file_name" ]; then'
+            yield '        echo "✅ File $file_name found"'
+            yield '    else'
+            yield '        echo "⚠️ File $file_name not found"'
+            yield '    fi'
+            yield 'done'
+
+        yield 'echo "✅ Project structure validation completed"'
 ### END: ProjectStructureValidationCommand ###
 
 
@@ -4108,44 +4875,56 @@ Features:
 - Resource availability assessment
 Use Case: Workflow steps that diagnose system issues
 """
+# (header, probe) steps per diagnostic_type; other types only echo the target components.
+# Probes are independent and run concurrently, so none may contain a single quote.
+_DIAGNOSTIC_STEPS = {
+    "system": (
+        ("1. Checking system resources...", 'free -m | head -2'),
+        ("2. Checking disk space...", 'df -h | grep -E "^/dev" | head -3'),
+        ("3. Checking system load...", 'uptime'),
+    ),
+    "network": (
+        ("1. Checking network interfaces...", 'ip addr show | grep -E "(inet|UP)" | head -10'),
+        ("2. Checking DNS resolution...", 'nslookup google.com >/dev/null 2>&1 && echo "✅ DNS working" || echo "❌ DNS issues"'),
+    ),
+    "database": (
+        ("1. Checking database connections...", ""),
+        ("2. Verifying database processes...", 'ps aux | grep -E "(mysql|postgres|mongo)" | grep -v grep || echo "No database processes found"'),
+    ),
+}
+
+
 class ProblemDiagnosticsCommand(CommandModel):
     """Command model for problem diagnostics."""
+    model_config = ConfigDict(frozen=True)
     
     diagnostic_type: str  # "system", "network", "database", "application"
-    target_components: List[str] = []
+    target_components: Tuple[str, ...] = ()
     timeout_seconds: int = 30
     
+    @shared_render
     def get_command(self) -> str:
-        commands = [f'echo "🔧 EXECUTING {self.diagnostic_type.upper()} DIAGNOSTICS"']
-        
-        if self.diagnostic_type == "system":
-            commands.extend([
-                'echo "1. Checking system resources..."',
-                'free -m | head -2',
-                'echo "2. Checking disk space..."',
-                'df -h | grep -E "^/dev" | head -3',
-                'echo "3. Checking system load..."',
-                'uptime'
-            ])
-        elif self.diagnostic_type == "network":
-            commands.extend([
-                'echo "1. Checking network interfaces..."',
-                'ip addr show | grep -E "(inet|UP)" | head -10',
-                'echo "2. Checking DNS resolution..."',
-                'nslookup google.com >/dev/null 2>&1 && echo "✅ DNS working" || echo "❌ DNS issues"'
-            ])
-        elif self.diagnostic_type == "database":
-            commands.extend([
-                'echo "1. Checking database connections..."',
-                'echo "2. Verifying database processes..."',
-                f'ps aux | grep -E "(mysql|postgres|mongo)" | grep -v grep || echo "No database processes found"'
-            ])
-        
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        yield f'echo "🔧 EXECUTING {self.diagnostic_type.upper()} DIAGNOSTICS"'
+        steps = _DIAGNOSTIC_STEPS.get(self.diagnostic_type, ())
+        probes = [(index, probe) for index, (_, probe) in enumerate(steps) if probe]
+        if probes:
+            # Start every probe at once, each capped at timeout_seconds, then print results in step order
+            yield 'diag_dir=$(mktemp -d)'
+            for index, probe in probes:
+                yield f"""timeout {self.timeout_seconds} bash -c '{probe}' > "$diag_dir/{index}" 2>&1 &"""
+            yield 'wait'
+        for index, (header, probe) in enumerate(steps):
+            yield f'echo "{header}"'
+            if probe:
+                yield f'cat "$diag_dir/{index}"'
+        if probes:
+            yield 'rm -rf "$diag_dir"'
         for component in self.target_components:
-            commands.append(f'echo "Checking {component}..."')
-        
-        commands.append('echo "✅ Diagnostic steps completed"')
-        return "\n".join(commands)
+            yield f'echo "Checking {component}..."'
+        yield 'echo "✅ Diagnostic steps completed"'
 ### END: ProblemDiagnosticsCommand ###
 
 
@@ -4162,33 +4941,44 @@ Features:
 - Response time tracking
 Use Case: Workflow steps that evaluate incident parameters
 """
-class IncidentAssessmentCommand(CommandModel):
-    """Command model for incident assessment."""
-    
-    incident_id: str
-    current_severity: str
-    escalation_threshold_minutes: str = "30"  # Changed to str to accept template variables
-    affected_systems: List[str] = []
-    
-    def get_command(self) -> str:
-        return f"""
+# Severity assessment and escalation script, compiled once
+_render_incident_assessment = _compile_template("""
 echo "📊 ASSESSING INCIDENT SEVERITY"
-echo "Incident ID: {self.incident_id}"
-echo "Current severity: {self.current_severity}"
-echo "Escalation threshold: {self.escalation_threshold_minutes} minutes"
-echo "Affected systems: {', '.join(self.affected_systems) if self.affected_systems else 'None specified'}"
+echo "Incident ID: {incident_id}"
+echo "Current severity: {current_severity}"
+echo "Escalation threshold: {escalation_threshold_minutes} minutes"
+echo "Affected systems: {affected_text}"
 
 # Determine escalation need
-if [ "{self.current_severity}" = "critical" ] || [ "{self.current_severity}" = "high" ]; then
-    echo "⚠️ Escalation needed for {self.current_severity} severity incident"
+if [ "{current_severity}" = "critical" ] || [ "{current_severity}" = "high" ]; then
+    echo "⚠️ Escalation needed for {current_severity} severity incident"
     echo "ESCALATE=true"
 else
-    echo "ℹ️ No escalation needed for {self.current_severity} severity"
+    echo "ℹ️ No escalation needed for {current_severity} severity"
     echo "ESCALATE=false"
 fi
 
 echo "✅ Severity assessment completed"
-"""
+""")
+
+
+class IncidentAssessmentCommand(CommandModel):
+    """Command model for incident assessment."""
+    model_config = ConfigDict(frozen=True)
+    
+    incident_id: str
+    current_severity: str
+    escalation_threshold_minutes: str = "30"  # Changed to str to accept template variables
+    affected_systems: Tuple[str, ...] = ()
+    
+    @shared_render
+    def get_command(self) -> str:
+        return _render_incident_assessment(
+            incident_id=self.incident_id,
+            current_severity=self.current_severity,
+            escalation_threshold_minutes=self.escalation_threshold_minutes,
+            affected_text=", ".join(self.affected_systems) if self.affected_systems else "None specified",
+        )
 ### END: IncidentAssessmentCommand ###
 
 
@@ -4196,6 +4986,10 @@ echo "✅ Severity assessment completed"
 # UTILITY COMMAND MODELS (For Legacy Workflow Conversion)
 # ============================================================================
 
+# Fallback line for an unrecognised *_type value on the utility commands below
+_render_unknown_type = _compile_template('echo "❌ Unknown {kind} type: {value}"')
+
+
 ### START: UrlValidationCommand ###
 """
 URL Validation Command Model
@@ -4208,32 +5002,34 @@ Features:
 - Comprehensive URL analysis reporting
 Use Case: Workflow steps that need to validate and test URLs
 """
-class UrlValidationCommand(CommandModel):
-    """Command model for URL validation and connectivity testing."""
-    
-    target_url: str
-    timeout_seconds: int = 30
-    check_ssl: bool = True
-    follow_redirects: bool = True
-    
-    def get_command(self) -> str:
-        ssl_flag = "--insecure" if not self.check_ssl else ""
-        redirect_flag = "-L" if self.follow_redirects else ""
-        
-        return f"""
-echo "🔍 VALIDATING URL: {self.target_url}"
+# Same pattern the shell check used; literal URLs are matched once in Python at validation
+_URL_FORMAT_RE = re.compile(r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_URL_FORMAT_OK = 'echo "✅ URL format is valid"'
+
 
-# URL format validation
-if echo "{self.target_url}" | grep -E "^https?://[a-zA-Z0-9.-]+\\.[a-zA-Z]{{2,}}"; then
+def _resolved_at_runtime(value: str) -> bool:
+    """True for ${var} / $(cmd) / {{.var}} values that only the workflow runner can resolve."""
+    return "$" in value or "{{" in value
+
+
+# Runtime format check, kept for URLs that are template placeholders resolved by the workflow
+_render_url_format_check = _compile_template("""# URL format validation
+if echo "{target_url}" | grep -E "^https?://[a-zA-Z0-9.-]+\\.[a-zA-Z]{{2,}}"; then
     echo "✅ URL format is valid"
 else
     echo "❌ Invalid URL format"
     exit 1
-fi
+fi""")
+
+# URL format and connectivity check script, compiled once
+_render_url_validation = _compile_template("""
+echo "🔍 VALIDATING URL: {target_url}"
+
+{format_check}
 
 # Connectivity check
 echo "🌐 Testing connectivity..."
-if curl {ssl_flag} {redirect_flag} --max-time {self.timeout_seconds} -o /dev/null -s -w "Response Code: %{{http_code}}\\nTotal Time: %{{time_total}}s\\n" "{self.target_url}"; then
+if curl {ssl_flag} {redirect_flag} --max-time {timeout_seconds} -o /dev/null -s -w "Response Code: %{{http_code}}\\nTotal Time: %{{time_total}}s\\n" "{target_url}"; then
     echo "✅ URL is accessible"
 else
     echo "❌ URL is not accessible"
@@ -4241,7 +5037,35 @@ else
 fi
 
 echo "✅ URL validation completed"
-"""
+""")
+
+
+class UrlValidationCommand(CommandModel):
+    """Command model for URL validation and connectivity testing."""
+    model_config = ConfigDict(frozen=True)
+    
+    target_url: str
+    timeout_seconds: int = 30
+    check_ssl: bool = True
+    follow_redirects: bool = True
+    
+    @field_validator("target_url")
+    @classmethod
+    def _check_url_format(cls, value: str) -> str:
+        if not _resolved_at_runtime(value) and not _URL_FORMAT_RE.match(value):
+            raise ValueError(f"Invalid URL format: {value}")
+        return value
+
+    @shared_render
+    def get_command(self) -> str:
+        return _render_url_validation(
+            format_check=(_render_url_format_check(target_url=self.target_url)
+                          if _resolved_at_runtime(self.target_url) else _URL_FORMAT_OK),
+            ssl_flag="--insecure" if not self.check_ssl else "",
+            redirect_flag="-L" if self.follow_redirects else "",
+            target_url=self.target_url,
+            timeout_seconds=str(self.timeout_seconds),
+        )
 ### END: UrlValidationCommand ###
 
 
@@ -4257,47 +5081,59 @@ Features:
 - Text analysis reporting
 Use Case: Workflow steps that need to analyze and process text content
 """
-class TextProcessingCommand(CommandModel):
-    """Command model for text processing and analysis operations."""
-    
-    input_text: str
-    processing_type: str  # "prepare", "count_chars", "extract_words", "generate_report"
-    output_file: str = "/tmp/text_input.txt"
-    max_unique_words: int = 10
-    
-    def get_command(self) -> str:
-        if self.processing_type == "prepare":
-            return f"""
+# Text processing scripts per processing_type, compiled once
+_TEXT_PROCESSING_COMMANDS = {
+    "prepare": _compile_template("""
 echo "📝 PREPARING TEXT FOR ANALYSIS"
-echo "Text length: $(echo -n "{self.input_text}" | wc -c) characters"
-echo "{self.input_text}" > {self.output_file}
-echo "✅ Text prepared and saved to {self.output_file}"
-"""
-        elif self.processing_type == "count_chars":
-            return f"""
+text="{input_text}"
+echo "Text length: $(printf %s "$text" | wc -c) characters"
+printf '%s\\n' "$text" > {output_file}
+echo "✅ Text prepared and saved to {output_file}"
+"""),
+    "count_chars": _compile_template("""
 echo "📊 COUNTING CHARACTERS"
-char_count=$(echo -n "{self.input_text}" | wc -c)
+char_count=$(echo -n "{input_text}" | wc -c)
 echo "Character count: $char_count"
 echo "CHAR_COUNT=$char_count"
-"""
-        elif self.processing_type == "extract_words":
-            return f"""
+"""),
+    "extract_words": _compile_template("""
 echo "🔤 EXTRACTING UNIQUE WORDS"
-echo "{self.input_text}" | tr ' ' '\\n' | tr '[:upper:]' '[:lower:]' | sort | uniq | head -{self.max_unique_words}
-echo "✅ Top {self.max_unique_words} unique words extracted"
-"""
-        elif self.processing_type == "generate_report":
-            return f"""
+echo "{input_text}" | tr ' ' '\\n' | tr '[:upper:]' '[:lower:]' | sort | uniq | head -{max_unique_words}
+echo "✅ Top {max_unique_words} unique words extracted"
+"""),
+    "generate_report": _compile_template("""
 echo "📋 TEXT PROCESSING REPORT"
 echo "======================="
-echo "Original text: {self.input_text[:50]}..."
-echo "Total characters: $(echo -n "{self.input_text}" | wc -c)"
-echo "Total words: $(echo "{self.input_text}" | wc -w)"
+text="{input_text}"
+echo "Original text: {input_text_preview}..."
+echo "Total characters: $(printf %s "$text" | wc -c)"
+echo "Total words: $(printf '%s\\n' "$text" | wc -w)"
 echo "Report generated at: $(date)"
 echo "✅ Text processing completed"
-"""
-        else:
-            return f'echo "❌ Unknown processing type: {self.processing_type}"'
+"""),
+}
+
+
+class TextProcessingCommand(CommandModel):
+    """Command model for text processing and analysis operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    input_text: str
+    processing_type: str  # "prepare", "count_chars", "extract_words", "generate_report"
+    output_file: str = "/tmp/text_input.txt"
+    max_unique_words: int = 10
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _TEXT_PROCESSING_COMMANDS.get(self.processing_type)
+        if render is None:
+            return _render_unknown_type(kind="processing", value=self.processing_type)
+        return render(
+            input_text=self.input_text,
+            output_file=self.output_file,
+            max_unique_words=str(self.max_unique_words),
+            input_text_preview=self.input_text[:50],
+        )
 ### END: TextProcessingCommand ###
 
 
@@ -4313,16 +5149,9 @@ Features:
 - System health reporting
 Use Case: Workflow steps that need to monitor system status and analyze logs
 """
-class SystemMonitoringCommand(CommandModel):
-    """Command model for system monitoring and log analysis operations."""
-    
-    monitoring_type: str  # "system_info", "log_analysis", "create_report"
-    log_data: str = ""
-    output_format: str = "text"  # "text", "json"
-    
-    def get_command(self) -> str:
-        if self.monitoring_type == "system_info":
-            return f"""
+# Monitoring scripts per monitoring_type, compiled once
+_SYSTEM_MONITORING_COMMANDS = {
+    "system_info": _compile_template("""
 echo "💻 COLLECTING SYSTEM INFORMATION"
 echo "================================"
 echo "Hostname: $(hostname)"
@@ -4332,25 +5161,23 @@ echo "Memory Usage: $(free -h | grep '^Mem:' | awk '{{print $3 "/" $2}}' || echo
 echo "Disk Usage: $(df -h / | tail -1 | awk '{{print $5}}' || echo "N/A")"
 echo "Load Average: $(cat /proc/loadavg 2>/dev/null | cut -d' ' -f1-3 || echo "N/A")"
 echo "✅ System information collected"
-"""
-        elif self.monitoring_type == "log_analysis":
-            return f"""
+"""),
+    "log_analysis": _compile_template("""
 echo "📊 ANALYZING LOG DATA"
 echo "===================="
+log_data="{log_data}"
 echo "Log data preview:"
-echo "{self.log_data}"
+echo "$log_data"
 echo ""
 echo "Log analysis:"
-error_count=$(echo "{self.log_data}" | grep -c "ERROR" || echo "0")
-info_count=$(echo "{self.log_data}" | grep -c "INFO" || echo "0")
-warn_count=$(echo "{self.log_data}" | grep -c "WARN" || echo "0")
+# One awk pass counts the matching lines for all three levels
+read -r error_count info_count warn_count <<< "$(printf '%s\\n' "$log_data" | awk '/ERROR/ {{e++}} /INFO/ {{i++}} /WARN/ {{w++}} END {{print e+0, i+0, w+0}}')"
 echo "ERROR entries: $error_count"
 echo "INFO entries: $info_count"
 echo "WARN entries: $warn_count"
 echo "✅ Log analysis completed"
-"""
-        elif self.monitoring_type == "create_report":
-            return f"""
+"""),
+    "create_report": _compile_template("""
 echo "📋 SYSTEM MONITORING REPORT"
 echo "============================"
 echo "Generated at: $(date)"
@@ -4362,9 +5189,26 @@ echo "- System load monitored"
 echo "- Log data analyzed"
 echo "- Performance metrics collected"
 echo "✅ Monitoring report generated"
-"""
-        else:
-            return f'echo "❌ Unknown monitoring type: {self.monitoring_type}"'
+"""),
+}
+
+
+class SystemMonitoringCommand(CommandModel):
+    """Command model for system monitoring and log analysis operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    monitoring_type: str  # "system_info", "log_analysis", "create_report"
+    log_data: str = ""
+    output_format: str = "text"  # "text", "json"
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _SYSTEM_MONITORING_COMMANDS.get(self.monitoring_type)
+        if render is None:
+            return _render_unknown_type(kind="monitoring", value=self.monitoring_type)
+        return render(
+            log_data=self.log_data,
+        )
 ### END: SystemMonitoringCommand ###
 
 
@@ -4380,61 +5224,65 @@ Features:
 - Security analysis and validation
 Use Case: Workflow steps that need security-related operations
 """
-class SecurityToolkitCommand(CommandModel):
-    """Command model for security toolkit operations."""
-    
-    operation_type: str  # "generate_password", "hash_data", "encode_base64", "decode_base64"
-    password_length: int = 16
-    hash_algorithm: str = "sha256"  # "md5", "sha256", "sha512"
-    input_data: str = ""
-    
-    def get_command(self) -> str:
-        if self.operation_type == "generate_password":
-            return f"""
+# Coreutils digest per hash_algorithm; anything else falls back to sha256sum
+_HASH_COMMANDS = {"md5": "md5sum", "sha256": "sha256sum", "sha512": "sha512sum"}
+
+# Security toolkit scripts per operation_type, compiled once
+_SECURITY_TOOLKIT_COMMANDS = {
+    "generate_password": _compile_template("""
 echo "🔐 GENERATING SECURE PASSWORD"
-password=$(openssl rand -base64 {self.password_length} | tr -d "=+/" | cut -c1-{self.password_length})
-echo "Generated password (length {self.password_length}): $password"
+password=$(openssl rand -base64 {password_length} | tr -d "=+/" | cut -c1-{password_length})
+echo "Generated password (length {password_length}): $password"
 echo "PASSWORD=$password"
 echo "✅ Secure password generated"
-"""
-        elif self.operation_type == "hash_data":
-            if self.hash_algorithm == "md5":
-                hash_cmd = "md5sum"
-            elif self.hash_algorithm == "sha256":
-                hash_cmd = "sha256sum"
-            elif self.hash_algorithm == "sha512":
-                hash_cmd = "sha512sum"
-            else:
-                hash_cmd = "sha256sum"
-                
-            return f"""
-echo "🔒 GENERATING {self.hash_algorithm.upper()} HASH"
-echo "Input: {self.input_data}"
-hash_value=$(echo -n "{self.input_data}" | {hash_cmd} | cut -d' ' -f1)
-echo "{self.hash_algorithm.upper()} Hash: $hash_value"
+"""),
+    "hash_data": _compile_template("""
+echo "🔒 GENERATING {algorithm} HASH"
+echo "Input: {input_data}"
+hash_value=$(echo -n "{input_data}" | {hash_cmd} | cut -d' ' -f1)
+echo "{algorithm} Hash: $hash_value"
 echo "HASH_VALUE=$hash_value"
 echo "✅ Hash generated successfully"
-"""
-        elif self.operation_type == "encode_base64":
-            return f"""
+"""),
+    "encode_base64": _compile_template("""
 echo "📝 ENCODING TO BASE64"
-echo "Input: {self.input_data}"
-encoded=$(echo -n "{self.input_data}" | base64)
+echo "Input: {input_data}"
+encoded=$(echo -n "{input_data}" | base64)
 echo "Base64 Encoded: $encoded"
 echo "ENCODED_VALUE=$encoded"
 echo "✅ Base64 encoding completed"
-"""
-        elif self.operation_type == "decode_base64":
-            return f"""
+"""),
+    "decode_base64": _compile_template("""
 echo "📖 DECODING FROM BASE64"
-echo "Input: {self.input_data}"
-decoded=$(echo "{self.input_data}" | base64 -d 2>/dev/null || echo "Invalid base64")
+echo "Input: {input_data}"
+decoded=$(echo "{input_data}" | base64 -d 2>/dev/null || echo "Invalid base64")
 echo "Decoded: $decoded"
 echo "DECODED_VALUE=$decoded"
 echo "✅ Base64 decoding completed"
-"""
-        else:
-            return f'echo "❌ Unknown operation type: {self.operation_type}"'
+"""),
+}
+
+
+class SecurityToolkitCommand(CommandModel):
+    """Command model for security toolkit operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    operation_type: str  # "generate_password", "hash_data", "encode_base64", "decode_base64"
+    password_length: int = 16
+    hash_algorithm: str = "sha256"  # "md5", "sha256", "sha512"
+    input_data: str = ""
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _SECURITY_TOOLKIT_COMMANDS.get(self.operation_type)
+        if render is None:
+            return _render_unknown_type(kind="operation", value=self.operation_type)
+        return render(
+            password_length=str(self.password_length),
+            algorithm=self.hash_algorithm.upper(),
+            input_data=self.input_data,
+            hash_cmd=_HASH_COMMANDS.get(self.hash_algorithm, "sha256sum"),
+        )
 ### END: SecurityToolkitCommand ###
 
 
@@ -4450,18 +5298,11 @@ Features:
 - Format validation and error handling
 Use Case: Workflow steps that need to convert data between different formats
 """
-class DataConversionCommand(CommandModel):
-    """Command model for data conversion operations."""
-    
-    conversion_type: str  # "hex_to_rgb", "rgb_to_hex", "timestamp_to_date", "date_to_timestamp"
-    input_value: str
-    output_format: str = "standard"
-    
-    def get_command(self) -> str:
-        if self.conversion_type == "hex_to_rgb":
-            return f"""
+# Conversion scripts per conversion_type, compiled once
+_DATA_CONVERSION_COMMANDS = {
+    "hex_to_rgb": _compile_template("""
 echo "🎨 CONVERTING HEX TO RGB"
-hex_value="{self.input_value}"
+hex_value="{input_value}"
 hex_clean=$(echo "$hex_value" | sed 's/#//')
 r=$((16#${{hex_clean:0:2}}))
 g=$((16#${{hex_clean:2:2}}))
@@ -4470,11 +5311,10 @@ echo "HEX: $hex_value"
 echo "RGB: rgb($r, $g, $b)"
 echo "RGB_VALUE=rgb($r, $g, $b)"
 echo "✅ HEX to RGB conversion completed"
-"""
-        elif self.conversion_type == "rgb_to_hex":
-            return f"""
+"""),
+    "rgb_to_hex": _compile_template("""
 echo "🎨 CONVERTING RGB TO HEX"
-rgb_value="{self.input_value}"
+rgb_value="{input_value}"
 r=$(echo "$rgb_value" | cut -d',' -f1 | tr -d ' ')
 g=$(echo "$rgb_value" | cut -d',' -f2 | tr -d ' ')
 b=$(echo "$rgb_value" | cut -d',' -f3 | tr -d ' ')
@@ -4486,11 +5326,10 @@ echo "RGB: $rgb_value"
 echo "HEX: $hex_value"
 echo "HEX_VALUE=$hex_value"
 echo "✅ RGB to HEX conversion completed"
-"""
-        elif self.conversion_type == "timestamp_to_date":
-            return f"""
+"""),
+    "timestamp_to_date": _compile_template("""
 echo "📅 CONVERTING TIMESTAMP TO DATE"
-timestamp="{self.input_value}"
+timestamp="{input_value}"
 if [ -z "$timestamp" ]; then
     timestamp=$(date +%s)
     echo "Using current timestamp: $timestamp"
@@ -4500,11 +5339,10 @@ echo "Timestamp: $timestamp"
 echo "Date: $date_value"
 echo "DATE_VALUE=$date_value"
 echo "✅ Timestamp to date conversion completed"
-"""
-        elif self.conversion_type == "date_to_timestamp":
-            return f"""
+"""),
+    "date_to_timestamp": _compile_template("""
 echo "📅 CONVERTING DATE TO TIMESTAMP"
-date_input="{self.input_value}"
+date_input="{input_value}"
 if [ -z "$date_input" ]; then
     date_input=$(date)
     echo "Using current date: $date_input"
@@ -4514,9 +5352,64 @@ echo "Date: $date_input"
 echo "Timestamp: $timestamp"
 echo "TIMESTAMP_VALUE=$timestamp"
 echo "✅ Date to timestamp conversion completed"
-"""
-        else:
-            return f'echo "❌ Unknown conversion type: {self.conversion_type}"'
+"""),
+}
+
+
+_HEX_COLOR_RE = re.compile(r"#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})")
+_RGB_COLOR_RE = re.compile(r"\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*")
+
+# Colour conversions of literal input values, folded to their result at render time
+_render_hex_to_rgb_result = _compile_template("""
+echo "🎨 CONVERTING HEX TO RGB"
+echo "HEX: {input_value}"
+echo "RGB: {rgb}"
+echo "RGB_VALUE={rgb}"
+echo "✅ HEX to RGB conversion completed"
+""")
+_render_rgb_to_hex_result = _compile_template("""
+echo "🎨 CONVERTING RGB TO HEX"
+echo "RGB: {input_value}"
+echo "HEX: {hex_value}"
+echo "HEX_VALUE={hex_value}"
+echo "✅ RGB to HEX conversion completed"
+""")
+
+
+def _folded_conversion(conversion_type: str, value: str) -> Optional[str]:
+    """Script for a colour conversion whose input is a literal, or None to convert in the shell."""
+    if conversion_type == "hex_to_rgb":
+        match = _HEX_COLOR_RE.fullmatch(value)
+        if match:
+            r, g, b = (int(part, 16) for part in match.groups())
+            return _render_hex_to_rgb_result(input_value=value, rgb=f"rgb({r}, {g}, {b})")
+    elif conversion_type == "rgb_to_hex":
+        match = _RGB_COLOR_RE.fullmatch(value)
+        if match:
+            r, g, b = (int(part) for part in match.groups())
+            return _render_rgb_to_hex_result(input_value=value, hex_value=f"#{r:02x}{g:02x}{b:02x}")
+    return None
+
+
+class DataConversionCommand(CommandModel):
+    """Command model for data conversion operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    conversion_type: str  # "hex_to_rgb", "rgb_to_hex", "timestamp_to_date", "date_to_timestamp"
+    input_value: str
+    output_format: str = "standard"
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _DATA_CONVERSION_COMMANDS.get(self.conversion_type)
+        if render is None:
+            return _render_unknown_type(kind="conversion", value=self.conversion_type)
+        folded = _folded_conversion(self.conversion_type, self.input_value)
+        if folded is not None:
+            return folded
+        return render(
+            input_value=self.input_value,
+        )
 ### END: DataConversionCommand ###
 
 
@@ -4532,26 +5425,30 @@ Features:
 - Security vulnerability assessment
 Use Case: Workflow steps that need to perform network security audits
 """
-class NetworkSecurityCommand(CommandModel):
-    """Command model for network security operations."""
-    
-    operation_type: str  # "port_scan", "ssl_check", "connectivity_test", "security_audit"
-    target_domain: str
-    target_ports: str = "80,443,22,21"
-    timeout_seconds: int = 10
-    
-    def get_command(self) -> str:
-        if self.operation_type == "port_scan":
-            return f"""
-echo "🔍 SCANNING PORTS ON {self.target_domain}"
-echo "Target ports: {self.target_ports}"
-echo "Timeout: {self.timeout_seconds}s"
-echo ""
+# Literal comma-separated port lists, expanded in Python
+_PORT_LIST_RE = re.compile(r"\s*\d+(?:\s*,\s*\d+)*\s*")
 
-IFS=',' read -ra PORTS <<< "{self.target_ports}"
+# Starts one background nc probe per port; the scan loops then wait on PIDS in port order,
+# so the whole scan takes one timeout rather than one per port
+_render_port_probes = _compile_template("""{ports_init}
+PIDS=()
 for port in "${{PORTS[@]}}"; do
-    echo -n "Port $port: "
-    if timeout {self.timeout_seconds} nc -z {self.target_domain} $port 2>/dev/null; then
+    timeout {timeout_seconds} nc -z {target_domain} $port 2>/dev/null &
+    PIDS+=($!)
+done""")
+
+# Network security scripts per operation_type, compiled once
+_NETWORK_SECURITY_COMMANDS = {
+    "port_scan": _compile_template("""
+echo "🔍 SCANNING PORTS ON {target_domain}"
+echo "Target ports: {target_ports}"
+echo "Timeout: {timeout_seconds}s"
+echo ""
+
+{port_probes}
+for i in "${{!PORTS[@]}}"; do
+    echo -n "Port ${{PORTS[$i]}}: "
+    if wait "${{PIDS[$i]}}"; then
         echo "OPEN"
     else
         echo "CLOSED"
@@ -4559,13 +5456,12 @@ for port in "${{PORTS[@]}}"; do
 done
 
 echo "✅ Port scan completed"
-"""
-        elif self.operation_type == "ssl_check":
-            return f"""
-echo "🔒 CHECKING SSL CERTIFICATE FOR {self.target_domain}"
+"""),
+    "ssl_check": _compile_template("""
+echo "🔒 CHECKING SSL CERTIFICATE FOR {target_domain}"
 echo ""
 
-cert_info=$(echo | openssl s_client -servername {self.target_domain} -connect {self.target_domain}:443 2>/dev/null | openssl x509 -noout -dates -subject 2>/dev/null)
+cert_info=$(echo | openssl s_client -servername {target_domain} -connect {target_domain}:443 2>/dev/null | openssl x509 -noout -dates -subject 2>/dev/null)
 
 if [ $? -eq 0 ]; then
     echo "SSL Certificate Information:"
@@ -4576,15 +5472,14 @@ else
 fi
 
 echo "✅ SSL check completed"
-"""
-        elif self.operation_type == "connectivity_test":
-            return f"""
-echo "🌐 TESTING CONNECTIVITY TO {self.target_domain}"
+"""),
+    "connectivity_test": _compile_template("""
+echo "🌐 TESTING CONNECTIVITY TO {target_domain}"
 echo ""
 
 # Ping test
 echo "Ping test:"
-if ping -c 3 -W {self.timeout_seconds} {self.target_domain} >/dev/null 2>&1; then
+if ping -c 3 -W {timeout_seconds} {target_domain} >/dev/null 2>&1; then
     echo "✅ Ping successful"
 else
     echo "❌ Ping failed"
@@ -4592,29 +5487,28 @@ fi
 
 # HTTP test
 echo "HTTP connectivity test:"
-if curl --max-time {self.timeout_seconds} -o /dev/null -s -w "Response: %{{http_code}}\\n" "http://{self.target_domain}"; then
+if curl --max-time {timeout_seconds} -o /dev/null -s -w "Response: %{{http_code}}\\n" "http://{target_domain}"; then
     echo "✅ HTTP connectivity successful"
 else
     echo "❌ HTTP connectivity failed"
 fi
 
 echo "✅ Connectivity test completed"
-"""
-        elif self.operation_type == "security_audit":
-            return f"""
-echo "🛡️ NETWORK SECURITY AUDIT FOR {self.target_domain}"
+"""),
+    "security_audit": _compile_template("""
+echo "🛡️ NETWORK SECURITY AUDIT FOR {target_domain}"
 echo "=============================================="
 echo ""
 
 echo "1. Port Scan Results:"
-IFS=',' read -ra PORTS <<< "{self.target_ports}"
+{port_probes}
 open_ports=0
-for port in "${{PORTS[@]}}"; do
-    if timeout {self.timeout_seconds} nc -z {self.target_domain} $port 2>/dev/null; then
-        echo "   Port $port: OPEN ⚠️"
+for i in "${{!PORTS[@]}}"; do
+    if wait "${{PIDS[$i]}}"; then
+        echo "   Port ${{PORTS[$i]}}: OPEN ⚠️"
         open_ports=$((open_ports + 1))
     else
-        echo "   Port $port: CLOSED ✅"
+        echo "   Port ${{PORTS[$i]}}: CLOSED ✅"
     fi
 done
 
@@ -4628,7 +5522,41 @@ else
 fi
 
 echo "✅ Security audit completed"
-"""
+"""),
+}
+
+
+class NetworkSecurityCommand(CommandModel):
+    """Command model for network security operations."""
+    model_config = ConfigDict(frozen=True)
+    
+    operation_type: str  # "port_scan", "ssl_check", "connectivity_test", "security_audit"
+    target_domain: str
+    target_ports: str = "80,443,22,21"
+    timeout_seconds: int = 10
+    
+    @shared_render
+    def get_command(self) -> str:
+        render = _NETWORK_SECURITY_COMMANDS.get(self.operation_type)
+        if render is None:
+            return _render_unknown_type(kind="operation", value=self.operation_type)
+        return render(
+            target_domain=self.target_domain,
+            target_ports=self.target_ports,
+            timeout_seconds=str(self.timeout_seconds),
+            port_probes=self._port_probes(),
+        )
+
+    @cached_render
+    def _port_probes(self) -> str:
+        if _PORT_LIST_RE.fullmatch(self.target_ports):
+            # Literal port list: expand it here instead of splitting it in the shell
+            ports_init = f"PORTS=({' '.join(port.strip() for port in self.target_ports.split(','))})"
         else:
-            return f'echo "❌ Unknown operation type: {self.operation_type}"'
+            ports_init = f"IFS=',' read -ra PORTS <<< \"{self.target_ports}\""
+        return _render_port_probes(
+            ports_init=ports_init,
+            timeout_seconds=str(self.timeout_seconds),
+            target_domain=self.target_domain,
+        )
 ### END: NetworkSecurityCommand ###
@@ -0,0 +1,58 @@
+import subprocess
+
+from models.models import CommandModel, MergedCommand
+
+
+class ScriptCommand(CommandModel):
+    script: str
+
+    def get_command(self) -> str:
+        return self.script
+
+
+def run(command: CommandModel) -> subprocess.CompletedProcess:
+    return subprocess.run(["bash", "-c", command.get_command()], capture_output=True, text=True)
+
+
+def test_scripts_run_in_order():
+    result = run(ScriptCommand(script="echo one").merge(ScriptCommand(script="echo two")))
+    assert result.returncode == 0
+    assert result.stdout == "one\ntwo\n"
+
+
+def test_failing_script_stops_the_rest():
+    result = run(CommandModel.batch([
+        ScriptCommand(script="echo one"),
+        ScriptCommand(script="exit 3"),
+        ScriptCommand(script="echo three"),
+    ]))
+    assert result.returncode == 3
+    assert result.stdout == "one\n"
+
+
+def test_exit_zero_only_ends_its_own_script():
+    result = run(ScriptCommand(script="echo one; exit 0; echo skipped").merge(ScriptCommand(script="echo two")))
+    assert result.returncode == 0
+    assert result.stdout == "one\ntwo\n"
+
+
+def test_shell_state_does_not_leak_between_scripts():
+    first = ScriptCommand(script="set -e; trap 'echo trapped' EXIT; cd /; NAME=first")
+    second = ScriptCommand(script='echo "name=${NAME:-unset}"; false || echo "errexit off"; pwd')
+    result = subprocess.run(["bash", "-c", first.merge(second).get_command()], capture_output=True, text=True, cwd="/tmp")
+    assert result.returncode == 0
+    assert result.stdout == "trapped\nname=unset\nerrexit off\n/tmp\n"
+
+
+def test_heredoc_scripts_keep_their_terminator():
+    heredoc = ScriptCommand(script="cat <<'EOF'\nbody\nEOF")
+    result = run(heredoc.merge(ScriptCommand(script="echo after")))
+    assert result.returncode == 0
+    assert result.stdout == "body\nafter\n"
+
+
+def test_batch_flattens_merged_commands():
+    merged = ScriptCommand(script="echo one").merge(ScriptCommand(script="echo two"))
+    batched = CommandModel.batch([merged, ScriptCommand(script="echo three")])
+    assert isinstance(batched, MergedCommand)
+    assert batched.scripts == ("echo one", "echo two", "echo three")
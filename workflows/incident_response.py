@@ -18,8 +18,7 @@ def generate_incident_response_workflow() -> 'Workflow':
         InvestigateEUClusterHealth,
         IncidentReport,
         ExecutiveSummary,
-        CleanNAInvestigation,
-        CleanEUInvestigation,
+        CleanRegionalInvestigation,
         FormatSlackReports,
         InvestigationResults,
     )
@@ -320,8 +319,9 @@ def generate_incident_response_workflow() -> 'Workflow':
             s.description("Clean NA cluster investigation output for LLM processing")
                 .agent(
                     name="p44-na-prod-incident-workflow",
-                    message=CleanNAInvestigation(
-                        na_cluster_results="{{.na_cluster_results}}",
+                    message=CleanRegionalInvestigation(
+                        region="NA",
+                        cluster_results="{{.na_cluster_results}}",
                     ).get_command(),
                 )
                 .timeout(900)
@@ -356,8 +356,9 @@ def generate_incident_response_workflow() -> 'Workflow':
             s.description("Clean EU cluster investigation output for LLM processing")
                 .agent(
                     name="p44-eu-prod-incident-workflow",
-                    message=CleanEUInvestigation(
-                        eu_cluster_results="{{.eu_cluster_results}}",
+                    message=CleanRegionalInvestigation(
+                        region="EU",
+                        cluster_results="{{.eu_cluster_results}}",
                     ).get_command(),
                 )
                 .timeout(900)
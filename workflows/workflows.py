@@ -1297,7 +1297,7 @@ def performance_testing_workflow():
             PerformanceTestCommand(
                 test_type="stress",
                 target_url="${target_url}",
-                concurrent_users="$(echo \"${concurrent_users} * 2\" | bc)",
+                concurrent_users="$((${concurrent_users} * 2))",
                 test_duration_minutes="${test_duration}"
             ).get_command()
         )